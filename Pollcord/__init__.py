@@ -1,7 +1,3 @@
-from Pollcord.client import PollClient
-from Pollcord.poll import Poll
-from Pollcord.error import PollCreationError, PollNotFoundError, PollcordError
-import importlib.metadata
 import logging
 
 logger = logging.getLogger("pollcord")
@@ -13,5 +9,38 @@ __all__ = [
     "PollCreationError",
     "PollNotFoundError",
     "PollcordError",
+    "CircuitOpenError",
 ]
-__version__ = importlib.metadata.version("Pollcord")
+
+# Public names are imported on first access, so ``import Pollcord`` doesn't pull in
+# aiohttp (or asyncio) until the client is actually used.
+_LAZY = {
+    "PollClient": "Pollcord.client",
+    "Poll": "Pollcord.poll",
+    "PollCreationError": "Pollcord.error",
+    "PollNotFoundError": "Pollcord.error",
+    "PollcordError": "Pollcord.error",
+    "CircuitOpenError": "Pollcord.error",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    elif name == "__version__":
+        import importlib.metadata
+
+        try:
+            value = importlib.metadata.version("Pollcord")
+        except importlib.metadata.PackageNotFoundError:
+            value = "0+unknown"  # running from a source checkout
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, "__version__"})
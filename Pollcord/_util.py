@@ -0,0 +1,72 @@
+from __future__ import annotations
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Tokens refill continuously at ``rate`` per second, up to ``capacity``.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def __repr__(self):
+        return f"<TokenBucket {self.tokens:.1f}/{self.capacity} rate={self.rate}/s>"
+
+    @property
+    def tokens(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        return self._tokens
+
+    def take(self) -> bool:
+        """
+        Returns:
+            - True if a token was taken, False if the bucket is empty.
+        """
+        if self.tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def delay(self) -> float:
+        """Seconds until a token is available."""
+        missing = 1 - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else float("inf")
+
+    async def acquire(self):
+        """Waits for a token and takes it."""
+        while not self.take():
+            await asyncio.sleep(self.delay())
+
+
+async def gather_limited(factories, limit: int):
+    """
+    Runs coroutine factories concurrently, at most ``limit`` at a time.
+
+    Results are returned in order. If any of them raises, the others are
+    cancelled and awaited before the exception is propagated.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(factory):
+        async with semaphore:
+            return await factory()
+
+    tasks = [asyncio.ensure_future(run(factory)) for factory in factories]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from Pollcord import Poll, PollClient
+
+logger = logging.getLogger("pollcord")
+
+
+class PollSpec(NamedTuple):
+    """The arguments of one ``create_poll`` call in ``PollClient.create_polls``."""
+
+    channel_id: Any
+    question: str
+    options: List[str]
+    duration: int = 1
+    isMultiselect: bool = False
+    callback: Optional[Callable] = None
+    callback_key: Optional[str] = None
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one item of a bulk operation.
+
+    ``index`` is the item's position in the input, ``item`` the spec or poll that was
+    passed in. Exactly one of ``poll`` and ``error`` is set.
+    """
+
+    index: int
+    item: Any
+    poll: Optional[Poll]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _pipeline(
+    items: Iterable[Tuple[Hashable, Any]],
+    operation: Callable[[Any], Awaitable[Poll]],
+    concurrency: int,
+) -> AsyncIterator[BulkResult]:
+    """
+    Runs ``operation`` over ``(channel_id, item)`` pairs with at most ``concurrency``
+    workers and yields a BulkResult per item as soon as it completes.
+
+    Items of the same channel share a rate limit bucket, so they run one at a time
+    and in input order; workers take turns between channels so one busy channel
+    doesn't hold up the rest.
+    """
+    lanes: Dict[Hashable, Deque[Tuple[int, Any]]] = OrderedDict()
+    total = 0
+    for index, (channel_id, item) in enumerate(items):
+        lanes.setdefault(channel_id, deque()).append((index, item))
+        total += 1
+    if not total:
+        return
+
+    ready: Deque[Hashable] = deque(lanes)
+    results: asyncio.Queue = asyncio.Queue()
+    wakeup = asyncio.Event()
+
+    async def worker():
+        while True:
+            while not ready:
+                if not any(lanes.values()):
+                    return
+                wakeup.clear()
+                await wakeup.wait()
+            channel_id = ready.popleft()
+            lane = lanes[channel_id]
+            index, item = lane.popleft()
+            try:
+                result = BulkResult(index, item, await operation(item), None)
+            except Exception as e:
+                logger.error(f"Bulk item {index} failed: {e!r}")
+                result = BulkResult(index, item, None, e)
+            if lane:
+                ready.append(channel_id)
+            wakeup.set()
+            results.put_nowait(result)
+
+    workers = [
+        asyncio.ensure_future(worker())
+        for _ in range(max(1, min(concurrency, len(lanes))))
+    ]
+    try:
+        for _ in range(total):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def create_polls(
+    client: PollClient,
+    specs: Iterable[Union[PollSpec, Mapping[str, Any]]],
+    concurrency: Optional[int] = None,
+    max_retries: int = 5,
+) -> AsyncIterator[BulkResult]:
+    """See ``PollClient.create_polls``."""
+
+    async def create(spec: Union[PollSpec, Mapping[str, Any]]) -> Poll:
+        # Converted per item, so a malformed spec only fails its own result
+        if not isinstance(spec, PollSpec):
+            spec = PollSpec(**spec)
+        return await client.create_poll(
+            spec.channel_id,
+            spec.question,
+            spec.options,
+            duration=spec.duration,
+            isMultiselect=spec.isMultiselect,
+            callback=spec.callback,
+            max_retries=max_retries,
+            callback_key=spec.callback_key,
+        )
+
+    return _pipeline(
+        ((_spec_channel(spec), spec) for spec in specs),
+        create,
+        concurrency or client.max_concurrency,
+    )
+
+
+def _spec_channel(spec: Union[PollSpec, Mapping[str, Any]]) -> Any:
+    if isinstance(spec, Mapping):
+        return spec.get("channel_id")
+    return spec.channel_id
+
+
+def end_polls(
+    client: PollClient,
+    polls: Iterable[Poll],
+    concurrency: Optional[int] = None,
+    max_retries: int = 5,
+) -> AsyncIterator[BulkResult]:
+    """See ``PollClient.end_polls``."""
+
+    async def end(poll: Poll) -> Poll:
+        await client.end_poll(poll, max_retries=max_retries)
+        return poll
+
+    return _pipeline(
+        ((poll.channel_id, poll) for poll in polls),
+        end,
+        concurrency or client.max_concurrency,
+    )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResultCache:
+    """
+    Per-poll cache of vote reads with a TTL and bounded LRU eviction.
+
+    Entries are grouped by poll message id so that everything cached for a poll
+    can be dropped at once (e.g. when it is ended). Once ``maxsize`` polls are
+    cached, the least recently used poll is evicted.
+
+    A read that was in flight while its poll was invalidated must not cache its
+    (stale) result: take ``generation`` before fetching and pass it to ``set``.
+    """
+
+    MISSING = object()
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """
+        Parameters:
+            - ttl (float): Seconds a cached result stays valid.
+            - maxsize (int): Maximum number of polls with cached results.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._polls: "OrderedDict[Any, Dict[Hashable, Tuple[float, Any]]]" = (
+            OrderedDict()
+        )
+        self._generation = 0  # bumped by every invalidation
+        # Generation at which each recently invalidated poll was invalidated
+        self._invalidated: "OrderedDict[Any, int]" = OrderedDict()
+        self._forgotten = 0  # newest generation dropped from _invalidated
+
+    def __repr__(self):
+        return f"<ResultCache polls={len(self)}/{self.maxsize} ttl={self.ttl}s>"
+
+    def __len__(self):
+        return len(self._polls)
+
+    def get(self, message_id, key: Hashable):
+        """
+        Returns:
+            - The cached value, or ``ResultCache.MISSING`` if there is none or it expired.
+        """
+        entries = self._polls.get(message_id)
+        if entries is None:
+            return self.MISSING
+        entry = entries.get(key)
+        if entry is None:
+            return self.MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del entries[key]
+            if not entries:
+                del self._polls[message_id]
+            return self.MISSING
+        self._polls.move_to_end(message_id)
+        return value
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, message_id, key: Hashable, value, generation: Optional[int] = None):
+        """
+        Parameters:
+            - generation (Optional[int]): ``generation`` from before the value was
+              fetched. If the poll was invalidated since, the value isn't stored.
+        """
+        if generation is not None and self.__invalidated_since(message_id, generation):
+            return
+        entries = self._polls.get(message_id)
+        if entries is None:
+            entries = self._polls[message_id] = {}
+        else:
+            self._polls.move_to_end(message_id)
+        entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._polls) > self.maxsize:
+            self._polls.popitem(last=False)
+
+    def invalidate(self, message_id):
+        """Drops every cached result of a poll."""
+        self._polls.pop(message_id, None)
+        self._generation += 1
+        self._invalidated[message_id] = self._generation
+        self._invalidated.move_to_end(message_id)
+        while len(self._invalidated) > self.maxsize:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def clear(self):
+        self._polls.clear()
+        self._generation += 1
+        self._invalidated.clear()
+        self._forgotten = self._generation
+
+    def __invalidated_since(self, message_id, generation: int) -> bool:
+        if generation < self._forgotten:
+            return True  # can't tell anymore, don't risk it
+        return self._invalidated.get(message_id, 0) > generation
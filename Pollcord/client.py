@@ -1,25 +1,130 @@
 import aiohttp
-from typing import List
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional
 from Pollcord.poll import Poll
+from Pollcord._util import gather_limited
+from Pollcord import bulk
 from Pollcord.error import PollCreationError, PollNotFoundError, PollcordError
+from Pollcord.cache import ResultCache
+from Pollcord.codec import JSONCodec, UserIdScanner, get_codec
+from Pollcord.dispatcher import CallbackDispatcher
+from Pollcord.metrics import MetricsHook
+from Pollcord.priority import RequestScheduler
+from Pollcord.ratelimit import RateLimiter
+from Pollcord.registry import PollRegistry
+from Pollcord.retry import RetryPolicy
+from Pollcord.scheduler import ExpiryScheduler
+from Pollcord.store import SQLitePollStore
 import logging
 import asyncio
+import functools
+import time
+from array import array
 
 
 class PollClient:
     logger = logging.getLogger("pollcord")
     BASE_URL = "https://discord.com/api/v10"
+    MAX_PAGE_SIZE = 100  # Discord's cap on voters returned per page
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_concurrency: int = 5,
+        scheduler: Optional[ExpiryScheduler] = None,
+        metrics: Optional[MetricsHook] = None,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        store: Optional[SQLitePollStore] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        base_url: Optional[str] = None,
+        codec: Optional[JSONCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        request_scheduler: Optional[RequestScheduler] = None,
+        callback_dispatcher: Optional[CallbackDispatcher] = None,
+        recent_polls: int = 0,
+    ):
         """
         Initializes the PollClient with a bot token for authorization.
+
+        Parameters:
+            - token (str): The bot token.
+            - rate_limiter (Optional[RateLimiter]): Rate limit state to use. Pass the same
+              limiter to several clients sharing a token so they respect the same buckets.
+            - max_concurrency (int): Default number of requests a single call may have
+              in flight when it fans out over a poll's options.
+            - scheduler (Optional[ExpiryScheduler]): Scheduler that ends the client's polls
+              once their duration runs out. Each client gets its own by default.
+            - metrics (Optional[MetricsHook]): Receives request latencies, 429s, retries,
+              rate limit waits and the scheduler backlog, e.g. an ``InMemoryMetrics``.
+            - cache_ttl (Optional[float]): Seconds to cache ``get_vote_counts`` and
+              ``get_vote_users`` results per poll. Caching is disabled if None.
+            - cache_size (int): Maximum number of polls kept in the result cache.
+            - store (Optional[SQLitePollStore]): Persists created polls until they end,
+              so they can be restored with ``rehydrate`` after a restart.
+            - session (Optional[aiohttp.ClientSession]): An existing session to send
+              requests through, e.g. one from ``PollClient.create_session`` shared by
+              several clients. The client never closes a session it was given.
+            - pool_size, pool_size_per_host, keepalive_timeout, dns_cache_ttl, timeout:
+              Connection pool settings for the session the client creates itself, see
+              ``PollClient.create_session``.
+            - base_url (Optional[str]): Overrides the Discord API base URL.
+            - codec (Optional[JSONCodec]): Encodes payloads and decodes responses.
+              Defaults to the fastest installed library, see ``get_codec``.
+            - retry_policy (Optional[RetryPolicy]): Backoff, retry budget and circuit
+              breakers for server and network errors. Pass the same policy to several
+              clients to share its budget and breakers.
+            - request_scheduler (Optional[RequestScheduler]): Admits requests by
+              priority (ending polls, then creating them, then reads) and round-robin
+              between channels. Pass the same scheduler to several clients to share
+              its capacity.
+            - callback_dispatcher (Optional[CallbackDispatcher]): Runs the ``on_end``
+              callbacks of the client's polls, sync ones in a thread pool. Each client
+              gets its own by default.
+            - recent_polls (int): Number of ended polls ``get_poll`` still finds.
         """
         self.token = token
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_concurrency = max_concurrency
+        self.metrics = metrics if metrics is not None else MetricsHook()
+        self._owns_scheduler = scheduler is None
+        if scheduler is None:
+            scheduler = ExpiryScheduler(metrics=self.metrics)
+        self.scheduler = scheduler
+        self.cache = ResultCache(cache_ttl, cache_size) if cache_ttl else None
+        self._inflight: Dict[tuple, asyncio.Future] = {}  # coalesced GET requests
+        self.store = store
+        self.codec = codec if codec is not None else get_codec()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        if request_scheduler is None:
+            request_scheduler = RequestScheduler()
+        self.request_scheduler = request_scheduler
+        self._owns_dispatcher = callback_dispatcher is None
+        if callback_dispatcher is None:
+            callback_dispatcher = CallbackDispatcher(metrics=self.metrics)
+        self.callback_dispatcher = callback_dispatcher
+        self.polls = PollRegistry(recent_polls)
         self.headers = {
             "Authorization": f"Bot {token}",
             "Content-Type": "application/json",
         }
-        self.session = None  # HTTP session will be created on entry
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
+        # HTTP session will be created on entry unless one is shared with us
+        self.session = session
+        self._owns_session = session is None
+        self._session_options = {
+            "pool_size": pool_size,
+            "pool_size_per_host": pool_size_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "dns_cache_ttl": dns_cache_ttl,
+            "timeout": timeout,
+        }
         self.logger.info("Initialized PollClient instance: \n" + str(self))
 
     def __repr__(self):
@@ -27,17 +132,51 @@ class PollClient:
 
     async def __aenter__(self):
         """
-        Initializes the aiohttp session with proper headers when entering async context.
+        Initializes the aiohttp session when entering async context, unless the
+        client was given a shared session.
         """
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        if self._owns_session and (self.session is None or self.session.closed):
+            self.session = self.create_session(**self._session_options)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         """
         Closes the aiohttp session when exiting async context.
         """
-        if self.session and not self.session.closed:
-            await self.session.close()
+        await self.close()
+
+    @staticmethod
+    def create_session(
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+    ) -> aiohttp.ClientSession:
+        """
+        Creates an aiohttp session with a tuned connection pool.
+
+        The session can be passed to any number of PollClients (``session=...``) so
+        they share connections, DNS lookups and TLS sessions. Whoever creates it is
+        responsible for closing it. Must be called inside a running event loop.
+
+        Parameters:
+            - pool_size (int): Maximum number of open connections (0 for no limit).
+            - pool_size_per_host (int): Maximum connections per host (0 for no limit).
+            - keepalive_timeout (float): Seconds an idle connection is kept for reuse.
+            - dns_cache_ttl (Optional[int]): Seconds DNS results are cached (None forever).
+            - timeout (Optional[aiohttp.ClientTimeout]): Request timeouts, aiohttp's
+              defaults if None.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=pool_size,
+            limit_per_host=pool_size_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+        )
+        if timeout is None:
+            return aiohttp.ClientSession(connector=connector)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
 
     async def create_poll(
         self,
@@ -48,6 +187,7 @@ class PollClient:
         isMultiselect: bool = False,
         callback=None,
         max_retries: int = 5,
+        callback_key: Optional[str] = None,
     ) -> Poll:
         """
         Creates a poll in a specified Discord channel.
@@ -59,6 +199,8 @@ class PollClient:
             - duration (int): How long the poll should last (in hours).
             - isMultiselect (bool): Whether users can vote for more than one option.
             - callback (Callable): Function to be called when poll ends.
+            - callback_key (Optional[str]): Name of the callback, saved with the poll in
+              the client's store so ``rehydrate`` can find it again after a restart.
 
         Returns:
             - A Poll object representing the created poll.
@@ -107,39 +249,306 @@ class PollClient:
             isMultiselect=isMultiselect,
             on_end=callback,
         )
+        poll._dispatcher = self.callback_dispatcher
         self.logger.debug(f"Poll object created: {poll}")
-        poll.start()  # Schedule auto-expiry
+        poll.start(self.scheduler)  # Schedule auto-expiry
+        self.polls.add(poll)
+        if self.cache is not None:
+            poll._add_end_listener(self.__invalidate)
+        if self.store is not None:
+            self.store.add(poll, callback_key)
+            poll._add_end_listener(self.__forget)
         return poll
 
-    async def get_vote_users(self, poll: Poll):
+    def get_poll(self, message_id) -> Optional[Poll]:
+        """
+        Looks up a poll created or rehydrated by this client.
+
+        Returns:
+            - The running poll with this message id, or a recently ended one if
+              ``recent_polls`` is set, else None.
+        """
+        return self.polls.get(message_id)
+
+    def polls_in_channel(self, channel_id) -> List[Poll]:
+        """
+        Returns:
+            - The running polls this client created in a channel.
+        """
+        return self.polls.in_channel(channel_id)
+
+    def create_polls(
+        self,
+        specs: Iterable[Any],
+        concurrency: Optional[int] = None,
+        max_retries: int = 5,
+    ) -> AsyncIterator[bulk.BulkResult]:
+        """
+        Creates many polls, yielding a BulkResult for each one as it completes.
+
+        Polls are created by at most ``concurrency`` workers (defaults to the client's
+        ``max_concurrency``). Polls in the same channel are created one after another
+        in the given order; other channels proceed in between. A failing poll doesn't
+        stop the others, its error is returned in its BulkResult.
+
+        Parameters:
+            - specs (Iterable[PollSpec | Mapping]): ``PollSpec``s, or mappings of
+              ``create_poll`` arguments.
+            - concurrency (Optional[int]): Maximum number of polls created at once.
+            - max_retries (int): Passed to every ``create_poll``.
+
+        Returns:
+            - An async iterator of BulkResult, in completion order.
+        """
+        return bulk.create_polls(self, specs, concurrency, max_retries)
+
+    def end_polls(
+        self,
+        polls: Iterable[Poll],
+        concurrency: Optional[int] = None,
+        max_retries: int = 5,
+    ) -> AsyncIterator[bulk.BulkResult]:
+        """
+        Ends many polls early, yielding a BulkResult for each one as it completes.
+        Scheduling and errors work like ``create_polls``.
+        """
+        return bulk.end_polls(self, polls, concurrency, max_retries)
+
+    async def rehydrate(
+        self, callbacks: Optional[Mapping[str, Callable]] = None
+    ) -> List[Poll]:
+        """
+        Restores the polls saved in the client's store, e.g. after a restart.
+
+        Polls that are still running are scheduled to end at their original end time.
+        Polls that expired in the meantime are ended right away, running their callback.
+
+        Parameters:
+            - callbacks (Optional[Mapping[str, Callable]]): Callbacks by the
+              ``callback_key`` they were saved with.
+
+        Returns:
+            - Every restored Poll, including the ones that were ended.
+        """
+        if self.store is None:
+            raise PollcordError("PollClient has no store to rehydrate from.")
+        callbacks = callbacks or {}
+
+        now = time.time()
+        polls = []
+        expired = []
+        for record in self.store.load():
+            if record.callback_key is not None and record.callback_key not in callbacks:
+                self.logger.warning(
+                    f"No callback named {record.callback_key!r} for poll {record.message_id}"
+                )
+            poll = Poll.restore(
+                channel_id=record.channel_id,
+                message_id=record.message_id,
+                prompt=record.prompt,
+                options=record.options,
+                start_ts=record.start_ts,
+                end_ts=record.end_ts,
+                duration=record.duration,
+                isMultiselect=record.isMultiselect,
+                on_end=callbacks.get(record.callback_key),
+            )
+            poll._dispatcher = self.callback_dispatcher
+            self.polls.add(poll)
+            if self.cache is not None:
+                poll._add_end_listener(self.__invalidate)
+            polls.append(poll)
+            if record.end_ts <= now:
+                expired.append(poll)
+            else:
+                poll.start(self.scheduler)
+                poll._add_end_listener(self.__forget)
+
+        self.logger.info(
+            f"Rehydrated {len(polls)} polls, {len(expired)} expired while offline"
+        )
+        if expired:
+            await asyncio.gather(*(poll.end() for poll in expired))
+            self.store.remove_many(poll.message_id for poll in expired)
+        return polls
+
+    def __forget(self, poll: Poll):
+        self.store.remove(poll.message_id)
+
+    async def get_vote_users(self, poll: Poll, concurrency: Optional[int] = None):
         """
         Fetches user IDs for each option in the poll.
 
-        Returns: 
+        Options are fetched concurrently, at most ``concurrency`` at a time
+        (defaults to the client's ``max_concurrency``). The first failing option
+        cancels the remaining requests and its error is raised.
+
+        Returns:
             - List of lists of user IDs per option.
         """
         self.logger.debug("Getting user votes")
-        results = []
-        for index in range(len(poll.options)):
-            users = await self.fetch_option_users(poll, index)
-            results.append([u for u in users])
-        return results
+        cached = self.__cached(poll, "users")
+        if cached is not ResultCache.MISSING:
+            return [list(users) for users in cached]
+        generation = self.__generation()
+
+        results = await self.__fetch_all_options(
+            poll, self.fetch_option_users, concurrency
+        )
+        self.__store(poll, "users", results, generation)
+        return [list(users) for users in results]
+
+    async def get_vote_user_ids(
+        self, poll: Poll, concurrency: Optional[int] = None
+    ) -> List[array]:
+        """
+        Like ``get_vote_users``, but only keeps the voters' ids.
 
-    async def get_vote_counts(self, poll: Poll):
+        The ids are scanned out of the response bodies as they arrive instead of
+        decoding every user object, which is much lighter for large polls.
+
+        Returns:
+            - List of ``array("Q")`` of user IDs per option.
+        """
+        self.logger.debug("Getting user ids of votes")
+        cached = self.__cached(poll, "user_ids")
+        if cached is not ResultCache.MISSING:
+            return [array("Q", ids) for ids in cached]
+        generation = self.__generation()
+
+        results = await self.__fetch_all_options(
+            poll, self.fetch_option_user_ids, concurrency
+        )
+        self.__store(poll, "user_ids", results, generation)
+        return [array("Q", ids) for ids in results]
+
+    async def export_voters(
+        self,
+        polls: Iterable[Poll],
+        destination,
+        format: str = "ndjson",
+        concurrency: Optional[int] = None,
+        block_size: int = 65536,
+    ) -> int:
+        """
+        Streams the voters of many polls to a file, one voter page at a time.
+
+        Parameters:
+            - polls (Iterable[Poll]): The polls to export. Consumed lazily, so it can
+              be a generator over any number of polls.
+            - destination (str | PathLike | binary file): Where to write.
+            - format (str): ``"ndjson"`` for one JSON object per vote, or
+              ``"columnar"`` for fixed-width (poll_id, option, user_id) columns
+              that ``Pollcord.export.VoterFile`` memory-maps.
+            - concurrency (Optional[int]): Options fetched at the same time, defaults
+              to the client's ``max_concurrency``.
+            - block_size (int): Votes per block of a columnar file.
+
+        Returns:
+            - The number of votes written.
+        """
+        from Pollcord.export import export_voters
+
+        return await export_voters(
+            self, polls, destination, format, concurrency, block_size
+        )
+
+    async def get_vote_counts(
+        self,
+        poll: Poll,
+        concurrency: Optional[int] = None,
+        from_results: bool = True,
+    ):
         """
         Fetches the number of votes per option in the poll.
 
+        By default the counts are read from the poll message's ``results`` in a
+        single request. If Discord doesn't include results, or ``from_results`` is
+        False, every option's voters are counted instead (concurrently, see
+        ``get_vote_users``).
+
         Returns:
             - List of integers, each representing vote count for that option.
         """
         self.logger.debug("Counting user votes")
+        key = ("counts", from_results)
+        cached = self.__cached(poll, key)
+        if cached is not ResultCache.MISSING:
+            return list(cached)
+        generation = self.__generation()
+
+        counts = None
+        if from_results:
+            counts = await self.__fetch_result_counts(poll)
+            if counts is None:
+                self.logger.debug(
+                    f"Poll message has no results, counting voters instead: {poll}"
+                )
+        if counts is None:
+            counts = await self.__fetch_all_options(
+                poll, self.__count_option_users, concurrency
+            )
+        self.__store(poll, key, counts, generation)
+        return list(counts)
+
+    def __cached(self, poll: Poll, key):
+        if self.cache is None:
+            return ResultCache.MISSING
+        return self.cache.get(poll.message_id, key)
+
+    def __generation(self) -> Optional[int]:
+        # Results fetched after this point are dropped if the poll ends meanwhile
+        return self.cache.generation if self.cache is not None else None
+
+    def __store(self, poll: Poll, key, value, generation: Optional[int] = None):
+        if self.cache is not None:
+            self.cache.set(poll.message_id, key, value, generation)
+
+    def __invalidate(self, poll: Poll):
+        self.cache.invalidate(poll.message_id)
 
-        counts = []
-        for index in range(len(poll.options)):
-            users = await self.fetch_option_users(poll, index)
-            counts.append(len(users))
+    async def __fetch_result_counts(self, poll: Poll):
+        url = f"{self.BASE_URL}/channels/{poll.channel_id}/messages/{poll.message_id}"
+        status, response = await self.__get_request(url)
+
+        if status == 404:
+            self.logger.error(
+                f"Error while fetching poll({poll})...\nMessage: {response}"
+            )
+            raise PollNotFoundError(response, poll=poll)
+        elif status != 200:
+            self.logger.error(
+                f"Error while fetching poll({poll})...\nMessage: {response}"
+            )
+            raise PollcordError(response, poll=poll)
+
+        results = (response.get("poll") or {}).get("results")
+        if not results or "answer_counts" not in results:
+            return None
+
+        # Discord leaves answers without votes out of answer_counts
+        counts = [0] * len(poll.options)
+        for answer in results["answer_counts"]:
+            index = int(answer["id"]) - 1
+            if 0 <= index < len(counts):
+                counts[index] = answer["count"]
         return counts
 
+    async def __count_option_users(self, poll: Poll, answer_id: int):
+        count = 0
+        async for page in self.iter_option_pages(poll, answer_id, ids=True):
+            count += len(page)
+        return count
+
+    async def __fetch_all_options(self, poll: Poll, fetch, concurrency: Optional[int]):
+        return await gather_limited(
+            [
+                functools.partial(fetch, poll, index)
+                for index in range(len(poll.options))
+            ],
+            concurrency or self.max_concurrency,
+        )
+
     async def fetch_option_users(
         self, poll: Poll, answer_id: int, max_retries: int = 5
     ):
@@ -149,10 +558,135 @@ class PollClient:
             - answer_id (int): Index of the answer option.
             - max_retries(optional) (int): Maximum number of retries in case of rate limiting
         Returns:
-            - List of user objects (dicts) who voted for this option."""
+            - List of user objects (dicts) who voted for this option, across all pages."""
 
+        return [
+            user
+            async for user in self.iter_option_users(
+                poll, answer_id, max_retries=max_retries
+            )
+        ]
+
+    async def fetch_option_user_ids(
+        self, poll: Poll, answer_id: int, max_retries: int = 5
+    ) -> array:
+        """
+        Gets the ids of the users who voted for an answer option, across all pages.
+
+        Returns:
+            - ``array("Q")`` of user IDs.
+        """
+        ids = array("Q")
+        async for page in self.iter_option_pages(
+            poll, answer_id, max_retries=max_retries, ids=True
+        ):
+            ids.extend(page)
+        return ids
+
+    async def iter_option_users(
+        self,
+        poll: Poll,
+        answer_id: int,
+        page_size: int = 100,
+        prefetch: bool = True,
+        max_retries: int = 5,
+    ):
+        """
+        Asynchronously iterates over every user who voted for an answer option.
+
+        Follows Discord's ``after``/``limit`` cursor until the last page. While the
+        current page is being consumed the next one is already requested, so at most
+        two pages are held in memory at any time.
+
+        Parameters:
+            - poll (Poll): The poll to get the answer of
+            - answer_id (int): Index of the answer option.
+            - page_size (int): Users requested per page (1-100).
+            - prefetch (bool): Whether to request the next page ahead of time.
+            - max_retries(optional) (int): Maximum number of retries in case of rate limiting
+        Yields:
+            - User objects (dicts) who voted for this option.
+        """
+        pages = self.iter_option_pages(
+            poll, answer_id, page_size, prefetch, max_retries
+        )
+        try:
+            async for page in pages:
+                for user in page:
+                    yield user
+        finally:
+            await pages.aclose()  # cancels the prefetch if iteration stops early
+
+    async def iter_option_pages(
+        self,
+        poll: Poll,
+        answer_id: int,
+        page_size: int = 100,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        ids: bool = False,
+    ):
+        """
+        Like ``iter_option_users``, but yields whole pages.
+
+        Parameters:
+            - ids (bool): Yield ``array("Q")`` pages of user IDs (see
+              ``fetch_option_user_ids``) instead of lists of user objects.
+        Yields:
+            - One page of voters per request. Pages may be shared with concurrent
+              identical requests, so they must not be mutated.
+        """
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        pending = None
+        try:
+            page = await self.__fetch_option_page(
+                poll, answer_id, None, page_size, max_retries, ids
+            )
+            while True:
+                if len(page) < page_size:
+                    # A short page is the last one
+                    yield page
+                    return
+
+                after = page[-1] if ids else page[-1]["id"]
+                if prefetch:
+                    pending = asyncio.ensure_future(
+                        self.__fetch_option_page(
+                            poll, answer_id, after, page_size, max_retries, ids
+                        )
+                    )
+                yield page
+
+                if pending is not None:
+                    page = await pending
+                    pending = None
+                else:
+                    page = await self.__fetch_option_page(
+                        poll, answer_id, after, page_size, max_retries, ids
+                    )
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def __fetch_option_page(
+        self,
+        poll: Poll,
+        answer_id: int,
+        after,
+        limit: int,
+        max_retries: int,
+        ids: bool = False,
+    ):
         url = f"{self.BASE_URL}/channels/{poll.channel_id}/polls/{poll.message_id}/answers/{answer_id + 1}"
-        status, response = await self.__get_request(url, max_retries=max_retries)
+        params = {"limit": limit}
+        if after is not None:
+            params["after"] = after
+        status, response = await self.__get_request(
+            url,
+            params=params,
+            max_retries=max_retries,
+            stream=UserIdScanner if ids else None,
+        )
 
         if status == 404:
             self.logger.error(
@@ -164,6 +698,8 @@ class PollClient:
             self.logger.error(f"Error while fetching poll({poll})...\nMessage: {text}")
             raise PollcordError(text, poll=poll)
 
+        if ids:
+            return response
         data = response
         return data.get("users", [])
 
@@ -186,6 +722,8 @@ class PollClient:
         elif status not in (200, 204):
             raise PollcordError(f"Failed to end poll: {status} - {response}", poll=poll)
 
+        if self.cache is not None:
+            self.cache.invalidate(poll.message_id)
         await poll.end()
 
     @staticmethod
@@ -195,62 +733,173 @@ class PollClient:
             for i, opt in enumerate(options)
         ]
 
-    async def __get_request(self, url: str, max_retries: int = 5):
-        if not self.session:
-            raise RuntimeError("Pollcord session not initialized...")
-        self.logger.info(f"Sending request to {url}\nmax retries: {max_retries}")
-        retries = 0
-        while retries < max_retries:
-            async with self.session.get(url) as r:
-                if r.status == 429:
-                    data = await r.json()
-                    wait_time = data["retry_after"]  # exponential backoff
-                    self.logger.warning(
-                        f"\nRate limited(Status Code 429).\n Waiting {wait_time}s before retry ({retries + 1}/{max_retries})\nServer Response: {r.content}."
-                    )
-                    await asyncio.sleep(wait_time)
-                    retries += 1
-                    continue
-                else:
-                    try:
-                        data = await r.json()
-                    except Exception:
-                        data = await r.text()
-                    return r.status, data
-
-        raise PollcordError("Exceeded maximum retries due to rate limiting.")
+    async def __get_request(
+        self, url: str, params=None, max_retries: int = 5, stream=None
+    ):
+        # Identical GETs that are already in flight share a single request.
+        # The response data is shared too, so it must not be mutated.
+        key = (url, tuple(sorted(params.items())) if params else (), stream)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.__request(
+                    "GET", url, params=params, max_retries=max_retries, stream=stream
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self.__request_done, key))
+        else:
+            self.logger.debug(f"Joining in-flight request to {url}")
+        return await asyncio.shield(task)
+
+    def __request_done(self, key, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every waiter was cancelled
 
     async def __post_request(self, url: str, payload=None, max_retries: int = 5):
+        return await self.__request(
+            "POST", url, payload=payload, max_retries=max_retries
+        )
+
+    async def __request(
+        self,
+        method: str,
+        url: str,
+        payload=None,
+        params=None,
+        max_retries: int = 5,
+        stream=None,
+    ):
+        # ``stream`` is a parser factory (e.g. UserIdScanner): successful bodies are
+        # fed to a fresh parser chunk by chunk, and its ``close()`` is returned as
+        # the data, instead of decoding the whole body.
         if not self.session:
             raise RuntimeError("Pollcord session not initialized...")
-
-        retries = 0
+        self.logger.info(
+            f"Sending {method} request to {url}\nmax retries: {max_retries}"
+        )
+        route, major = RateLimiter.route_key(method, url)
+        breaker = self.retry_policy.breaker(route)
+        priority = self.request_scheduler.classify(method, route)
+        retries = 0  # 429s
+        failures = 0  # server and network errors
+        reason = None
         while retries < max_retries:
-            async with self.session.post(
-                url, json=None if not payload else payload
-            ) as r:
-                if r.status == 429:
-                    data = await r.json()
-                    wait_time = data["retry_after"]  # exponential backoff
-                    self.logger.warning(
-                        f"\nRate limited(Status Code 429).\n Waiting {wait_time}s before retry ({retries + 1}/{max_retries})\nServer Response: {r.content}."
+            if reason is not None:
+                self.metrics.retried(route, reason)
+            breaker.before_request()
+            waited = time.perf_counter()
+            # Reserve from the bucket before taking an admission slot, so requests
+            # sleeping on an exhausted bucket don't hold slots other channels need.
+            # Priority therefore only orders admission; buckets are per route, so
+            # urgent requests don't wait behind the reads' buckets either way.
+            await self.rate_limiter.acquire(method, url)
+            admitted = time.perf_counter()
+            await self.request_scheduler.acquire(priority, major)
+
+            backoff = None
+            status = 0
+            started = None
+            try:
+                started = time.perf_counter()
+                if admitted - waited > 0.001:
+                    self.metrics.slept(route, admitted - waited)
+                if started - admitted > 0.001:
+                    self.metrics.queued(route, started - admitted)
+                self.metrics.request_started(route)
+                async with self.session.request(
+                    method,
+                    url,
+                    data=None if not payload else self.codec.dumps(payload),
+                    params=params,
+                    headers=self.headers,
+                ) as r:
+                    status = r.status
+                    self.rate_limiter.update(method, url, r.headers)
+                    if stream is not None and r.status == 200:
+                        parser = stream()
+                        async for chunk in r.content.iter_any():
+                            parser.feed(chunk)
+                        breaker.record_success()
+                        return r.status, parser.close()
+                    data = self.__decode(r, await r.read())
+                    if r.status == 429:
+                        wait_time = data["retry_after"]
+                        is_global = bool(data.get("global")) or (
+                            r.headers.get("X-RateLimit-Global", "").lower() == "true"
+                        )
+                        self.logger.warning(
+                            f"\nRate limited(Status Code 429{', global' if is_global else ''}).\n Waiting {wait_time}s before retry ({retries + 1}/{max_retries})\nServer Response: {r.content}."
+                        )
+                        self.metrics.rate_limited(route, wait_time, is_global)
+                        # Let every queued request on this bucket back off, not just this one
+                        if not self.rate_limiter.rate_limited(
+                            method, url, wait_time, is_global=is_global
+                        ):
+                            backoff = wait_time
+                        breaker.record_success()
+                        retries += 1
+                        reason = "429"
+                    elif self.retry_policy.is_failure(r.status):
+                        breaker.record_failure()
+                        if not self.retry_policy.should_retry(
+                            method, failures, status=r.status
+                        ):
+                            return r.status, data
+                        backoff = self.retry_policy.backoff(failures)
+                        self.logger.warning(
+                            f"Server error {r.status} from {url}, retrying in {backoff:.2f}s ({failures + 1}/{self.retry_policy.max_retries})"
+                        )
+                        failures += 1
+                        reason = str(r.status)
+                    else:
+                        breaker.record_success()
+                        return r.status, data
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                breaker.record_failure()
+                if not self.retry_policy.should_retry(method, failures, error=e):
+                    raise PollcordError(f"Request to {url} failed: {e!r}") from e
+                backoff = self.retry_policy.backoff(failures)
+                self.logger.warning(
+                    f"Request to {url} failed ({e!r}), retrying in {backoff:.2f}s ({failures + 1}/{self.retry_policy.max_retries})"
+                )
+                failures += 1
+                reason = type(e).__name__
+            finally:
+                self.request_scheduler.release(priority)
+                if started is not None:
+                    self.metrics.request_finished(
+                        route, status, time.perf_counter() - started
                     )
-                    await asyncio.sleep(wait_time)
-                    retries += 1
-                    continue
-                else:
-                    try:
-                        data = await r.json()
-                    except Exception:
-                        data = await r.text()
-                    return r.status, data
+
+            if backoff is not None:
+                self.metrics.slept(route, backoff)
+                await asyncio.sleep(backoff)
 
         raise PollcordError("Exceeded maximum retries due to rate limiting.")
 
+    def __decode(self, r: aiohttp.ClientResponse, body: bytes):
+        # The body is read once and only parsed as JSON when it claims to be JSON,
+        # anything else (or malformed JSON) is handed back as text.
+        if r.content_type == "application/json":
+            try:
+                return self.codec.loads(body)
+            except ValueError:
+                pass
+        return body.decode(r.charset or "utf-8", errors="replace")
+
     async def close(self):
         """
         Manually close the aiohttp session, if needed.
+        Sessions shared with the client are left open. The expiry scheduler and
+        callback dispatcher the client created are stopped.
         """
+        if self._owns_scheduler:
+            await self.scheduler.close()
+        if self._owns_dispatcher:
+            self.callback_dispatcher.close()
         self.logger.info("Closing PollClient HTTP session")
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import json
+import re
+from array import array
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # optional speedup
+    ujson = None
+
+
+class JSONCodec:
+    """
+    Encodes request payloads and decodes response bodies using the stdlib ``json``.
+
+    Subclass and override ``dumps``/``loads`` to plug in another library.
+    """
+
+    name = "json"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}>"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Raises:
+            - ValueError: If ``data`` isn't valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec backed by ``ujson``."""
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return ujson.loads(data)
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Returns a JSON codec by name ("orjson", "ujson" or "json").
+
+    Without a name, the fastest installed library is picked: orjson, then ujson,
+    then the stdlib.
+    """
+    if name is None:
+        name = "orjson" if orjson else "ujson" if ujson else "json"
+    if name == "orjson" and orjson:
+        return OrjsonCodec()
+    if name == "ujson" and ujson:
+        return UjsonCodec()
+    if name == "json":
+        return JSONCodec()
+    raise ValueError(f"JSON codec {name!r} is unknown or not installed")
+
+
+# In a voters page only the user objects have an "id" key (nested objects use
+# sku_id, identity_guild_id, ...). The pattern can't match inside a string value,
+# where every quote is escaped, and never spans a comma.
+USER_ID = re.compile(rb'"id"\s*:\s*"(\d+)"')
+
+
+class UserIdScanner:
+    """
+    Extracts the user ids of a voters page from its raw JSON, chunk by chunk.
+
+    The user objects are never built: ids go straight into an ``array("Q")``, 8
+    bytes per voter. Only the unscanned tail of the last chunk is kept, up to its
+    last comma. The body isn't validated, so only feed it successful responses.
+    """
+
+    def __init__(self):
+        self.ids = array("Q")
+        self._tail = b""
+
+    def feed(self, chunk: bytes):
+        data = self._tail + chunk if self._tail else chunk
+        end = data.rfind(b",") + 1
+        if end:
+            self.ids.extend(map(int, USER_ID.findall(data, 0, end)))
+            self._tail = data[end:]
+        else:
+            self._tail = data
+
+    def close(self) -> array:
+        """
+        Returns:
+            - The ids, in page order.
+        """
+        if self._tail:
+            self.ids.extend(map(int, USER_ID.findall(self._tail)))
+            self._tail = b""
+        return self.ids
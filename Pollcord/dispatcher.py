@@ -0,0 +1,130 @@
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
+
+from Pollcord.metrics import MetricsHook
+
+if TYPE_CHECKING:
+    from Pollcord import Poll
+
+
+class CallbackDispatcher:
+    """
+    Runs ``on_end`` callbacks without blocking the event loop.
+
+    Sync callbacks run in a thread pool of ``max_workers`` threads, async callbacks
+    on the loop with at most ``max_concurrent`` running at once. Callbacks beyond
+    those limits wait in line; the queue depth and every callback's duration are
+    reported to the metrics hook.
+
+    Sync callbacks run in a worker thread, so they must not touch the event loop
+    directly (use ``loop.call_soon_threadsafe`` or an async callback for that).
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_concurrent: int = 16,
+        metrics: Optional[MetricsHook] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """
+        Parameters:
+            - max_workers (int): Threads for sync callbacks.
+            - max_concurrent (int): Async callbacks that may run at the same time.
+            - metrics (Optional[MetricsHook]): Receives the queue depth and durations.
+            - executor (Optional[ThreadPoolExecutor]): Runs sync callbacks instead of a
+              pool of our own. It isn't shut down by ``close``.
+        """
+        self.max_workers = max_workers
+        self.max_concurrent = max_concurrent
+        self.metrics = metrics if metrics is not None else MetricsHook()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._threads: Optional[asyncio.Semaphore] = None
+        self._tasks: Optional[asyncio.Semaphore] = None
+        self.queued = 0
+        self.running = 0
+        self.closed = False
+
+    def __repr__(self):
+        return (
+            f"<CallbackDispatcher running={self.running} queued={self.queued} "
+            f"max_workers={self.max_workers} max_concurrent={self.max_concurrent}>"
+        )
+
+    async def run(self, poll: Poll, callback: Callable):
+        """
+        Runs ``callback(poll)`` and waits for it. Errors are logged, not raised.
+        Callbacks dispatched after ``close`` are logged and dropped.
+        """
+        if self.closed:
+            self.__drop(poll)
+            return
+        is_async = asyncio.iscoroutinefunction(callback)
+        if is_async:
+            if self._tasks is None:
+                self._tasks = asyncio.Semaphore(self.max_concurrent)
+            limit = self._tasks
+        else:
+            if self._threads is None:
+                self._threads = asyncio.Semaphore(self.max_workers)
+            limit = self._threads
+
+        self.__queue(1)
+        try:
+            await limit.acquire()
+        finally:
+            self.__queue(-1)
+        if self.closed:  # closed while waiting for a slot
+            limit.release()
+            self.__drop(poll)
+            return
+        self.running += 1
+        started = time.perf_counter()
+        failed = False
+        try:
+            if is_async:
+                await callback(poll)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    self.__get_executor(), callback, poll
+                )
+        except Exception as e:
+            failed = True
+            self.logger.exception(f"Error in on_end callback: {e}")
+        finally:
+            limit.release()
+            self.running -= 1
+            self.metrics.callback_finished(time.perf_counter() - started, failed)
+
+    def close(self, wait: bool = False):
+        """
+        Shuts down the dispatcher's own thread pool. Callbacks that haven't started
+        yet are dropped, as are any dispatched afterwards.
+        """
+        self.closed = True
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="pollcord-callback"
+            )
+        return self._executor
+
+    def __drop(self, poll: Poll):
+        self.logger.warning(
+            f"Dropping on_end callback of poll({poll}): the dispatcher is closed"
+        )
+
+    def __queue(self, change: int):
+        self.queued += change
+        self.metrics.callback_queue(self.queued)
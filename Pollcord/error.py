@@ -36,3 +36,7 @@ class PollNotFoundError(PollcordError):
 
 class PollExpiredError(PollcordError):
     """Raised when trying to interact with an expired poll."""
+
+
+class CircuitOpenError(PollcordError):
+    """Raised when a route is failing and requests to it fail fast."""
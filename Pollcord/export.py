@@ -0,0 +1,307 @@
+from __future__ import annotations
+import asyncio
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from Pollcord import Poll, PollClient
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# Columnar file layout:
+#   header: magic (8 bytes), byte order ("<" or ">", 1 byte), 7 bytes padding
+#   blocks: count (u32), 4 bytes padding,
+#           count x poll_id (u64), count x user_id (u64), count x option (u32),
+#           padding to a multiple of 8 bytes
+# Every column starts 8-byte aligned, so blocks can be viewed in place.
+MAGIC = b"PCVOTES1"
+HEADER = struct.Struct("8sc7x")
+BLOCK = "I4x"
+
+
+class NDJSONWriter:
+    """
+    Writes one JSON object per vote:
+    ``{"poll_id": ..., "channel_id": ..., "option": ..., "user_id": ..., "user": {...}}``.
+    """
+
+    def __init__(self, file: IO[bytes], codec):
+        self.file = file
+        self.codec = codec
+        self.count = 0
+
+    def write(self, poll: Poll, option: int, users: List[Dict[str, Any]]):
+        lines = [
+            self.codec.dumps(
+                {
+                    "poll_id": int(poll.message_id),
+                    "channel_id": int(poll.channel_id),
+                    "option": option,
+                    "user_id": int(user["id"]),
+                    "user": user,
+                }
+            )
+            for user in users
+        ]
+        if lines:
+            self.file.write(b"\n".join(lines) + b"\n")
+        self.count += len(lines)
+
+    def close(self):
+        self.file.flush()
+
+
+class ColumnarWriter:
+    """
+    Writes votes as fixed-width integer columns, in blocks of up to ``block_size``
+    votes. Only the current block is held in memory.
+    """
+
+    def __init__(self, file: IO[bytes], block_size: int = 65536):
+        self.file = file
+        self.block_size = block_size
+        self.byteorder = "<" if sys.byteorder == "little" else ">"
+        self.count = 0
+        self._poll_ids = array("Q")
+        self._options = array("I")
+        self._user_ids = array("Q")
+        self.file.write(HEADER.pack(MAGIC, self.byteorder.encode()))
+
+    def write(self, poll: Poll, option: int, users: List[Dict[str, Any]]):
+        poll_id = int(poll.message_id)
+        for user in users:
+            self._poll_ids.append(poll_id)
+            self._options.append(option)
+            self._user_ids.append(int(user["id"]))
+        self.count += len(users)
+        if len(self._poll_ids) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        count = len(self._poll_ids)
+        if not count:
+            return
+        self.file.write(struct.pack(self.byteorder + BLOCK, count))
+        self.file.write(self._poll_ids.tobytes())
+        self.file.write(self._user_ids.tobytes())
+        self.file.write(self._options.tobytes())
+        if count % 2:
+            self.file.write(b"\0" * 4)
+        del self._poll_ids[:], self._options[:], self._user_ids[:]
+
+    def close(self):
+        self.flush()
+        self.file.flush()
+
+
+class VoterFile:
+    """
+    Memory-mapped reader for columnar voter exports.
+
+    Blocks are exposed as views into the mapping without copying (when the file's
+    byte order matches this machine). Release those views before calling ``close``.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is not a Pollcord voter file")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byteorder = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a Pollcord voter file")
+        self.byteorder = byteorder.decode()
+        self.native = self.byteorder == ("<" if sys.byteorder == "little" else ">")
+        self._block = struct.Struct(self.byteorder + BLOCK)
+        self._offsets = self.__index()
+
+    def __repr__(self):
+        return (
+            f"<VoterFile {self.path!s} votes={len(self)} blocks={len(self._offsets)}>"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return sum(count for _, count in self._offsets)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        """Yields every vote as (poll_id, option, user_id)."""
+        for poll_ids, options, user_ids in self.blocks():
+            yield from zip(poll_ids, options, user_ids)
+
+    def blocks(self) -> Iterator[Tuple[Any, Any, Any]]:
+        """
+        Yields every block as (poll_ids, options, user_ids) columns: memoryviews into
+        the mapping, or arrays if the file was written on a machine with the other
+        byte order.
+        """
+        view = memoryview(self._map)
+        try:
+            for offset, count in self._offsets:
+                start = offset + self._block.size
+                yield (
+                    self.__column(view, "Q", start, count),
+                    self.__column(view, "I", start + 16 * count, count),
+                    self.__column(view, "Q", start + 8 * count, count),
+                )
+        finally:
+            view.release()
+
+    def columns(self) -> Tuple[Any, Any, Any]:
+        """
+        Returns every vote as three (poll_ids, options, user_ids) columns, as NumPy
+        arrays when NumPy is installed and ``array``s otherwise.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None:
+            order = self.byteorder
+            poll_ids, options, user_ids = [], [], []
+            for offset, count in self._offsets:
+                start = offset + self._block.size
+                poll_ids.append(np.frombuffer(self._map, order + "u8", count, start))
+                user_ids.append(
+                    np.frombuffer(self._map, order + "u8", count, start + 8 * count)
+                )
+                options.append(
+                    np.frombuffer(self._map, order + "u4", count, start + 16 * count)
+                )
+            if not poll_ids:
+                return (
+                    np.empty(0, np.uint64),
+                    np.empty(0, np.uint32),
+                    np.empty(0, np.uint64),
+                )
+            return (
+                np.concatenate(poll_ids),
+                np.concatenate(options),
+                np.concatenate(user_ids),
+            )
+
+        columns = array("Q"), array("I"), array("Q")
+        for block in self.blocks():
+            for column, values in zip(columns, block):
+                column.extend(values)
+        return columns
+
+    def close(self):
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # views are still alive, the mapping goes away with them
+        self._file.close()
+
+    def __index(self) -> List[Tuple[int, int]]:
+        offsets = []
+        offset = HEADER.size
+        size = len(self._map)
+        while offset < size:
+            (count,) = self._block.unpack_from(self._map, offset)
+            offsets.append((offset, count))
+            offset += self._block.size + 20 * count + (4 if count % 2 else 0)
+        if offset != size:
+            raise ValueError(f"{self.path} is truncated")
+        return offsets
+
+    def __column(self, view: memoryview, typecode: str, start: int, count: int):
+        width = 8 if typecode == "Q" else 4
+        chunk = view[start : start + width * count]
+        if self.native:
+            return chunk.cast(typecode)
+        values = array(typecode, chunk.tobytes())
+        values.byteswap()
+        return values
+
+
+async def export_voters(
+    client: PollClient,
+    polls: Iterable[Poll],
+    destination: PathOrFile,
+    format: str = "ndjson",
+    concurrency: Optional[int] = None,
+    block_size: int = 65536,
+) -> int:
+    """See ``PollClient.export_voters``."""
+    if format not in ("ndjson", "columnar"):
+        raise ValueError(f"Unknown export format {format!r}")
+
+    # Encoding and file I/O run on one writer thread, in the order they were
+    # submitted, so they neither block the event loop nor interleave.
+    loop = asyncio.get_running_loop()
+    io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pollcord-export")
+    owns_file = isinstance(destination, (str, os.PathLike))
+    try:
+        if owns_file:
+            file = await loop.run_in_executor(io, open, destination, "wb")
+        else:
+            file = destination
+        try:
+            if format == "ndjson":
+                writer = NDJSONWriter(file, client.codec)
+            else:
+                writer = await loop.run_in_executor(
+                    io, ColumnarWriter, file, block_size
+                )
+
+            async def export_option(poll: Poll, option: int):
+                async for page in client.iter_option_pages(poll, option):
+                    if page:
+                        await loop.run_in_executor(io, writer.write, poll, option, page)
+
+            # Workers share one generator, so (poll, option) pairs are only produced
+            # as they're taken and memory doesn't grow with the number of polls.
+            pairs = (
+                (poll, option) for poll in polls for option in range(len(poll.options))
+            )
+
+            async def worker():
+                for poll, option in pairs:
+                    await export_option(poll, option)
+
+            workers = [
+                asyncio.ensure_future(worker())
+                for _ in range(max(1, concurrency or client.max_concurrency))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            await loop.run_in_executor(io, writer.close)
+            return writer.count
+        finally:
+            if owns_file:
+                # Queued behind any write still running on the writer thread
+                await loop.run_in_executor(io, file.close)
+    finally:
+        io.shutdown(wait=False)
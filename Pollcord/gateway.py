@@ -0,0 +1,318 @@
+from __future__ import annotations
+import asyncio
+import logging
+import random
+import sys
+from typing import TYPE_CHECKING, Dict, Optional
+
+import aiohttp
+
+from Pollcord.error import PollcordError
+from Pollcord.tracker import VoteTracker
+
+if TYPE_CHECKING:
+    from Pollcord import Poll, PollClient
+
+
+class GatewayListener:
+    """
+    Listens for poll votes on Discord's gateway instead of polling the REST API.
+
+    Polls registered with ``track`` get a VoteTracker whose tallies are updated from
+    ``MESSAGE_POLL_VOTE_ADD``/``MESSAGE_POLL_VOTE_REMOVE`` events as they arrive.
+    REST is only used by ``reconcile``, which is also run automatically after a
+    reconnect that couldn't resume the session (and may have missed events).
+
+    Vote events are applied (and tracker handlers run) by a separate task, in the
+    order they arrived, so slow handlers don't hold up heartbeats. If the gateway
+    closes with a fatal code the listener stops and the error is kept in ``error``.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    GATEWAY_URL = "wss://gateway.discord.gg/?v=10&encoding=json"
+
+    GUILD_MESSAGE_POLLS = 1 << 24
+    DIRECT_MESSAGE_POLLS = 1 << 25
+
+    # Gateway opcodes
+    DISPATCH = 0
+    HEARTBEAT = 1
+    IDENTIFY = 2
+    RESUME = 6
+    RECONNECT = 7
+    INVALID_SESSION = 9
+    HELLO = 10
+    HEARTBEAT_ACK = 11
+
+    # Close codes after which reconnecting is pointless (bad token, intents, ...)
+    FATAL_CLOSE_CODES = frozenset({4004, 4010, 4011, 4012, 4013, 4014})
+
+    def __init__(
+        self,
+        client: PollClient,
+        url: Optional[str] = None,
+        intents: int = GUILD_MESSAGE_POLLS | DIRECT_MESSAGE_POLLS,
+        reconnect: bool = True,
+    ):
+        """
+        Parameters:
+            - client (PollClient): Provides the token, HTTP session and JSON codec, and
+              is used for reconciliation over REST.
+            - url (Optional[str]): Gateway URL, e.g. a local stand-in server for tests.
+            - intents (int): Gateway intents to identify with.
+            - reconnect (bool): Whether to reconnect when the connection drops.
+        """
+        self.client = client
+        self.url = url or self.GATEWAY_URL
+        self.intents = intents
+        self.reconnect = reconnect
+        self.trackers: Dict[str, VoteTracker] = {}
+        self.error: Optional[Exception] = None  # why the listener stopped, if fatal
+        self._task: Optional[asyncio.Task] = None
+        self._events: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._reconciling: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._sequence: Optional[int] = None
+        self._session_id: Optional[str] = None
+        self._resume_url: Optional[str] = None
+        self._identified_before = False
+        self._acked = True
+        self._closing = False
+
+    def __repr__(self):
+        return (
+            f"<GatewayListener tracking={len(self.trackers)} "
+            f"connected={self._ready is not None and self._ready.is_set()}>"
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def track(self, poll: Poll, emit_initial: bool = True) -> VoteTracker:
+        """
+        Starts routing vote events for a poll.
+
+        Parameters:
+            - poll (Poll): The poll to track.
+            - emit_initial (bool): Whether the first ``reconcile`` reports votes cast
+              before tracking started. If False it only records them.
+
+        Returns:
+            - The poll's VoteTracker, register ``vote_added``/``vote_removed`` handlers on it.
+        """
+        key = str(poll.message_id)
+        tracker = self.trackers.get(key)
+        if tracker is None:
+            tracker = self.trackers[key] = VoteTracker(
+                self.client, poll, emit_initial=emit_initial
+            )
+        return tracker
+
+    def untrack(self, poll: Poll):
+        """Stops routing vote events for a poll."""
+        self.trackers.pop(str(poll.message_id), None)
+
+    async def start(self):
+        """Connects in the background. Use ``wait_until_ready`` to wait for the session."""
+        if self._task is not None and not self._task.done():
+            return
+        self._closing = False
+        self.error = None
+        self._ready = asyncio.Event()
+        self._events = asyncio.Queue()
+        self._consumer = asyncio.ensure_future(self._consume())
+        self._task = asyncio.ensure_future(self._run())
+
+    async def wait_until_ready(self, timeout: Optional[float] = None):
+        """
+        Raises:
+            - PollcordError: If the listener stopped before a session was ready.
+            - asyncio.TimeoutError: If ``timeout`` passed first.
+        """
+        ready = asyncio.ensure_future(self._ready.wait())
+        try:
+            await asyncio.wait_for(
+                asyncio.wait({ready, self._task}, return_when=asyncio.FIRST_COMPLETED),
+                timeout,
+            )
+        finally:
+            ready.cancel()
+        if not self._ready.is_set():
+            raise self.error or PollcordError("Gateway listener stopped")
+
+    async def close(self):
+        self._closing = True
+        tasks = [
+            task
+            for task in (self._task, self._consumer, self._reconciling)
+            if task is not None
+        ]
+        self._task = self._consumer = self._reconciling = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def reconcile(self):
+        """
+        Refreshes every tracked poll over REST, emitting events for votes that were
+        missed on the gateway.
+        """
+        await asyncio.gather(*(tracker.refresh() for tracker in self.trackers.values()))
+
+    async def _run(self):
+        delay = 1.0
+        while not self._closing:
+            try:
+                await self._connect_once()
+                delay = 1.0
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Gateway connection failed: {e!r}")
+            except PollcordError as e:
+                self.logger.error(f"Gateway listener stopped: {e}")
+                self.error = e
+                return
+            except Exception as e:
+                self.logger.exception(f"Unexpected error on the gateway: {e!r}")
+            if self._closing or not self.reconnect:
+                return
+            self._ready.clear()
+            self.logger.info(f"Reconnecting to the gateway in {delay:.1f}s")
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, 60.0)
+
+    async def _connect_once(self):
+        url = self._resume_url or self.url
+        self.logger.debug(f"Connecting to gateway {url}")
+        async with self.client.session.ws_connect(url) as ws:
+            heartbeat = None
+            try:
+                async for message in ws:
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        continue
+                    payload = self.client.codec.loads(message.data)
+                    if payload.get("s") is not None:
+                        self._sequence = payload["s"]
+                    op = payload["op"]
+
+                    if op == self.HELLO:
+                        interval = payload["d"]["heartbeat_interval"] / 1000
+                        self._acked = True
+                        heartbeat = asyncio.ensure_future(self._heartbeat(ws, interval))
+                        await self._identify_or_resume(ws)
+                    elif op == self.HEARTBEAT_ACK:
+                        self._acked = True
+                    elif op == self.HEARTBEAT:
+                        await self._send(ws, self.HEARTBEAT, self._sequence)
+                    elif op == self.DISPATCH:
+                        await self._dispatch(payload["t"], payload["d"])
+                    elif op == self.RECONNECT:
+                        self.logger.info("Gateway asked us to reconnect")
+                        # Closing with 1000/1001 would end the session we resume
+                        await ws.close(code=4000)
+                        break
+                    elif op == self.INVALID_SESSION:
+                        if payload.get("d"):
+                            await ws.close(code=4000)
+                        else:
+                            self._session_id = self._resume_url = None
+                        self.logger.info("Gateway session invalidated")
+                        break
+            finally:
+                if heartbeat is not None:
+                    heartbeat.cancel()
+
+        if ws.close_code in self.FATAL_CLOSE_CODES:
+            self._closing = True
+            raise PollcordError(f"Gateway closed the connection ({ws.close_code})")
+
+    async def _identify_or_resume(self, ws):
+        if self._session_id is not None:
+            await self._send(
+                ws,
+                self.RESUME,
+                {
+                    "token": self.client.token,
+                    "session_id": self._session_id,
+                    "seq": self._sequence,
+                },
+            )
+            return
+        await self._send(
+            ws,
+            self.IDENTIFY,
+            {
+                "token": self.client.token,
+                "intents": self.intents,
+                "properties": {
+                    "os": sys.platform,
+                    "browser": "pollcord",
+                    "device": "pollcord",
+                },
+            },
+        )
+
+    async def _heartbeat(self, ws, interval: float):
+        await asyncio.sleep(interval * random.random())
+        while not ws.closed:
+            if not self._acked:
+                self.logger.warning("No heartbeat ACK from gateway, reconnecting")
+                await ws.close(code=4000)
+                return
+            self._acked = False
+            await self._send(ws, self.HEARTBEAT, self._sequence)
+            await asyncio.sleep(interval)
+
+    async def _send(self, ws, op: int, data):
+        await ws.send_str(self.client.codec.dumps({"op": op, "d": data}).decode())
+
+    async def _dispatch(self, event: str, data: dict):
+        if event == "READY":
+            self._session_id = data.get("session_id")
+            resume_url = data.get("resume_gateway_url")
+            self._resume_url = (
+                f"{resume_url}/?v=10&encoding=json" if resume_url else None
+            )
+            self._ready.set()
+            if self._identified_before and self.trackers:
+                # A new session may have missed votes while we were away
+                if self._reconciling is None or self._reconciling.done():
+                    self._reconciling = asyncio.ensure_future(self.reconcile())
+                    self._reconciling.add_done_callback(self._reconciled)
+            self._identified_before = True
+        elif event == "RESUMED":
+            self._ready.set()
+        elif event in ("MESSAGE_POLL_VOTE_ADD", "MESSAGE_POLL_VOTE_REMOVE"):
+            self._events.put_nowait((event, data))
+
+    def _reconciled(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(
+                f"Reconciling after a new gateway session failed: {task.exception()!r}"
+            )
+
+    async def _consume(self):
+        while True:
+            event, data = await self._events.get()
+            try:
+                await self._apply_vote(event, data)
+            except Exception as e:
+                self.logger.exception(f"Dropped gateway event {event} {data}: {e!r}")
+
+    async def _apply_vote(self, event: str, data: dict):
+        tracker = self.trackers.get(str(data["message_id"]))
+        if tracker is None:
+            return
+        index = int(data["answer_id"]) - 1
+        if not 0 <= index < len(tracker.voters):
+            raise ValueError(f"No answer {data['answer_id']} in {tracker.poll}")
+        user_id = int(data["user_id"])
+        if event == "MESSAGE_POLL_VOTE_ADD":
+            await tracker.add_vote(index, user_id)
+        else:
+            await tracker.remove_vote(index, user_id)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+import bisect
+from typing import Dict, List, Sequence
+
+
+class MetricsHook:
+    """
+    Receives measurements from a PollClient.
+
+    Every method is a no-op here; subclass and override the ones you care about
+    to forward them to your metrics system. Hooks are called inline on the event
+    loop, so they should be cheap and must not block.
+    """
+
+    def request_started(self, route: str):
+        """A request was sent. ``route`` is its template, see ``RateLimiter.route_key``."""
+
+    def request_finished(self, route: str, status: int, latency: float):
+        """A request completed after ``latency`` seconds (status 0 if it failed)."""
+
+    def rate_limited(self, route: str, retry_after: float, is_global: bool):
+        """Discord answered with a 429."""
+
+    def retried(self, route: str, reason: str):
+        """A request is being sent again, ``reason`` says why (e.g. ``"429"``)."""
+
+    def slept(self, route: str, seconds: float):
+        """A request waited ``seconds`` for rate limit capacity or a 429 to clear."""
+
+    def queued(self, route: str, seconds: float):
+        """A request waited ``seconds`` for an admission slot of the RequestScheduler."""
+
+    def scheduler_backlog(self, size: int):
+        """The number of polls waiting in the expiry scheduler changed."""
+
+    def callback_queue(self, size: int):
+        """The number of on_end callbacks waiting for a free slot changed."""
+
+    def callback_finished(self, duration: float, failed: bool):
+        """An on_end callback ran for ``duration`` seconds, ``failed`` if it raised."""
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram.
+    """
+
+    # Upper bounds in seconds, the last bucket is unbounded
+    BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bounds: Sequence[float] = BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket it falls in.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*map(str, self.bounds), "+Inf"], self.counts)),
+        }
+
+
+class InMemoryMetrics(MetricsHook):
+    """
+    In-process collector that keeps everything in memory.
+
+    Call ``snapshot()`` at any time for a JSON-serializable dict of the current values.
+    """
+
+    def __init__(self, bounds: Sequence[float] = Histogram.BOUNDS):
+        self.bounds = bounds
+        self.latency: Dict[str, Histogram] = {}
+        self.statuses: Dict[str, Dict[int, int]] = {}
+        self.rate_limits: Dict[str, int] = {}
+        self.global_rate_limits = 0
+        self.retries: Dict[str, Dict[str, int]] = {}
+        self.sleep_seconds: Dict[str, float] = {}
+        self.queue_seconds: Dict[str, float] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.backlog = 0
+        self.max_backlog = 0
+        self.callback_duration = Histogram(bounds)
+        self.callback_errors = 0
+        self.callbacks_queued = 0
+        self.max_callbacks_queued = 0
+
+    def __repr__(self):
+        return (
+            f"<InMemoryMetrics routes={len(self.latency)} in_flight={self.in_flight}>"
+        )
+
+    def request_started(self, route: str):
+        self.in_flight += 1
+        if self.in_flight > self.max_in_flight:
+            self.max_in_flight = self.in_flight
+
+    def request_finished(self, route: str, status: int, latency: float):
+        self.in_flight -= 1
+        histogram = self.latency.get(route)
+        if histogram is None:
+            histogram = self.latency[route] = Histogram(self.bounds)
+        histogram.observe(latency)
+        statuses = self.statuses.setdefault(route, {})
+        statuses[status] = statuses.get(status, 0) + 1
+
+    def rate_limited(self, route: str, retry_after: float, is_global: bool):
+        self.rate_limits[route] = self.rate_limits.get(route, 0) + 1
+        if is_global:
+            self.global_rate_limits += 1
+
+    def retried(self, route: str, reason: str):
+        reasons = self.retries.setdefault(route, {})
+        reasons[reason] = reasons.get(reason, 0) + 1
+
+    def slept(self, route: str, seconds: float):
+        self.sleep_seconds[route] = self.sleep_seconds.get(route, 0.0) + seconds
+
+    def queued(self, route: str, seconds: float):
+        self.queue_seconds[route] = self.queue_seconds.get(route, 0.0) + seconds
+
+    def scheduler_backlog(self, size: int):
+        self.backlog = size
+        if size > self.max_backlog:
+            self.max_backlog = size
+
+    def callback_queue(self, size: int):
+        self.callbacks_queued = size
+        if size > self.max_callbacks_queued:
+            self.max_callbacks_queued = size
+
+    def callback_finished(self, duration: float, failed: bool):
+        self.callback_duration.observe(duration)
+        if failed:
+            self.callback_errors += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            - A dict with per-route latency histograms, status counts, 429s, retries,
+              rate limit sleep and admission queue time, the in-flight and scheduler backlog gauges, and
+              on_end callback durations and queue depth.
+        """
+        routes: List[str] = sorted(
+            {
+                *self.latency,
+                *self.rate_limits,
+                *self.retries,
+                *self.sleep_seconds,
+                *self.queue_seconds,
+            }
+        )
+        return {
+            "routes": {
+                route: {
+                    "latency": self.latency[route].snapshot()
+                    if route in self.latency
+                    else None,
+                    "statuses": dict(self.statuses.get(route, {})),
+                    "rate_limited": self.rate_limits.get(route, 0),
+                    "retries": dict(self.retries.get(route, {})),
+                    "sleep_seconds": self.sleep_seconds.get(route, 0.0),
+                    "queue_seconds": self.queue_seconds.get(route, 0.0),
+                }
+                for route in routes
+            },
+            "rate_limited": sum(self.rate_limits.values()),
+            "global_rate_limited": self.global_rate_limits,
+            "retries": sum(sum(r.values()) for r in self.retries.values()),
+            "sleep_seconds": sum(self.sleep_seconds.values()),
+            "queue_seconds": sum(self.queue_seconds.values()),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "scheduler_backlog": self.backlog,
+            "max_scheduler_backlog": self.max_backlog,
+            "callbacks": {
+                "duration": self.callback_duration.snapshot(),
+                "errors": self.callback_errors,
+                "queued": self.callbacks_queued,
+                "max_queued": self.max_callbacks_queued,
+            },
+        }
+
+    def reset(self):
+        """Clears every measurement except the current gauges."""
+        self.latency.clear()
+        self.statuses.clear()
+        self.rate_limits.clear()
+        self.global_rate_limits = 0
+        self.retries.clear()
+        self.sleep_seconds.clear()
+        self.queue_seconds.clear()
+        self.max_in_flight = self.in_flight
+        self.max_backlog = self.backlog
+        self.callback_duration = Histogram(self.bounds)
+        self.callback_errors = 0
+        self.max_callbacks_queued = self.callbacks_queued
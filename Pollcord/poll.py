@@ -1,13 +1,37 @@
 from __future__ import annotations  # allows forward references in type hints
 import asyncio
-from typing import List, Optional, Callable
-from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Optional, Callable
+from datetime import datetime, timezone
 import logging
+import time
+from Pollcord.scheduler import ExpiryScheduler
+
+if TYPE_CHECKING:
+    from Pollcord.dispatcher import CallbackDispatcher
 
 
 class Poll:
     logger = logging.getLogger("pollcord")
 
+    # Polls are kept around in large numbers, so they carry no __dict__.
+    # Times are stored as epoch seconds and exposed as datetimes on access.
+    __slots__ = (
+        "channel_id",
+        "message_id",
+        "prompt",
+        "options",
+        "duration",
+        "isMultiselect",
+        "on_end",
+        "ended",
+        "_start_ts",
+        "_end_ts",
+        "_scheduler",
+        "_end_listeners",
+        "_dispatcher",
+        "__weakref__",  # for PollRegistry
+    )
+
     def __init__(
         self,
         channel_id: int,
@@ -24,13 +48,56 @@ class Poll:
         self.channel_id = channel_id
         self.message_id = message_id
         self.prompt = prompt
-        self.options = options
-        self.start_time = datetime.now(timezone.utc)
-        self.end_time = self.start_time + timedelta(hours=duration)
+        self.options = tuple(options)
+        self._start_ts = time.time()
+        self._end_ts = self._start_ts + duration * 3600
         self.on_end = on_end
         self.duration = duration
         self.isMultiselect = isMultiselect
         self.ended = False
+        self._scheduler: Optional[ExpiryScheduler] = None
+        self._end_listeners: Optional[List[Callable[[Poll], None]]] = None
+        self._dispatcher: Optional[CallbackDispatcher] = None
+
+    @classmethod
+    def restore(
+        cls,
+        channel_id: int,
+        message_id: int,
+        prompt: str,
+        options: List[str],
+        start_ts: float,
+        end_ts: float,
+        duration: int = 1,
+        isMultiselect: bool = False,
+        on_end: Optional[Callable[["Poll"], None]] = None,
+    ) -> Poll:
+        """
+        Recreates a poll that was created earlier, keeping its original start and end
+        times (as epoch seconds) instead of starting the clock now.
+        """
+        poll = cls(
+            channel_id=channel_id,
+            message_id=message_id,
+            prompt=prompt,
+            options=options,
+            duration=duration,
+            isMultiselect=isMultiselect,
+            on_end=on_end,
+        )
+        poll._start_ts = start_ts
+        poll._end_ts = end_ts
+        return poll
+
+    @property
+    def start_time(self) -> datetime:
+        """When the poll was created (UTC)."""
+        return datetime.fromtimestamp(self._start_ts, timezone.utc)
+
+    @property
+    def end_time(self) -> datetime:
+        """When the poll is scheduled to end (UTC)."""
+        return datetime.fromtimestamp(self._end_ts, timezone.utc)
 
     def __repr__(self):
         return (
@@ -40,34 +107,40 @@ class Poll:
             f"Multiselect = {self.isMultiselect}, Ended = {self.ended}\n>"
         )
 
-    def start(self):
+    def start(self, scheduler: Optional[ExpiryScheduler] = None):
         """
-        Starts the background task to end the poll after the specified duration.
+        Schedules the poll to end after the specified duration.
+
+        Parameters:
+            - scheduler (Optional[ExpiryScheduler]): The scheduler that ends the poll.
+              Defaults to the event loop's shared scheduler.
         """
         if not self.ended:
             self.logger.debug(f"Poll started: {self}")
-            loop = asyncio.get_running_loop()
-            self.end_task = loop.create_task(self._schedule_end())
+            self._scheduler = (
+                scheduler if scheduler is not None else ExpiryScheduler.default()
+            )
+            self._scheduler.schedule(self, self._end_ts - time.time())
 
-    async def _schedule_end(self):
+    def _add_end_listener(self, listener: Callable[[Poll], None]):
         """
-        Sleeps for the poll duration then marks it ended and calls the on_end callback.
+        Registers an internal hook that runs synchronously when the poll ends,
+        before the on_end callback.
         """
-        self.logger.debug(
-            f"Starting poll end scheduler (ending in {self.duration * 3600}s): {self}"
-        )
-        try:
-            await asyncio.sleep(self.duration * 3600)
-            if not self.ended:
-                await self.end()
-        except asyncio.CancelledError:
-            # task cancelled because poll ended early
-            return
+        if self._end_listeners is None:
+            self._end_listeners = []
+        self._end_listeners.append(listener)
 
     async def _safe_callback(self):
         """
         Safely executes the on_end callback with error handling.
+
+        Polls of a PollClient hand the callback to the client's CallbackDispatcher,
+        which runs sync callbacks off the event loop.
         """
+        if self._dispatcher is not None:
+            await self._dispatcher.run(self, self.on_end)
+            return
         try:
             if asyncio.iscoroutinefunction(self.on_end):
                 await self.on_end(self)
@@ -86,9 +159,16 @@ class Poll:
 
         self.ended = True
 
-        # cancel scheduler if running
-        if hasattr(self, "end_task"):
-            self.end_task.cancel()
+        # remove from the scheduler if still pending
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+
+        if self._end_listeners:
+            for listener in self._end_listeners:
+                try:
+                    listener(self)
+                except Exception as e:
+                    self.logger.exception(f"Error in poll end listener: {e}")
 
         if self.on_end:
             await self._safe_callback()
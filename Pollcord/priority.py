@@ -0,0 +1,155 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import enum
+import logging
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+
+
+class Priority(enum.IntEnum):
+    """Request classes, most urgent first."""
+
+    CONTROL = 0  # ending polls
+    CREATE = 1  # creating polls and other writes
+    READ = 2  # fetching votes and results
+
+
+class RequestScheduler:
+    """
+    Admits requests by priority, with fair queuing between channels.
+
+    At most ``max_in_flight`` requests are admitted at a time. When that's reached,
+    waiting requests are admitted by priority class (CONTROL, then CREATE, then READ)
+    and round-robin between the channels of a class, so a channel with a long queue
+    doesn't starve the others. READ requests can never take the last
+    ``reserved_slots`` slots, so bulk reads only use leftover capacity and urgent
+    requests always find room.
+
+    Requests only ask for a slot once their rate limit bucket has capacity, so
+    priority orders admission under ``max_in_flight``, not the wait on a bucket
+    (which is per route anyway). Time spent waiting for a slot is reported as
+    ``MetricsHook.queued``.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(self, max_in_flight: int = 50, reserved_slots: Optional[int] = None):
+        """
+        Parameters:
+            - max_in_flight (int): Maximum number of admitted requests.
+            - reserved_slots (Optional[int]): Slots READ requests can't use. Defaults to a fifth
+              of ``max_in_flight`` (at least 1 when there is more than one slot).
+        """
+        if reserved_slots is None:
+            reserved_slots = max(1, max_in_flight // 5) if max_in_flight > 1 else 0
+        if not 0 <= reserved_slots < max_in_flight:
+            raise ValueError("reserved_slots must leave at least one slot for reads")
+        self.max_in_flight = max_in_flight
+        self.reserved_slots = reserved_slots
+        self.in_flight = 0
+        self._reads = 0
+        # priority -> channel -> waiters, channels are rotated for fairness
+        self._queues: List[Dict[str, Deque[asyncio.Future]]] = [
+            OrderedDict() for _ in Priority
+        ]
+        self._waiting = [0 for _ in Priority]
+
+    def __repr__(self):
+        return (
+            f"<RequestScheduler in_flight={self.in_flight}/{self.max_in_flight} "
+            f"waiting={sum(self._waiting)}>"
+        )
+
+    @staticmethod
+    def classify(method: str, route: str) -> Priority:
+        """
+        Picks the priority of a request from its route template
+        (see ``RateLimiter.route_key``).
+        """
+        if route.endswith("/expire"):
+            return Priority.CONTROL
+        if method.upper() != "GET":
+            return Priority.CREATE
+        return Priority.READ
+
+    @property
+    def waiting(self) -> int:
+        return sum(self._waiting)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Priority, channel: str = ""):
+        """Holds an admission slot for the duration of the ``async with`` block."""
+        await self.acquire(priority, channel)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    async def acquire(self, priority: Priority, channel: str = ""):
+        """
+        Waits until a request of ``priority`` on ``channel`` may be sent.
+        Every successful ``acquire`` must be paired with a ``release``.
+        """
+        if self._can_run(priority) and not any(self._waiting[: priority + 1]):
+            self._admit(priority)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[priority].setdefault(channel, deque()).append(waiter)
+        self._waiting[priority] += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just before the cancellation arrived
+                self.release(priority)
+            else:
+                self._discard(priority, channel, waiter)
+            raise
+
+    def release(self, priority: Priority):
+        self.in_flight -= 1
+        if priority == Priority.READ:
+            self._reads -= 1
+        self._wake()
+
+    def _can_run(self, priority: Priority) -> bool:
+        if self.in_flight >= self.max_in_flight:
+            return False
+        if priority == Priority.READ:
+            return self._reads < self.max_in_flight - self.reserved_slots
+        return True
+
+    def _admit(self, priority: Priority):
+        self.in_flight += 1
+        if priority == Priority.READ:
+            self._reads += 1
+
+    def _discard(self, priority: Priority, channel: str, waiter: asyncio.Future):
+        lane = self._queues[priority].get(channel)
+        if lane is None:
+            return
+        try:
+            lane.remove(waiter)
+        except ValueError:
+            return
+        self._waiting[priority] -= 1
+        if not lane:
+            del self._queues[priority][channel]
+
+    def _wake(self):
+        for priority in Priority:
+            lanes = self._queues[priority]
+            while lanes and self._can_run(priority):
+                channel, lane = next(iter(lanes.items()))
+                waiter = lane.popleft()
+                self._waiting[priority] -= 1
+                if lane:
+                    lanes.move_to_end(channel)
+                else:
+                    del lanes[channel]
+                if waiter.done():
+                    continue  # cancelled while queued
+                self._admit(priority)
+                waiter.set_result(None)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+import asyncio
+import logging
+import re
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class RateLimitBucket:
+    """
+    Local view of a single Discord rate limit bucket.
+    """
+
+    def __init__(self, key: Tuple[str, str]):
+        self.key = key
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0  # event loop time at which the window resets
+        self.period = 0.0  # longest reset window seen, used to refill locally
+        self.lock = asyncio.Lock()
+
+    def __repr__(self):
+        return (
+            f"<RateLimitBucket {self.key[0]}:{self.key[1]} "
+            f"remaining={self.remaining}/{self.limit} reset_at={self.reset_at:.3f}>"
+        )
+
+
+class RateLimiter:
+    """
+    Proactive rate limiter driven by Discord's ``X-RateLimit-*`` response headers.
+
+    Every response is fed back through ``update`` so the limiter learns which
+    bucket a route belongs to and how much capacity is left. Requests then
+    wait in ``acquire`` until their bucket has capacity instead of being sent
+    only to come back as a 429.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    # Path segments whose following id is a Discord "major parameter".
+    MAJOR_PARAMETERS = ("channels", "guilds", "webhooks")
+    _ID = re.compile(r"^\d+$")
+
+    def __init__(self):
+        self._routes: Dict[str, str] = {}  # route -> bucket hash
+        self._buckets: Dict[Tuple[str, str], RateLimitBucket] = {}
+        self._global_reset = 0.0
+
+    def __repr__(self):
+        return f"<RateLimiter routes={len(self._routes)} buckets={len(self._buckets)}>"
+
+    @classmethod
+    def route_key(cls, method: str, url: str) -> Tuple[str, str]:
+        """
+        Splits a request into its route template and major parameter.
+
+        Parameters:
+            - method (str): The HTTP method of the request.
+            - url (str): The full request URL.
+        Returns:
+            - Tuple of (route, major) e.g.
+              ``("GET /channels/{channel_id}/polls/{id}/answers/{id}", "123")``.
+        """
+        segments = urlsplit(url).path.strip("/").split("/")
+        major = ""
+        template = []
+        previous = None
+        for segment in segments:
+            if cls._ID.match(segment):
+                if previous in cls.MAJOR_PARAMETERS and not major:
+                    major = segment
+                    template.append(f"{{{previous[:-1]}_id}}")
+                else:
+                    template.append("{id}")
+            else:
+                template.append(segment)
+            previous = segment
+        return f"{method.upper()} /{'/'.join(template)}", major
+
+    def get_bucket(self, method: str, url: str) -> Optional[RateLimitBucket]:
+        """
+        Returns the bucket a request maps to, or None if the route hasn't been seen yet.
+        """
+        route, major = self.route_key(method, url)
+        bucket_hash = self._routes.get(route)
+        if bucket_hash is None:
+            return None
+        return self._buckets.get((bucket_hash, major))
+
+    async def acquire(self, method: str, url: str):
+        """
+        Waits until the request's bucket (and the global limit) has capacity,
+        then reserves one request from it.
+
+        Waiters on the same bucket are released in FIFO order.
+        """
+        loop = asyncio.get_running_loop()
+        delay = self._global_reset - loop.time()
+        if delay > 0:
+            self.logger.debug(f"Global rate limit active, waiting {delay:.3f}s")
+            await asyncio.sleep(delay)
+
+        bucket = self.get_bucket(method, url)
+        if bucket is None or bucket.limit is None:
+            return
+
+        async with bucket.lock:
+            now = loop.time()
+            if bucket.remaining <= 0 and now < bucket.reset_at:
+                delay = bucket.reset_at - now
+                self.logger.debug(
+                    f"Bucket exhausted, waiting {delay:.3f}s before sending: {bucket}"
+                )
+                await asyncio.sleep(delay)
+                now = loop.time()
+            if now >= bucket.reset_at:
+                # The window has passed, assume the bucket was refilled until
+                # the next response tells us otherwise.
+                bucket.remaining = bucket.limit
+                bucket.reset_at = now + bucket.period
+            bucket.remaining -= 1
+
+    def update(self, method: str, url: str, headers: Mapping[str, str]):
+        """
+        Updates bucket state from the rate limit headers of a response.
+
+        Parameters:
+            - method (str): The HTTP method of the request.
+            - url (str): The full request URL.
+            - headers (Mapping[str, str]): The response headers.
+        """
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if not bucket_hash:
+            return
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+        except (KeyError, ValueError):
+            return
+
+        route, major = self.route_key(method, url)
+        self._routes[route] = bucket_hash
+        key = (bucket_hash, major)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = RateLimitBucket(key)
+
+        now = asyncio.get_running_loop().time()
+        reset_at = now + reset_after
+        bucket.limit = limit
+        bucket.period = max(bucket.period, reset_after)
+        if bucket.remaining is None or now >= bucket.reset_at:
+            bucket.remaining = remaining
+            bucket.reset_at = reset_at
+        else:
+            # Responses can arrive out of order; never hand back capacity
+            # that other in-flight requests have already reserved.
+            bucket.remaining = min(bucket.remaining, remaining)
+            bucket.reset_at = max(bucket.reset_at, reset_at)
+
+    def rate_limited(
+        self,
+        method: str,
+        url: str,
+        retry_after: float,
+        is_global: bool = False,
+    ):
+        """
+        Records a 429 response so that queued requests back off together.
+
+        Returns:
+            - True if the wait will be enforced by ``acquire``, False if the route's
+              bucket is unknown and the caller has to back off by itself.
+        """
+        now = asyncio.get_running_loop().time()
+        if is_global:
+            self._global_reset = max(self._global_reset, now + retry_after)
+            return True
+        bucket = self.get_bucket(method, url)
+        if bucket is None or bucket.limit is None:
+            return False
+        bucket.remaining = 0
+        bucket.reset_at = max(bucket.reset_at, now + retry_after)
+        return True
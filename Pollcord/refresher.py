@@ -0,0 +1,258 @@
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from Pollcord._util import TokenBucket
+
+if TYPE_CHECKING:
+    from Pollcord import Poll, PollClient
+
+
+class _Tracked:
+    __slots__ = ("poll", "counts", "velocity", "refreshed_at", "interval", "callbacks")
+
+    def __init__(self, poll: Poll):
+        self.poll = poll
+        self.counts: Optional[List[int]] = None
+        self.velocity = 0.0  # votes per second, smoothed
+        self.refreshed_at = 0.0
+        self.interval = 0.0
+        self.callbacks: List[Callable] = []
+
+
+class AdaptiveRefresher:
+    """
+    Keeps the vote counts of many polls up to date within a request budget.
+
+    Each poll's refresh interval follows its vote velocity (an exponentially
+    weighted moving average of votes per second): busy polls are refreshed about
+    every ``target_votes`` new votes, quiet ones back off to ``max_interval``.
+    Intervals also shrink as a poll nears its end time, so final results aren't
+    stale. All refreshes share a token bucket of ``rate`` requests per second and
+    are driven by a single task over a heap of due times, so the most overdue poll
+    is always refreshed first.
+
+    Subscribers are called with ``(poll, counts)`` whenever a poll's counts change
+    (and after its first refresh). They may be sync or async.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(
+        self,
+        client: PollClient,
+        rate: float = 5.0,
+        burst: int = 10,
+        min_interval: float = 2.0,
+        max_interval: float = 300.0,
+        target_votes: float = 5.0,
+        smoothing: float = 0.3,
+    ):
+        """
+        Parameters:
+            - client (PollClient): Client used to fetch the counts.
+            - rate (float): Refresh requests per second across every poll.
+            - burst (int): Requests that may be sent at once after an idle period.
+            - min_interval (float): Shortest time between refreshes of a poll.
+            - max_interval (float): Longest time between refreshes of a poll.
+            - target_votes (float): Aim to refresh a poll about every this many votes.
+            - smoothing (float): EWMA weight of the latest velocity sample (0-1].
+        """
+        self.client = client
+        self.rate = rate
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_votes = target_votes
+        self.smoothing = smoothing
+        self.budget = TokenBucket(burst, rate)
+        self._tracked: Dict[Poll, _Tracked] = {}
+        self._heap: List[list] = []  # [due, sequence, tracked or None]
+        self._entries: Dict[Poll, list] = {}
+        self._counter = itertools.count()
+        self._subscribers: List[Callable] = []
+        self._driver: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._refreshing = set()
+
+    def __repr__(self):
+        return (
+            f"<AdaptiveRefresher polls={len(self._tracked)} rate={self.rate}/s "
+            f"running={self._driver is not None and not self._driver.done()}>"
+        )
+
+    def __len__(self):
+        return len(self._tracked)
+
+    def __contains__(self, poll: Poll):
+        return poll in self._tracked
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def subscribe(self, callback: Callable) -> Callable:
+        """
+        Registers a callback for every poll's updates. Can be used as a decorator.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def add(self, poll: Poll, callback: Optional[Callable] = None):
+        """
+        Starts refreshing a poll, right away.
+
+        Parameters:
+            - poll (Poll): The poll.
+            - callback (Optional[Callable]): Called with this poll's updates only.
+        """
+        tracked = self._tracked.get(poll)
+        if tracked is None:
+            tracked = self._tracked[poll] = _Tracked(poll)
+            poll._add_end_listener(self.__ended)
+            self.__schedule(tracked, 0)
+        if callback is not None:
+            tracked.callbacks.append(callback)
+
+    def remove(self, poll: Poll) -> bool:
+        """
+        Stops refreshing a poll.
+
+        Returns:
+            - True if the poll was being refreshed.
+        """
+        if self._tracked.pop(poll, None) is None:
+            return False
+        entry = self._entries.pop(poll, None)
+        if entry is not None:
+            entry[2] = None
+        return True
+
+    def counts(self, poll: Poll) -> Optional[List[int]]:
+        """The last counts fetched for a poll, or None before its first refresh."""
+        tracked = self._tracked.get(poll)
+        return (
+            None if tracked is None or tracked.counts is None else list(tracked.counts)
+        )
+
+    async def close(self):
+        """Stops the driver and waits for refreshes in progress to be cancelled."""
+        tasks = [*self._refreshing]
+        if self._driver is not None:
+            tasks.append(self._driver)
+            self._driver = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def next_interval(self, tracked: _Tracked) -> float:
+        """
+        Seconds until a poll's next refresh, from its velocity and time remaining.
+        """
+        if tracked.velocity > 0:
+            interval = self.target_votes / tracked.velocity
+        else:
+            interval = self.max_interval
+        # Refresh more often towards the end, to catch the final tally
+        remaining = tracked.poll._end_ts - time.time()
+        interval = min(interval, max(remaining / 4, 0))
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def __ended(self, poll: Poll):
+        # Fetch the final tally right away instead of at the next due time
+        entry = self._entries.get(poll)
+        if entry is not None:
+            entry[2] = None
+            self.__schedule(self._tracked[poll], 0)
+
+    def __schedule(self, tracked: _Tracked, delay: float):
+        loop = asyncio.get_running_loop()
+        entry = [loop.time() + delay, next(self._counter), tracked]
+        self._entries[tracked.poll] = entry
+        heapq.heappush(self._heap, entry)
+        driver = self._driver
+        if driver is None or driver.done():
+            self._wakeup = asyncio.Event()
+            self._driver = loop.create_task(self._run())
+        elif self._heap[0] is entry:
+            self._wakeup.set()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            while self._heap and self._heap[0][2] is None:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return
+
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if not self.budget.take():
+                # Out of budget, wait for the next token
+                await asyncio.sleep(self.budget.delay())
+                continue
+
+            _, _, tracked = heapq.heappop(self._heap)
+            if tracked is None:
+                continue
+            del self._entries[tracked.poll]
+            task = loop.create_task(self._refresh(tracked))
+            self._refreshing.add(task)
+            task.add_done_callback(self._refreshing.discard)
+
+    async def _refresh(self, tracked: _Tracked):
+        poll = tracked.poll
+        try:
+            counts = await self.client.get_vote_counts(poll)
+        except Exception as e:
+            self.logger.warning(f"Refreshing poll {poll.message_id} failed: {e!r}")
+            tracked.interval = min(
+                self.max_interval, max(self.min_interval, tracked.interval * 2)
+            )
+        else:
+            now = time.monotonic()
+            previous = tracked.counts
+            if previous is None:
+                # First sample: average velocity since the poll started
+                age = max(time.time() - poll._start_ts, 1.0)
+                tracked.velocity = sum(counts) / age
+            else:
+                elapsed = max(now - tracked.refreshed_at, 1e-3)
+                votes = sum(abs(new - old) for new, old in zip(counts, previous))
+                tracked.velocity += self.smoothing * (
+                    votes / elapsed - tracked.velocity
+                )
+            tracked.counts = counts
+            tracked.refreshed_at = now
+            tracked.interval = self.next_interval(tracked)
+            if counts != previous:
+                await self.__notify(tracked, counts)
+
+        if self._tracked.get(poll) is not tracked:
+            return  # removed meanwhile
+        if poll.ended:
+            self.remove(poll)
+            return
+        self.__schedule(tracked, tracked.interval)
+
+    async def __notify(self, tracked: _Tracked, counts: List[int]):
+        for callback in (*self._subscribers, *tracked.callbacks):
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(tracked.poll, list(counts))
+                else:
+                    callback(tracked.poll, list(counts))
+            except Exception as e:
+                self.logger.exception(f"Error in refresh subscriber: {e}")
@@ -0,0 +1,111 @@
+from __future__ import annotations
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from Pollcord import Poll
+
+
+class PollRegistry:
+    """
+    Index of a client's live polls by message id and channel id.
+
+    Polls are only weakly referenced, and are evicted as soon as they end. Up to
+    ``recent_size`` ended polls are kept (strongly) in an LRU so late lookups, e.g.
+    for a vote event that raced the poll's end, still find them. Ids are compared as
+    strings, so ``123`` and ``"123"`` find the same poll.
+    """
+
+    def __init__(self, recent_size: int = 0):
+        """
+        Parameters:
+            - recent_size (int): Number of recently ended polls to keep. 0 disables it.
+        """
+        self.recent_size = recent_size
+        self._by_message: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._by_channel: Dict[str, weakref.WeakSet] = {}
+        self._recent: OrderedDict = OrderedDict()
+
+    def __repr__(self):
+        return f"<PollRegistry live={len(self)} recent={len(self._recent)}>"
+
+    def __len__(self):
+        return len(self._by_message)
+
+    def __contains__(self, message_id) -> bool:
+        return str(message_id) in self._by_message
+
+    def __iter__(self) -> Iterator[Poll]:
+        """Iterates over the live polls."""
+        return iter(list(self._by_message.values()))
+
+    def add(self, poll: Poll):
+        """
+        Indexes a poll until it ends. Ended polls are only added to the recent LRU.
+        """
+        if poll.ended:
+            self.__remember(poll)
+            return
+        self._by_message[str(poll.message_id)] = poll
+        channel_id = str(poll.channel_id)
+        polls = self._by_channel.get(channel_id)
+        if polls is None:
+            polls = self._by_channel[channel_id] = weakref.WeakSet()
+        polls.add(poll)
+        poll._add_end_listener(self._evict)
+
+    def get(self, message_id) -> Optional[Poll]:
+        """
+        Returns:
+            - The live poll with this message id, else a recently ended one, else None.
+        """
+        key = str(message_id)
+        poll = self._by_message.get(key)
+        if poll is None:
+            poll = self._recent.get(key)
+            if poll is not None:
+                self._recent.move_to_end(key)
+        return poll
+
+    def in_channel(self, channel_id) -> List[Poll]:
+        """Returns the live polls of a channel."""
+        key = str(channel_id)
+        polls = self._by_channel.get(key)
+        if polls is None:
+            return []
+        if not polls:
+            # Every poll of the channel was garbage collected
+            del self._by_channel[key]
+            return []
+        return list(polls)
+
+    def recent(self) -> List[Poll]:
+        """Returns the recently ended polls that are still kept, oldest first."""
+        return list(self._recent.values())
+
+    def clear(self):
+        self._by_message.clear()
+        self._by_channel.clear()
+        self._recent.clear()
+
+    def _evict(self, poll: Poll):
+        key = str(poll.message_id)
+        if self._by_message.get(key) is poll:
+            del self._by_message[key]
+        channel_id = str(poll.channel_id)
+        polls = self._by_channel.get(channel_id)
+        if polls is not None:
+            polls.discard(poll)
+            if not polls:
+                del self._by_channel[channel_id]
+        self.__remember(poll)
+
+    def __remember(self, poll: Poll):
+        if not self.recent_size:
+            return
+        key = str(poll.message_id)
+        self._recent[key] = poll
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.recent_size:
+            self._recent.popitem(last=False)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+import functools
+import heapq
+from array import array
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from Pollcord._util import gather_limited
+
+try:
+    import numpy as np
+except ImportError:  # optional, ``pip install Pollcord[numpy]``
+    np = None
+
+if TYPE_CHECKING:
+    from Pollcord import Poll, PollClient
+
+
+class PollResults:
+    """
+    Vote data of many polls in array form, for aggregating across polls.
+
+    Counts are kept as a (polls x options) matrix, padded with zeros for polls with
+    fewer options. When voters were fetched, each poll also keeps its voters as a
+    sorted array of unique user ids, so unique voters of multiselect polls are
+    counted without Python sets.
+
+    NumPy is used when it's installed (methods then return NumPy arrays); otherwise
+    the same methods work on ``array`` buffers and return lists.
+    """
+
+    def __init__(
+        self,
+        polls: Sequence[Poll],
+        counts: Sequence[Sequence[int]],
+        voters: Optional[Sequence[Sequence[int]]] = None,
+        use_numpy: Optional[bool] = None,
+    ):
+        """
+        Parameters:
+            - polls (Sequence[Poll]): The polls, one per row.
+            - counts (Sequence[Sequence[int]]): Votes per option of every poll.
+            - voters (Optional[Sequence[Sequence[int]]]): Every poll's voter ids (any
+              order, repeats allowed). Needed for the unique voter counts.
+            - use_numpy (Optional[bool]): Force or disable NumPy. Defaults to using it
+              when installed.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is not installed, pip install Pollcord[numpy]")
+        self.polls = list(polls)
+        self.use_numpy = use_numpy
+        self.width = max((len(poll.options) for poll in self.polls), default=0)
+
+        if use_numpy:
+            self.counts = np.zeros((len(self.polls), self.width), dtype=np.int64)
+            for row, poll_counts in enumerate(counts):
+                self.counts[row, : len(poll_counts)] = poll_counts
+        else:
+            self.counts = []
+            for poll_counts in counts:
+                row = array("q", poll_counts)
+                row.extend([0] * (self.width - len(row)))
+                self.counts.append(row)
+
+        self.voters = None
+        if voters is not None:
+            if use_numpy:
+                self.voters = [
+                    np.unique(np.asarray(ids, dtype=np.uint64)) for ids in voters
+                ]
+            else:
+                self.voters = [array("Q", sorted(set(ids))) for ids in voters]
+
+    def __repr__(self):
+        return (
+            f"<PollResults polls={len(self.polls)} options={self.width} "
+            f"{'numpy' if self.use_numpy else 'python'}>"
+        )
+
+    def __len__(self):
+        return len(self.polls)
+
+    @classmethod
+    def from_users(
+        cls,
+        polls: Sequence[Poll],
+        users: Sequence[Sequence[Sequence[Any]]],
+        use_numpy: Optional[bool] = None,
+    ) -> PollResults:
+        """
+        Builds results from ``get_vote_users`` or ``get_vote_user_ids`` output, one
+        entry per poll. Users may be user objects or ids.
+        """
+        counts = []
+        voters = []
+        for options in users:
+            counts.append([len(option) for option in options])
+            voters.append(
+                [
+                    int(user["id"]) if isinstance(user, dict) else int(user)
+                    for option in options
+                    for user in option
+                ]
+            )
+        return cls(polls, counts, voters, use_numpy=use_numpy)
+
+    @classmethod
+    async def fetch(
+        cls,
+        client: PollClient,
+        polls: Sequence[Poll],
+        voters: bool = False,
+        concurrency: Optional[int] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> PollResults:
+        """
+        Fetches the results of many polls, at most ``concurrency`` polls at a time.
+
+        Parameters:
+            - client (PollClient): The client to fetch with.
+            - polls (Sequence[Poll]): The polls.
+            - voters (bool): Fetch every voter (needed for unique voter counts)
+              instead of just the counts.
+            - concurrency (Optional[int]): Defaults to the client's ``max_concurrency``.
+        """
+        fetch = client.get_vote_user_ids if voters else client.get_vote_counts
+        data = await gather_limited(
+            [functools.partial(fetch, poll) for poll in polls],
+            concurrency or client.max_concurrency,
+        )
+        if voters:
+            return cls.from_users(polls, data, use_numpy=use_numpy)
+        return cls(polls, data, use_numpy=use_numpy)
+
+    def totals(self):
+        """Votes cast in each poll."""
+        if self.use_numpy:
+            return self.counts.sum(axis=1)
+        return [sum(row) for row in self.counts]
+
+    def option_totals(self):
+        """Votes per option position summed over every poll."""
+        if self.use_numpy:
+            return self.counts.sum(axis=0)
+        return [sum(column) for column in zip(*self.counts)]
+
+    def shares(self):
+        """
+        Each option's share of its poll's votes (rows sum to 1, or 0 for polls
+        without votes).
+        """
+        if self.use_numpy:
+            totals = self.counts.sum(axis=1, keepdims=True)
+            return np.divide(
+                self.counts,
+                totals,
+                out=np.zeros(self.counts.shape, dtype=np.float64),
+                where=totals > 0,
+            )
+        shares = []
+        for row in self.counts:
+            total = sum(row)
+            shares.append([count / total if total else 0.0 for count in row])
+        return shares
+
+    def top_k(self, k: int = 1):
+        """
+        Indices of the ``k`` options with the most votes in every poll, best first.
+        Ties go to the lower index.
+        """
+        k = min(k, self.width)
+        if self.use_numpy:
+            # Stable sort on negated counts keeps ties in index order
+            return np.argsort(-self.counts, axis=1, kind="stable")[:, :k]
+        return [
+            heapq.nsmallest(k, range(len(row)), key=lambda i, row=row: (-row[i], i))
+            for row in self.counts
+        ]
+
+    def winners(self):
+        """The index of the option with the most votes in every poll."""
+        top = self.top_k(1)
+        if self.use_numpy:
+            return top[:, 0]
+        return [row[0] for row in top]
+
+    def unique_voters(self):
+        """
+        Number of distinct users who voted in each poll. Differs from ``totals`` for
+        multiselect polls.
+        """
+        self.__require_voters()
+        if self.use_numpy:
+            return np.fromiter(
+                (len(ids) for ids in self.voters),
+                dtype=np.int64,
+                count=len(self.voters),
+            )
+        return [len(ids) for ids in self.voters]
+
+    def total_unique_voters(self) -> int:
+        """Number of distinct users who voted in any of the polls."""
+        self.__require_voters()
+        if not self.voters:
+            return 0
+        if self.use_numpy:
+            return int(np.unique(np.concatenate(self.voters)).size)
+        # Merge the sorted arrays and count distinct ids
+        count = 0
+        previous = None
+        for user_id in heapq.merge(*self.voters):
+            if user_id != previous:
+                count += 1
+                previous = user_id
+        return count
+
+    def __require_voters(self):
+        if self.voters is None:
+            raise ValueError(
+                "Voters weren't fetched, use PollResults.fetch(..., voters=True)"
+            )
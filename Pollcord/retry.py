@@ -0,0 +1,210 @@
+from __future__ import annotations
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Iterable, Optional
+
+import aiohttp
+
+from Pollcord._util import TokenBucket
+from Pollcord.error import CircuitOpenError
+
+
+class RetryBudget(TokenBucket):
+    """
+    Token bucket that caps how many retries are sent across all requests.
+
+    Every retry spends a token; tokens refill at a fixed rate. Once the budget is
+    spent, failures are raised instead of retried, so a degraded Discord isn't
+    hit with a multiple of the normal traffic.
+    """
+
+    def __init__(self, capacity: int = 50, refill_per_second: float = 5.0):
+        super().__init__(capacity, refill_per_second)
+
+    def __repr__(self):
+        return f"<RetryBudget {self.tokens:.1f}/{self.capacity}>"
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.rate
+
+    def spend(self) -> bool:
+        """
+        Returns:
+            - True if a retry may be sent, False if the budget is exhausted.
+        """
+        return self.take()
+
+
+class CircuitBreaker:
+    """
+    Per-route circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and requests
+    fail fast with ``CircuitOpenError`` for ``recovery_timeout`` seconds. Then a
+    single trial request is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(
+        self, route: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ):
+        self.route = route
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+
+    def __repr__(self):
+        return f"<CircuitBreaker {self.route} {self.state} failures={self.failures}>"
+
+    def before_request(self):
+        """
+        Raises:
+            - CircuitOpenError: If the circuit is open and the request must not be sent.
+        """
+        if self.state == self.CLOSED:
+            return
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Circuit open for {self.route}, retry in {remaining:.1f}s"
+                )
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        now = time.monotonic()
+        # A trial that never reported back (e.g. cancelled) stops blocking eventually
+        if self._trial_in_flight and now - self._trial_started < self.recovery_timeout:
+            raise CircuitOpenError(
+                f"Circuit half-open for {self.route}, waiting on a trial request"
+            )
+        self._trial_in_flight = True
+        self._trial_started = now
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            self.logger.info(f"Circuit closed again for {self.route}")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.logger.warning(
+                    f"Circuit opened for {self.route} after {self.failures} failures"
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to back off.
+
+    Server errors (5xx) and transient network errors are retried with exponential
+    backoff and full jitter, limited per request by ``max_retries`` and across all
+    requests by a shared ``RetryBudget``. Requests that aren't idempotent (POST)
+    are only retried when the connection couldn't be made, so a poll is never
+    created twice. Every route gets its own ``CircuitBreaker``.
+
+    429s are handled separately by the rate limiter.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay: float = 0.25,
+        max_delay: float = 10.0,
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        """
+        Parameters:
+            - max_retries (int): Retries per request for server and network errors.
+            - base_delay (float): Backoff ceiling of the first retry, doubled every retry.
+            - max_delay (float): Upper bound of the backoff ceiling.
+            - retry_statuses (Iterable[int]): Response statuses that are retried.
+            - budget (Optional[RetryBudget]): Retry budget shared by every request.
+            - failure_threshold (int): Consecutive failures that open a route's circuit.
+            - recovery_timeout (float): Seconds a circuit stays open.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget if budget is not None else RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def __repr__(self):
+        return (
+            f"<RetryPolicy max_retries={self.max_retries} base_delay={self.base_delay}s "
+            f"{self.budget}>"
+        )
+
+    def breaker(self, route: str) -> CircuitBreaker:
+        breaker = self._breakers.get(route)
+        if breaker is None:
+            breaker = self._breakers[route] = CircuitBreaker(
+                route, self.failure_threshold, self.recovery_timeout
+            )
+        return breaker
+
+    def is_failure(self, status: int) -> bool:
+        """Whether a response status counts against the route's circuit."""
+        return status >= 500
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """
+        Whether a request that failed with ``status`` or ``error`` is sent again.
+        ``attempt`` is the number of retries already made. Spends from the budget
+        when it returns True.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            if method.upper() in self.IDEMPOTENT_METHODS:
+                retryable = isinstance(
+                    error, (aiohttp.ClientError, asyncio.TimeoutError)
+                )
+            else:
+                retryable = isinstance(error, aiohttp.ClientConnectorError)
+        else:
+            retryable = (
+                status in self.retry_statuses
+                and method.upper() in self.IDEMPOTENT_METHODS
+            )
+        return retryable and self.budget.spend()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns:
+            - Seconds to wait before retry number ``attempt`` (0-based), with full jitter.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
@@ -0,0 +1,171 @@
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import weakref
+from typing import TYPE_CHECKING, Dict, List, Optional
+from Pollcord.metrics import MetricsHook
+
+if TYPE_CHECKING:
+    from Pollcord import Poll
+
+
+class ExpiryScheduler:
+    """
+    Ends polls when their duration runs out, using a single driver task.
+
+    Deadlines are kept in a heap, so scheduling is O(log n) and cancelling is
+    O(1) (cancelled entries are dropped lazily when they reach the top). The
+    driver wakes up on ``resolution``-second ticks and ends every poll that
+    expired within the same tick as one batch.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    _defaults = weakref.WeakKeyDictionary()  # event loop -> scheduler
+
+    def __init__(self, resolution: float = 0.5, metrics: Optional[MetricsHook] = None):
+        """
+        Parameters:
+            - resolution (float): Tick length in seconds. Polls are ended at most this
+              late, and polls expiring within the same tick are ended together.
+            - metrics (Optional[MetricsHook]): Receives the number of scheduled polls.
+        """
+        self.resolution = resolution
+        self.metrics = metrics if metrics is not None else MetricsHook()
+        self._heap: List[list] = []  # [deadline, sequence, poll or None]
+        self._entries: Dict[Poll, list] = {}
+        self._counter = itertools.count()
+        self._driver: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._firing = set()
+        self.closed = False
+
+    def __repr__(self):
+        return f"<ExpiryScheduler scheduled={len(self)} resolution={self.resolution}s>"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, poll: Poll):
+        return poll in self._entries
+
+    @classmethod
+    def default(cls) -> ExpiryScheduler:
+        """
+        Returns the shared scheduler of the running event loop.
+
+        Used by polls started without an explicit scheduler.
+        """
+        loop = asyncio.get_running_loop()
+        scheduler = cls._defaults.get(loop)
+        if scheduler is None:
+            scheduler = cls._defaults[loop] = cls()
+        return scheduler
+
+    def schedule(self, poll: Poll, delay: float):
+        """
+        Schedules a poll to be ended after ``delay`` seconds.
+
+        Rescheduling a poll replaces its previous deadline. Polls scheduled after
+        ``close`` are logged and not ended automatically.
+        """
+        if self.closed:
+            self.logger.warning(
+                f"Not scheduling poll({poll}) for expiry: the scheduler is closed"
+            )
+            return
+        loop = asyncio.get_running_loop()
+        self.cancel(poll)
+        entry = [loop.time() + delay, next(self._counter), poll]
+        self._entries[poll] = entry
+        heapq.heappush(self._heap, entry)
+        self.metrics.scheduler_backlog(len(self._entries))
+        self._ensure_driver(loop)
+        if self._heap[0] is entry:
+            # New earliest deadline, the driver has to sleep less
+            self._wakeup.set()
+
+    def cancel(self, poll: Poll) -> bool:
+        """
+        Removes a poll from the schedule.
+
+        Returns:
+            - True if the poll was scheduled.
+        """
+        entry = self._entries.pop(poll, None)
+        if entry is None:
+            return False
+        entry[2] = None
+        self.metrics.scheduler_backlog(len(self._entries))
+        # Don't let cancelled entries dominate the heap
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [e for e in self._heap if e[2] is not None]
+            heapq.heapify(self._heap)
+        return True
+
+    async def close(self):
+        """
+        Stops the driver and forgets every scheduled poll, so none of them is ended
+        by the scheduler anymore. Batches that are being ended are cancelled.
+        """
+        self.closed = True
+        self._heap.clear()
+        self._entries.clear()
+        self.metrics.scheduler_backlog(0)
+        tasks = list(self._firing)
+        if self._driver is not None:
+            tasks.append(self._driver)
+            self._driver = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _ensure_driver(self, loop: asyncio.AbstractEventLoop):
+        driver = self._driver
+        if driver is not None and not driver.done() and driver.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._driver = loop.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            while self._heap and self._heap[0][2] is None:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return
+
+            now = loop.time()
+            deadline = self._heap[0][0]
+            if deadline > now:
+                wake_at = math.ceil(deadline / self.resolution) * self.resolution
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wake_at - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            batch = []
+            while self._heap and self._heap[0][0] <= now:
+                _, _, poll = heapq.heappop(self._heap)
+                if poll is not None:
+                    del self._entries[poll]
+                    batch.append(poll)
+            if batch:
+                self.metrics.scheduler_backlog(len(self._entries))
+                self.logger.debug(f"Ending {len(batch)} expired poll(s)")
+                task = loop.create_task(self._fire(batch))
+                self._firing.add(task)
+                task.add_done_callback(self._firing.discard)
+
+    async def _fire(self, batch: List[Poll]):
+        results = await asyncio.gather(
+            *(poll.end() for poll in batch), return_exceptions=True
+        )
+        for poll, result in zip(batch, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error while ending poll({poll}): {result}")
@@ -0,0 +1,439 @@
+from __future__ import annotations
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import os
+import socket
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from Pollcord._util import TokenBucket
+from Pollcord.ratelimit import RateLimiter
+
+Address = Union[str, Tuple[str, int]]  # unix socket path, or (host, port)
+
+RATE_LIMIT_HEADERS = (
+    "X-RateLimit-Bucket",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset-After",
+)
+
+
+class RateLimitCoordinator:
+    """
+    Serves a single RateLimiter to several processes over a local socket.
+
+    Every process talks to it through a SharedRateLimiter, so requests from all of
+    them draw from the same buckets and back off together after a (global) 429.
+    Every request also takes a token from a shared global bucket first, so the
+    processes together stay under Discord's global limit even on routes whose
+    bucket hasn't been seen yet.
+    The protocol is one JSON object per line. Only ``acquire`` is answered (with its
+    ``id``, once capacity was reserved); ``update`` and ``rate_limited`` only change
+    the shared state.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        address: Optional[Address] = None,
+        global_rate: Optional[float] = 50.0,
+    ):
+        """
+        Parameters:
+            - rate_limiter (Optional[RateLimiter]): The shared state.
+            - address (Optional[Address]): Where to listen. Defaults to a unix socket
+              in a temporary directory, or a free localhost port without unix sockets.
+            - global_rate (Optional[float]): Requests per second across every process,
+              evenly spaced. None disables the cap.
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.address = address
+        self.global_limit = (
+            TokenBucket(1, global_rate) if global_rate is not None else None
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __repr__(self):
+        return f"<RateLimitCoordinator address={self.address!r} {self.rate_limiter}>"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self) -> Address:
+        """
+        Starts listening.
+
+        Returns:
+            - The address to pass to SharedRateLimiter.
+        """
+        if self.address is None:
+            if hasattr(socket, "AF_UNIX"):
+                self._tmpdir = tempfile.TemporaryDirectory(prefix="pollcord-")
+                self.address = os.path.join(self._tmpdir.name, "ratelimit.sock")
+            else:
+                self.address = ("127.0.0.1", 0)
+
+        if isinstance(self.address, str):
+            self._server = await asyncio.start_unix_server(self._handle, self.address)
+        else:
+            self._server = await asyncio.start_server(self._handle, *self.address)
+            self.address = self._server.sockets[0].getsockname()[:2]
+        self.logger.info(f"Rate limit coordinator listening on {self.address}")
+        return self.address
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        pending = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                op = message["op"]
+                if op == "update":
+                    self.rate_limiter.update(
+                        message["method"], message["url"], message["headers"]
+                    )
+                elif op == "rate_limited":
+                    self.rate_limiter.rate_limited(
+                        message["method"],
+                        message["url"],
+                        message["retry_after"],
+                        is_global=message["global"],
+                    )
+                elif op == "acquire":
+                    # Waits can be long, keep reading other requests meanwhile
+                    task = asyncio.ensure_future(self._acquire(writer, message))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+        except (ConnectionError, ValueError) as e:
+            self.logger.warning(f"Rate limit coordinator dropped a client: {e!r}")
+        finally:
+            for task in pending:
+                task.cancel()
+            writer.close()
+
+    async def _acquire(self, writer: asyncio.StreamWriter, message: dict):
+        if self.global_limit is not None:
+            await self.global_limit.acquire()
+        await self.rate_limiter.acquire(message["method"], message["url"])
+        if not writer.is_closing():
+            writer.write(json.dumps({"id": message["id"]}).encode() + b"\n")
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    RateLimiter that defers to a RateLimitCoordinator in another process.
+
+    Pass it as ``PollClient(rate_limiter=...)``. ``acquire`` waits on the shared
+    buckets; ``update`` and ``rate_limited`` are forwarded and also kept locally.
+    If the coordinator can't be reached, the limiter falls back to its local state.
+    """
+
+    def __init__(self, address: Address):
+        super().__init__()
+        self.address = address
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count()
+
+    def __repr__(self):
+        return (
+            f"<SharedRateLimiter address={self.address!r} "
+            f"connected={self._writer is not None}>"
+        )
+
+    async def acquire(self, method: str, url: str):
+        try:
+            await self.__connect()
+            waiter = asyncio.get_running_loop().create_future()
+            id = next(self._ids)
+            self._pending[id] = waiter
+            self.__send({"op": "acquire", "id": id, "method": method, "url": url})
+            try:
+                await waiter
+            finally:
+                self._pending.pop(id, None)
+        except OSError as e:
+            self.logger.warning(
+                f"Rate limit coordinator unavailable ({e!r}), limiting locally"
+            )
+            await super().acquire(method, url)
+
+    def update(self, method: str, url: str, headers: Mapping[str, str]):
+        super().update(method, url, headers)
+        forwarded = {
+            name: headers[name] for name in RATE_LIMIT_HEADERS if name in headers
+        }
+        if forwarded:
+            self.__send(
+                {"op": "update", "method": method, "url": url, "headers": forwarded}
+            )
+
+    def rate_limited(
+        self,
+        method: str,
+        url: str,
+        retry_after: float,
+        is_global: bool = False,
+    ):
+        # The answer has to be synchronous, so it comes from the local view. The
+        # coordinator applies the same backoff for every other process.
+        self.__send(
+            {
+                "op": "rate_limited",
+                "method": method,
+                "url": url,
+                "retry_after": retry_after,
+                "global": is_global,
+            }
+        )
+        return super().rate_limited(method, url, retry_after, is_global=is_global)
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._writer is not None:
+            self._writer.close()
+        self.__disconnect()
+
+    async def __connect(self):
+        if self._writer is not None:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._writer is not None:
+                return
+            if isinstance(self.address, str):
+                reader, writer = await asyncio.open_unix_connection(self.address)
+            else:
+                reader, writer = await asyncio.open_connection(*self.address)
+            self._reader, self._writer = reader, writer
+            self._listener = asyncio.ensure_future(self.__listen(reader))
+
+    async def __listen(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                waiter = self._pending.get(message["id"])
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(None)
+        except (ConnectionError, ValueError) as e:
+            self.logger.warning(f"Lost the rate limit coordinator: {e!r}")
+        finally:
+            if self._reader is reader:
+                self.__disconnect()
+
+    def __send(self, message: dict):
+        if self._writer is None or self._writer.is_closing():
+            return
+        self._writer.write(json.dumps(message).encode() + b"\n")
+
+    def __disconnect(self):
+        self._reader = self._writer = self._listener = None
+        for waiter in self._pending.values():
+            if not waiter.done():
+                waiter.set_exception(ConnectionError("Rate limit coordinator closed"))
+
+
+def shard_of(channel_id: Any, shards: int) -> int:
+    """
+    The shard a channel belongs to. Stable across processes and runs.
+    """
+    channel_id = str(channel_id)
+    if channel_id.isdigit():
+        return int(channel_id) % shards
+    return zlib.crc32(channel_id.encode()) % shards
+
+
+Handler = Callable[..., Awaitable[Any]]
+
+
+def _run_shard(
+    token: str,
+    address: Address,
+    handler: Handler,
+    shard: int,
+    items: List[Any],
+    client_options: Dict[str, Any],
+):
+    from Pollcord.client import PollClient
+
+    async def main():
+        rate_limiter = SharedRateLimiter(address)
+        try:
+            async with PollClient(
+                token, rate_limiter=rate_limiter, **client_options
+            ) as client:
+                return await handler(client, shard, items)
+        finally:
+            await rate_limiter.close()
+
+    return asyncio.run(main())
+
+
+class ShardedRunner:
+    """
+    Splits work across worker processes by channel id.
+
+    Every worker process runs its own PollClient on its own event loop and calls
+    ``handler(client, shard, items)`` with the items of its channels. The clients
+    share one rate limit state through a RateLimitCoordinator in the calling
+    process, so together they respect the buckets they've seen, back off together
+    after a 429, and send at most ``global_rate`` requests per second.
+
+    ``handler`` must be a module-level coroutine function, and ``items`` and the
+    handler's results must be picklable, since they cross process boundaries.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(
+        self,
+        token: str,
+        handler: Handler,
+        shards: Optional[int] = None,
+        client_options: Optional[Dict[str, Any]] = None,
+        start_method: str = "spawn",
+        global_rate: Optional[float] = 50.0,
+    ):
+        """
+        Parameters:
+            - token (str): The bot token.
+            - handler (Handler): ``async def handler(client, shard, items)``.
+            - shards (Optional[int]): Number of worker processes, defaults to the CPU count.
+            - client_options (Optional[Dict[str, Any]]): Extra PollClient arguments.
+            - start_method (str): multiprocessing start method for the workers.
+            - global_rate (Optional[float]): Requests per second across every worker.
+        """
+        self.token = token
+        self.handler = handler
+        self.shards = shards or os.cpu_count() or 1
+        self.client_options = client_options or {}
+        self.start_method = start_method
+        self.global_rate = global_rate
+
+    def __repr__(self):
+        return f"<ShardedRunner shards={self.shards}>"
+
+    def split(
+        self, items: Iterable[Any], key: Optional[Callable[[Any], Any]] = None
+    ) -> List[List[Any]]:
+        """
+        Groups items by the shard of their channel id, keeping their order.
+
+        Parameters:
+            - key (Optional[Callable]): Returns an item's channel id. Defaults to
+              ``item.channel_id`` (or ``item["channel_id"]`` for mappings).
+        """
+        if key is None:
+            key = _channel_id
+        shards: List[List[Any]] = [[] for _ in range(self.shards)]
+        for item in items:
+            shards[shard_of(key(item), self.shards)].append(item)
+        return shards
+
+    async def run(
+        self, items: Iterable[Any], key: Optional[Callable[[Any], Any]] = None
+    ) -> List[Any]:
+        """
+        Runs the handler over ``items`` in the worker processes.
+
+        Returns:
+            - The handler's result per shard, None for shards without items.
+        Raises:
+            - The first shard's error, if any handler raised. The other shards are
+              still run to completion first.
+        """
+        shards = self.split(items, key)
+        busy = [index for index, shard in enumerate(shards) if shard]
+        results: List[Any] = [None] * self.shards
+        if not busy:
+            return results
+
+        loop = asyncio.get_running_loop()
+        async with RateLimitCoordinator(global_rate=self.global_rate) as coordinator:
+            pool = ProcessPoolExecutor(
+                max_workers=len(busy), mp_context=get_context(self.start_method)
+            )
+            try:
+                self.logger.info(
+                    f"Running {sum(map(len, shards))} items on {len(busy)} shards"
+                )
+                # A failing shard mustn't stop the others: they still need the
+                # coordinator, which is served by this loop, to finish.
+                done = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool,
+                            _run_shard,
+                            self.token,
+                            coordinator.address,
+                            self.handler,
+                            index,
+                            shards[index],
+                            self.client_options,
+                        )
+                        for index in busy
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                # Waiting for the workers to exit blocks, so keep it off the loop
+                await loop.run_in_executor(
+                    None,
+                    functools.partial(pool.shutdown, wait=True, cancel_futures=True),
+                )
+        for result in done:
+            if isinstance(result, BaseException):
+                raise result
+        for index, result in zip(busy, done):
+            results[index] = result
+        return results
+
+
+def _channel_id(item: Any) -> Any:
+    if isinstance(item, Mapping):
+        return item["channel_id"]
+    return item.channel_id
@@ -0,0 +1,148 @@
+from __future__ import annotations
+import json
+import logging
+import sqlite3
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from Pollcord import Poll
+
+
+class PollRecord(NamedTuple):
+    """A persisted poll, as loaded from a PollStore."""
+
+    channel_id: int
+    message_id: int
+    prompt: str
+    options: List[str]
+    start_ts: float
+    end_ts: float
+    duration: float
+    isMultiselect: bool
+    callback_key: Optional[str]
+
+
+class SQLitePollStore:
+    """
+    SQLite-backed record of live polls, used to rehydrate them after a restart.
+
+    Pass it to ``PollClient(store=...)``: polls created by the client are saved,
+    removed again once they end, and ``PollClient.rehydrate`` loads them back.
+    Callbacks can't be persisted, so each poll stores a ``callback_key`` that is
+    resolved against a mapping of callbacks on rehydration.
+    """
+
+    logger = logging.getLogger("pollcord")
+
+    # Columns are untyped so ids keep whatever type (int or str) they were saved with
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS polls (
+            message_id PRIMARY KEY,
+            channel_id,
+            prompt,
+            options,
+            start_ts REAL,
+            end_ts REAL,
+            duration,
+            multiselect,
+            callback_key
+        )
+    """
+
+    def __init__(self, path: str = "pollcord.db"):
+        """
+        Parameters:
+            - path (str): Path of the database file, or ``":memory:"``.
+        """
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(self.SCHEMA)
+        self._db.commit()
+
+    def __repr__(self):
+        return f"<SQLitePollStore {self.path!r}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM polls").fetchone()[0]
+
+    def add(self, poll: Poll, callback_key: Optional[str] = None):
+        """Saves (or replaces) a poll."""
+        self.add_many([(poll, callback_key)])
+
+    def add_many(self, polls: Iterable[tuple]):
+        """Saves many ``(poll, callback_key)`` pairs in a single transaction."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO polls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        poll.message_id,
+                        poll.channel_id,
+                        poll.prompt,
+                        json.dumps(list(poll.options)),
+                        poll._start_ts,
+                        poll._end_ts,
+                        poll.duration,
+                        int(poll.isMultiselect),
+                        callback_key,
+                    )
+                    for poll, callback_key in polls
+                ],
+            )
+
+    def remove(self, message_id):
+        """Forgets a poll, e.g. because it ended."""
+        self.remove_many([message_id])
+
+    def remove_many(self, message_ids: Iterable):
+        """Forgets many polls in a single transaction."""
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM polls WHERE message_id = ?",
+                [(message_id,) for message_id in message_ids],
+            )
+
+    def load(self) -> List[PollRecord]:
+        """
+        Returns:
+            - Every stored poll, ordered by end time.
+        """
+        rows = self._db.execute(
+            "SELECT channel_id, message_id, prompt, options, start_ts, end_ts,"
+            " duration, multiselect, callback_key FROM polls ORDER BY end_ts"
+        ).fetchall()
+        return [
+            PollRecord(
+                channel_id,
+                message_id,
+                prompt,
+                json.loads(options),
+                start_ts,
+                end_ts,
+                duration,
+                bool(multiselect),
+                callback_key,
+            )
+            for (
+                channel_id,
+                message_id,
+                prompt,
+                options,
+                start_ts,
+                end_ts,
+                duration,
+                multiselect,
+                callback_key,
+            ) in rows
+        ]
+
+    def close(self):
+        self._db.close()
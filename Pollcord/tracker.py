@@ -0,0 +1,172 @@
+from __future__ import annotations
+import asyncio
+import functools
+import logging
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+from Pollcord._util import gather_limited
+
+if TYPE_CHECKING:
+    from Pollcord import Poll, PollClient
+
+
+class VoteDelta(NamedTuple):
+    """Votes that changed between two refreshes, as (option index, user id) pairs."""
+
+    added: List[Tuple[int, int]]
+    removed: List[Tuple[int, int]]
+
+    def __bool__(self):
+        return bool(self.added or self.removed)
+
+
+class VoteTracker:
+    """
+    Keeps the voters of a poll as per-option sets of integer user ids and reports
+    only what changed between refreshes.
+
+    Handlers registered with ``on`` receive ``(poll, option_index, user_id)`` and may
+    be sync or async, like a poll's ``on_end`` callback.
+    """
+
+    VOTE_ADDED = "vote_added"
+    VOTE_REMOVED = "vote_removed"
+
+    logger = logging.getLogger("pollcord")
+
+    def __init__(self, client: PollClient, poll: Poll, emit_initial: bool = True):
+        """
+        Parameters:
+            - client (PollClient): Client used to fetch voters.
+            - poll (Poll): The poll to track.
+            - emit_initial (bool): Whether the first refresh reports every existing
+              vote as added. If False it only records the starting state.
+        """
+        self.client = client
+        self.poll = poll
+        self.emit_initial = emit_initial
+        self.voters: List[Set[int]] = [set() for _ in poll.options]
+        self.refreshed = False
+        # Votes recorded while each in-progress refresh is fetching its snapshot
+        self._recording: List[List[Tuple[bool, int, int]]] = []
+        self._handlers: Dict[str, List[Callable]] = {
+            self.VOTE_ADDED: [],
+            self.VOTE_REMOVED: [],
+        }
+
+    def __repr__(self):
+        return f"<VoteTracker message_id={self.poll.message_id} counts={self.counts}>"
+
+    @property
+    def counts(self) -> List[int]:
+        """Current number of votes per option."""
+        return [len(voters) for voters in self.voters]
+
+    def on(self, event: str, handler: Optional[Callable] = None):
+        """
+        Registers a handler for ``"vote_added"`` or ``"vote_removed"``.
+        Can be used as a decorator.
+        """
+        if event not in self._handlers:
+            raise ValueError(f"Unknown event {event!r}")
+        if handler is None:
+            return functools.partial(self.on, event)
+        self._handlers[event].append(handler)
+        return handler
+
+    async def refresh(self, concurrency: Optional[int] = None) -> VoteDelta:
+        """
+        Fetches the current voters and emits an event for every vote that was added
+        or removed since the last refresh.
+
+        Votes recorded with ``add_vote``/``remove_vote`` while the voters are being
+        fetched are merged into the fetched snapshot, so they aren't lost or
+        reported twice.
+
+        Returns:
+            - The VoteDelta of this refresh.
+        """
+        recorded = []
+        self._recording.append(recorded)
+        try:
+            current = await gather_limited(
+                [
+                    functools.partial(self.__fetch_ids, index)
+                    for index in range(len(self.poll.options))
+                ],
+                concurrency or self.client.max_concurrency,
+            )
+        finally:
+            self._recording.remove(recorded)
+        for added, index, user_id in recorded:
+            if added:
+                current[index].add(user_id)
+            else:
+                current[index].discard(user_id)
+        emit = self.refreshed or self.emit_initial
+        delta = self.apply(current)
+        if emit:
+            await self.__emit(delta)
+        return delta
+
+    def apply(self, current: List[Set[int]]) -> VoteDelta:
+        """
+        Replaces the tracked voters with ``current`` and returns what changed.
+        """
+        added = []
+        removed = []
+        for index, (old, new) in enumerate(zip(self.voters, current)):
+            added.extend((index, user_id) for user_id in new - old)
+            removed.extend((index, user_id) for user_id in old - new)
+        self.voters = list(current)
+        self.refreshed = True
+        return VoteDelta(added, removed)
+
+    async def add_vote(self, index: int, user_id: int) -> bool:
+        """
+        Records a single vote, e.g. from a gateway event, and emits ``vote_added``.
+
+        Returns:
+            - False if the vote was already known.
+        """
+        voters = self.voters[index]
+        for recorded in self._recording:
+            recorded.append((True, index, user_id))
+        if user_id in voters:
+            return False
+        voters.add(user_id)
+        await self.__emit(VoteDelta([(index, user_id)], []))
+        return True
+
+    async def remove_vote(self, index: int, user_id: int) -> bool:
+        """
+        Removes a single vote, e.g. from a gateway event, and emits ``vote_removed``.
+
+        Returns:
+            - False if the vote wasn't known.
+        """
+        voters = self.voters[index]
+        for recorded in self._recording:
+            recorded.append((False, index, user_id))
+        if user_id not in voters:
+            return False
+        voters.discard(user_id)
+        await self.__emit(VoteDelta([], [(index, user_id)]))
+        return True
+
+    async def __fetch_ids(self, index: int) -> Set[int]:
+        return set(await self.client.fetch_option_user_ids(self.poll, index))
+
+    async def __emit(self, delta: VoteDelta):
+        for event, votes in (
+            (self.VOTE_ADDED, delta.added),
+            (self.VOTE_REMOVED, delta.removed),
+        ):
+            for handler in self._handlers[event]:
+                for index, user_id in votes:
+                    try:
+                        if asyncio.iscoroutinefunction(handler):
+                            await handler(self.poll, index, user_id)
+                        else:
+                            handler(self.poll, index, user_id)
+                    except Exception as e:
+                        self.logger.exception(f"Error in {event} handler: {e}")
@@ -0,0 +1,184 @@
+"""
+This benchmark measures throughput and latency of the PollClient operations
+against a local mock of the Discord API (see mock_discord.py):
+ - create_poll
+ - get_vote_counts
+ - get_vote_users (every voter page of every option)
+ - end_poll
+
+Each operation runs at several concurrency levels. Results are printed as a
+table and written as JSON, so runs can be compared to catch regressions.
+
+Run with:
+    python benchmarks/client_ops.py [--concurrency 1 8 32] [--operations 200]
+        [--latency 0.005] [--voters 500] [--rate-limit 50] [--inject-429 0.01]
+        [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+
+from mock_discord import MockDiscord
+
+from Pollcord import Poll, PollClient, __version__
+
+OPTIONS = ["A", "B", "C", "D"]
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def make_polls(count, channels, first_id=1):
+    return [
+        Poll(
+            channel_id=i % channels,
+            message_id=first_id + i,
+            prompt="Benchmark",
+            options=OPTIONS,
+        )
+        for i in range(count)
+    ]
+
+
+async def run(client, name, operations, concurrency, channels):
+    polls = make_polls(operations, channels)
+    created = []
+
+    if name == "create_poll":
+
+        async def operation(i):
+            created.append(await client.create_poll(i % channels, "Benchmark", OPTIONS))
+
+    elif name == "get_vote_counts":
+
+        async def operation(i):
+            await client.get_vote_counts(polls[i])
+
+    elif name == "get_vote_users":
+
+        async def operation(i):
+            await client.get_vote_users(polls[i])
+
+    elif name == "end_poll":
+
+        async def operation(i):
+            await client.end_poll(polls[i])
+
+    latencies = []
+    errors = 0
+    work = iter(range(operations))
+
+    async def worker():
+        nonlocal errors
+        for i in work:
+            started = time.perf_counter()
+            try:
+                await operation(i)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    for poll in created:
+        await poll.end()
+    for poll in polls:
+        poll.ended = True
+
+    return {
+        "operation": name,
+        "concurrency": concurrency,
+        "operations": operations,
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "throughput": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+    }
+
+
+async def main(args):
+    server = MockDiscord(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        window=args.window,
+        inject_429=args.inject_429,
+        voters=args.voters,
+        seed=args.seed,
+    )
+    base_url = await server.start()
+    results = []
+    try:
+        for name in args.ops:
+            for concurrency in args.concurrency:
+                async with PollClient(
+                    "token", base_url=base_url, max_concurrency=concurrency
+                ) as client:
+                    result = await run(
+                        client, name, args.operations, concurrency, args.channels
+                    )
+                results.append(result)
+                print(
+                    f"{name:<16} x{concurrency:<4} {result['throughput']:>9.1f} ops/s "
+                    f"p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms "
+                    f"errors {result['errors']}",
+                    file=sys.stderr,
+                )
+    finally:
+        await server.stop()
+
+    report = {
+        "pollcord": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "server": {
+            "requests": dict(server.requests),
+            "rate_limited": dict(server.rate_limited),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--ops",
+        nargs="+",
+        default=["create_poll", "get_vote_counts", "get_vote_users", "end_poll"],
+    )
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--operations", type=int, default=200)
+    parser.add_argument("--channels", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--jitter", type=float, default=0.002)
+    parser.add_argument("--rate-limit", type=int, default=50)
+    parser.add_argument("--window", type=float, default=1.0)
+    parser.add_argument("--inject-429", type=float, default=0.0)
+    parser.add_argument("--voters", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here, not stdout")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
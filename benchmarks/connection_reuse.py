@@ -0,0 +1,144 @@
+"""
+This benchmark measures connection reuse under concurrent create_poll load.
+
+A local aiohttp server stands in for Discord and counts the TCP connections it
+accepts. The same load is sent through:
+ - clients that each create their own session (the old behaviour)
+ - the same clients sharing one tuned session from PollClient.create_session,
+   with a pool as large as the number of concurrent workers
+ - a shared session with keep-alive disabled, as a worst case
+
+Both with one long-lived client per worker and with a new client per poll. Only
+a shared session keeps its connections when short-lived clients come and go.
+
+Loopback connections skip DNS and TLS, which is where most of the cost of a
+new connection to Discord goes, so the connection count is the number to watch.
+
+Run with:
+    python benchmarks/connection_reuse.py [workers] [polls per worker]
+"""
+
+import asyncio
+import itertools
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+from Pollcord import PollClient
+
+
+class CountingServer:
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.connections = 0
+
+    async def create_message(self, request):
+        await request.read()
+        await asyncio.sleep(0.005)  # pretend network/processing latency
+        return web.json_response({"id": next(self.ids)}, status=201)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post(
+            "/api/v10/channels/{channel_id}/messages", self.create_message
+        )
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        handler = self.runner.server
+
+        def accept():
+            # Called once per accepted TCP connection
+            self.connections += 1
+            return handler()
+
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(accept, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/api/v10"
+
+    async def stop(self):
+        self.server.close()
+        await self.runner.cleanup()
+        await self.server.wait_closed()
+
+
+async def load(make_client, workers, polls_per_worker, short_lived):
+    async def create(client, i):
+        poll = await client.create_poll(i, "Benchmark", ["A", "B"])
+        await poll.end()
+
+    async def worker():
+        if short_lived:
+            # A new client for every poll, e.g. one per bot command
+            for i in range(polls_per_worker):
+                async with make_client() as client:
+                    await create(client, i)
+        else:
+            async with make_client() as client:
+                for i in range(polls_per_worker):
+                    await create(client, i)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+async def scenario(name, make_client, workers, polls, short_lived, session=None):
+    server = CountingServer()
+    base_url = await server.start()
+    try:
+        started = time.perf_counter()
+        await load(lambda: make_client(base_url, session), workers, polls, short_lived)
+        elapsed = time.perf_counter() - started
+    finally:
+        if session is not None:
+            await session.close()
+        await server.stop()
+
+    total = workers * polls
+    print(
+        f"{name:<32} {server.connections:>6} connections "
+        f"{total / elapsed:>9.1f} polls/s"
+    )
+
+
+def own_session(url, session):
+    return PollClient("token", base_url=url)
+
+
+def with_session(url, session):
+    return PollClient("token", base_url=url, session=session)
+
+
+async def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    polls = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    for short_lived in (False, True):
+        lifetime = "a client per poll" if short_lived else "a client per worker"
+        print(f"\n{workers} concurrent workers x {polls} polls, {lifetime}")
+
+        await scenario("session per client", own_session, workers, polls, short_lived)
+        await scenario(
+            "shared tuned session",
+            with_session,
+            workers,
+            polls,
+            short_lived,
+            # Sized for the load, a smaller pool would queue requests behind it
+            session=PollClient.create_session(pool_size=workers),
+        )
+        await scenario(
+            "shared session, no keep-alive",
+            with_session,
+            workers,
+            polls,
+            short_lived,
+            session=aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(force_close=True)
+            ),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
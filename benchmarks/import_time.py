@@ -0,0 +1,71 @@
+"""
+This benchmark measures how long importing Pollcord takes in a fresh
+interpreter, and which heavy dependencies each import pulls in:
+ - import Pollcord
+ - from Pollcord import Poll
+ - from Pollcord import PollcordError
+ - from Pollcord import PollClient
+ - Pollcord.__version__
+
+Each statement runs in a new process several times and the fastest run is
+reported, to keep disk cache and scheduling noise out of the numbers.
+
+Run with:
+    python benchmarks/import_time.py [runs]
+"""
+
+import json
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import Pollcord",
+    "from Pollcord import Poll",
+    "from Pollcord import PollcordError",
+    "from Pollcord import PollClient",
+    "import Pollcord; Pollcord.__version__",
+]
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "aiohttp": "aiohttp" in sys.modules,
+    "asyncio": "asyncio" in sys.modules,
+    "importlib.metadata": "importlib.metadata" in sys.modules,
+}}))
+"""
+
+
+def measure(statement, runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", "import json\n" + PROBE.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return min(samples, key=lambda sample: sample["ms"])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"Fastest of {runs} fresh interpreters\n")
+    print(f"{'statement':<40} {'ms':>8}  loads")
+    for statement in STATEMENTS:
+        result = measure(statement, runs)
+        loaded = [
+            name
+            for name in ("aiohttp", "asyncio", "importlib.metadata")
+            if result[name]
+        ]
+        print(f"{statement:<40} {result['ms']:>8.1f}  {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
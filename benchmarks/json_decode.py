@@ -0,0 +1,63 @@
+"""
+This micro-benchmark measures how long it takes to decode a page of voters
+(GET /channels/{channel_id}/polls/{message_id}/answers/{answer_id}) with each
+installed JSON codec.
+
+Run with:
+    python benchmarks/json_decode.py [users per page] [iterations]
+"""
+
+import sys
+import timeit
+
+from Pollcord.codec import get_codec
+
+
+def voter_page(users):
+    # Shaped like the user objects Discord returns
+    codec = get_codec("json")
+    return codec.dumps(
+        {
+            "users": [
+                {
+                    "id": str(100000000000000000 + i),
+                    "username": f"voter_{i}",
+                    "avatar": "a_1f2e3d4c5b6a79880f1e2d3c4b5a6978",
+                    "discriminator": "0",
+                    "public_flags": 64,
+                    "flags": 64,
+                    "banner": None,
+                    "accent_color": None,
+                    "global_name": f"Voter Number {i}",
+                    "avatar_decoration_data": None,
+                    "banner_color": None,
+                    "clan": None,
+                    "primary_guild": None,
+                }
+                for i in range(users)
+            ]
+        }
+    )
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    page = voter_page(users)
+    print(f"Decoding a {len(page)} byte page of {users} voters, {iterations} times\n")
+
+    baseline = None
+    for name in ("json", "ujson", "orjson"):
+        try:
+            codec = get_codec(name)
+        except ValueError:
+            print(f"{name:<8} not installed")
+            continue
+        seconds = timeit.timeit(lambda: codec.loads(page), number=iterations)
+        per_page = seconds / iterations * 1e6
+        baseline = baseline or per_page
+        print(f"{name:<8} {per_page:8.1f} us/page  {baseline / per_page:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
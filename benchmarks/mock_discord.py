@@ -0,0 +1,212 @@
+"""
+A local aiohttp server imitating the Discord poll endpoints, for benchmarks.
+
+It serves:
+ - POST /channels/{channel_id}/messages
+ - GET  /channels/{channel_id}/messages/{message_id} (with poll results)
+ - GET  /channels/{channel_id}/polls/{message_id}/answers/{answer_id} (paginated)
+ - POST /channels/{channel_id}/polls/{message_id}/expire
+
+with configurable latency, per-channel rate limit buckets that send the
+X-RateLimit-* headers, random 429 injection and any number of voters per answer.
+
+Run on its own with:
+    python benchmarks/mock_discord.py [port]
+"""
+
+import asyncio
+import hashlib
+import itertools
+import random
+import sys
+from collections import Counter
+
+from aiohttp import web
+
+
+class Bucket:
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = 0.0
+
+    def take(self, now):
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+class MockDiscord:
+    """
+    Parameters:
+        - latency (float): Seconds every request takes, before jitter.
+        - jitter (float): Up to this many seconds are added to the latency at random.
+        - rate_limit (int): Requests per window per route and channel, 0 to disable.
+        - window (float): Length of a rate limit window in seconds.
+        - inject_429 (float): Probability that a request is answered with a 429 anyway.
+        - voters (int): Voters per answer of every poll.
+        - seed (Optional[int]): Seed for jitter and 429 injection.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        jitter=0.0,
+        rate_limit=50,
+        window=1.0,
+        inject_429=0.0,
+        voters=100,
+        seed=None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.window = window
+        self.inject_429 = inject_429
+        self.voters = voters
+        self.random = random.Random(seed)
+        self.ids = itertools.count(10**17)
+        self.buckets = {}
+        self.requests = Counter()
+        self.rate_limited = Counter()
+        self.runner = None
+        self.url = None
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_post("/api/v10/channels/{channel_id}/messages", self.create)
+        app.router.add_get(
+            "/api/v10/channels/{channel_id}/messages/{message_id}", self.message
+        )
+        app.router.add_get(
+            "/api/v10/channels/{channel_id}/polls/{message_id}/answers/{answer_id}",
+            self.answers,
+        )
+        app.router.add_post(
+            "/api/v10/channels/{channel_id}/polls/{message_id}/expire", self.expire
+        )
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}/api/v10"
+        return self.url
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        route = request.match_info.route.handler.__name__
+        channel = request.match_info.get("channel_id", "")
+        self.requests[route] += 1
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers = {}
+        if self.rate_limit:
+            now = asyncio.get_running_loop().time()
+            bucket = self.buckets.get((route, channel))
+            if bucket is None:
+                bucket = self.buckets[(route, channel)] = Bucket(
+                    self.rate_limit, self.window
+                )
+            allowed = bucket.take(now)
+            headers = {
+                "X-RateLimit-Bucket": hashlib.md5(route.encode()).hexdigest(),
+                "X-RateLimit-Limit": str(bucket.limit),
+                "X-RateLimit-Remaining": str(bucket.remaining),
+                "X-RateLimit-Reset-After": f"{bucket.reset_at - now:.3f}",
+            }
+            if not allowed:
+                return self.too_many_requests(route, bucket.reset_at - now, headers)
+
+        if self.inject_429 and self.random.random() < self.inject_429:
+            return self.too_many_requests(route, 0.05, headers)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    def too_many_requests(self, route, retry_after, headers):
+        self.rate_limited[route] += 1
+        return web.json_response(
+            {
+                "message": "You are being rate limited.",
+                "retry_after": round(retry_after, 3),
+                "global": False,
+            },
+            status=429,
+            headers=headers,
+        )
+
+    async def create(self, request):
+        body = await request.json()
+        answers = body["poll"]["answers"]
+        return web.json_response(
+            {
+                "id": str(next(self.ids)),
+                "channel_id": request.match_info["channel_id"],
+                "poll": {**body["poll"], "results": self.results(len(answers))},
+            },
+            status=201,
+        )
+
+    async def message(self, request):
+        return web.json_response(
+            {
+                "id": request.match_info["message_id"],
+                "channel_id": request.match_info["channel_id"],
+                "poll": {"results": self.results(10)},
+            }
+        )
+
+    def results(self, answers):
+        return {
+            "is_finalized": False,
+            "answer_counts": [
+                {"id": i, "count": self.voters, "me_voted": False}
+                for i in range(1, answers + 1)
+            ],
+        }
+
+    async def answers(self, request):
+        answer_id = int(request.match_info["answer_id"])
+        limit = min(int(request.query.get("limit", 25)), 100)
+        # Voter ids of an answer are a contiguous range, so pages can be computed
+        first = answer_id * 10**9
+        start = max(first, int(request.query.get("after", first - 1)) + 1)
+        end = min(first + self.voters, start + limit)
+        users = [
+            {"id": str(user_id), "username": f"voter_{user_id - first}"}
+            for user_id in range(start, end)
+        ]
+        return web.json_response({"users": users})
+
+    async def expire(self, request):
+        return web.json_response({"id": request.match_info["message_id"]})
+
+
+async def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    server = MockDiscord(latency=0.01)
+    url = await server.start(port=port)
+    print(f"Mock Discord API on {url}, Ctrl+C to stop")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,90 @@
+"""
+This benchmark measures how many bytes each resident Poll object costs.
+
+It compares the current slotted Poll against the previous __dict__-based layout
+(datetime start/end times and a list of options).
+
+Run with:
+    python benchmarks/poll_memory.py [count]
+"""
+
+import gc
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from Pollcord import Poll
+
+
+class DictPoll:
+    """The Poll layout before it was slotted, kept here for comparison."""
+
+    def __init__(self, channel_id, message_id, prompt, options, duration=1):
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.prompt = prompt
+        self.options = options
+        self.start_time = datetime.now(timezone.utc)
+        self.end_time = self.start_time + timedelta(hours=duration)
+        self.on_end = None
+        self.duration = duration
+        self.isMultiselect = False
+        self.ended = False
+        self._scheduler = None
+
+
+def bytes_per_poll(cls, count):
+    # Shared between all polls, like a real bot reusing its option labels
+    prompt = "What should we build next?"
+    options = ["Mega base", "PvP arena", "Mob farm"]
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    polls = [
+        cls(
+            channel_id=123456789012345678,
+            message_id=100000000000000000 + i,
+            prompt=prompt,
+            options=list(options),
+        )
+        for i in range(count)
+    ]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del polls
+    return (after - before) / count
+
+
+def measure(name, count):
+    # Each layout is measured in a fresh interpreter so allocator free lists
+    # left behind by one run don't skew the other.
+    output = subprocess.run(
+        [sys.executable, __file__, str(count), name],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    if len(sys.argv) > 2:
+        cls = {"dict": DictPoll, "slots": Poll}[sys.argv[2]]
+        print(bytes_per_poll(cls, count))
+        return
+
+    print(f"Measuring {count} polls...")
+    before = measure("dict", count)
+    after = measure("slots", count)
+
+    print(f"__dict__ Poll: {before:8.1f} bytes/poll")
+    print(f"slotted Poll:  {after:8.1f} bytes/poll")
+    print(f"saved:         {before - after:8.1f} bytes/poll ({1 - after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
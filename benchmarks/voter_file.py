@@ -0,0 +1,80 @@
+"""
+This benchmark compares scanning an exported voter archive as NDJSON with
+scanning the memory-mapped columnar format (Pollcord.export).
+
+It writes the same synthetic votes in both formats, then counts the votes per
+poll from each file.
+
+Run with:
+    python benchmarks/voter_file.py [polls] [voters per poll]
+"""
+
+import collections
+import json
+import os
+import sys
+import tempfile
+import time
+
+from Pollcord import Poll
+from Pollcord.codec import get_codec
+from Pollcord.export import ColumnarWriter, NDJSONWriter, VoterFile
+
+
+def write(writer, polls, voters):
+    for poll in polls:
+        for option in range(len(poll.options)):
+            users = [
+                {"id": str(10**17 + i), "username": f"voter_{i}"}
+                for i in range(option, voters, len(poll.options))
+            ]
+            writer.write(poll, option, users)
+    writer.close()
+
+
+def main():
+    polls = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    voters = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    polls = [
+        Poll(channel_id=1, message_id=i, prompt="Q", options=["A", "B", "C", "D"])
+        for i in range(1, polls + 1)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ndjson = os.path.join(tmp, "votes.ndjson")
+        columnar = os.path.join(tmp, "votes.bin")
+        with open(ndjson, "wb") as f:
+            write(NDJSONWriter(f, get_codec()), polls, voters)
+        with open(columnar, "wb") as f:
+            write(ColumnarWriter(f), polls, voters)
+        print(f"{len(polls) * voters} votes")
+        print(f"ndjson   {os.path.getsize(ndjson) / 2**20:8.1f} MiB")
+        print(f"columnar {os.path.getsize(columnar) / 2**20:8.1f} MiB\n")
+
+        started = time.perf_counter()
+        counts = collections.Counter()
+        with open(ndjson, "rb") as f:
+            for line in f:
+                counts[json.loads(line)["poll_id"]] += 1
+        print(f"ndjson scan          {time.perf_counter() - started:8.3f}s")
+
+        started = time.perf_counter()
+        counts = collections.Counter()
+        with VoterFile(columnar) as votes:
+            for poll_ids, _, _ in votes.blocks():
+                counts.update(poll_ids)
+        print(f"columnar scan        {time.perf_counter() - started:8.3f}s")
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        started = time.perf_counter()
+        with VoterFile(columnar) as votes:
+            poll_ids, _, _ = votes.columns()
+            np.unique(poll_ids, return_counts=True)
+        print(f"columnar scan, numpy {time.perf_counter() - started:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
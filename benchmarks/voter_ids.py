@@ -0,0 +1,83 @@
+"""
+This benchmark compares decoding voter pages into full user objects (with each
+installed JSON codec) against scanning only the user ids with UserIdScanner.
+
+It reports the decode time per page and the bytes kept per voter once every page
+of an option has been collected.
+
+Run with:
+    python benchmarks/voter_ids.py [voters] [iterations]
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+from array import array
+
+from Pollcord.codec import UserIdScanner, get_codec
+from json_decode import voter_page
+
+CHUNK = 16384  # roughly what aiohttp hands over per read
+
+
+def full_users(codec, pages):
+    users = []
+    for page in pages:
+        users.extend(codec.loads(page)["users"])
+    return users
+
+
+def user_ids(pages):
+    ids = array("Q")
+    for page in pages:
+        scanner = UserIdScanner()
+        for start in range(0, len(page), CHUNK):
+            scanner.feed(page[start : start + CHUNK])
+        ids.extend(scanner.close())
+    return ids
+
+
+def bytes_per_voter(collect, pages, voters):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = collect(pages)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == voters
+    return (after - before) / voters
+
+
+def main():
+    voters = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    page = voter_page(100)
+    pages = [page] * (voters // 100)
+    voters = len(pages) * 100
+    print(
+        f"{len(page)} byte pages of 100 voters, {iterations} decodes, "
+        f"{voters} voters kept\n"
+    )
+    print(f"{'':<16} {'us/page':>9} {'bytes/voter':>12}")
+
+    candidates = []
+    for name in ("json", "ujson", "orjson"):
+        try:
+            codec = get_codec(name)
+        except ValueError:
+            print(f"{name + ' users':<16} not installed")
+            continue
+        candidates.append(
+            (f"{name} users", lambda pages, codec=codec: full_users(codec, pages))
+        )
+    candidates.append(("scanned ids", user_ids))
+
+    for label, collect in candidates:
+        seconds = timeit.timeit(lambda: collect([page]), number=iterations)
+        memory = bytes_per_voter(collect, pages, voters)
+        print(f"{label:<16} {seconds / iterations * 1e6:9.1f} {memory:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
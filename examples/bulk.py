@@ -0,0 +1,47 @@
+"""
+This example tests bulk poll creation and termination:
+ - Creating polls in several channels with create_polls
+ - Handling per-poll errors
+ - Ending them again with end_polls
+"""
+
+import asyncio
+from Pollcord import PollClient
+from Pollcord.bulk import PollSpec
+import os
+from dotenv import load_dotenv
+import logging
+
+load_dotenv(".env")
+TOKEN = os.getenv("DISCORD_TOKEN")
+CHANNELS = input("Channel IDs (comma separated): ").split(",")
+logging.basicConfig(level=logging.INFO)
+
+
+async def main():
+    specs = [
+        PollSpec(channel.strip(), f"Bulk test poll {i}", ["A", "B"], duration=1)
+        for channel in CHANNELS
+        for i in range(5)
+    ]
+
+    async with PollClient(TOKEN) as client:
+        polls = []
+        async for result in client.create_polls(specs):
+            if result.ok:
+                print(f"[{result.index}] created {result.poll.message_id}")
+                polls.append(result.poll)
+            else:
+                print(f"[{result.index}] failed: {result.error}")
+
+        await asyncio.sleep(10)
+
+        async for result in client.end_polls(polls):
+            print(
+                f"ended {result.item.message_id}: {'ok' if result.ok else result.error}"
+            )
+
+    print("\nPolls in the same channel should be created in order, without crashes")
+
+
+asyncio.run(main())
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import pytest
+from aioresponses import aioresponses, CallbackResult
+from Pollcord import PollClient, PollCreationError
+from Pollcord.bulk import PollSpec
+
+
+def messages(channel_id):
+    return f"https://discord.com/api/v10/channels/{channel_id}/messages"
+
+
+@pytest.mark.asyncio
+async def test_create_polls_streams_results_with_per_item_errors():
+    order = []
+    ids = iter(range(100, 200))
+
+    async def created(url, **kwargs):
+        body = json.loads(kwargs["data"])
+        order.append((url.path.split("/")[4], body["poll"]["question"]["text"]))
+        await asyncio.sleep(0.01)
+        return CallbackResult(status=201, payload={"id": next(ids)})
+
+    specs = [
+        PollSpec(1, "first", ["A", "B"]),
+        {"channel_id": 2, "question": "other", "options": ["A", "B"]},
+        PollSpec(1, "second", ["A", "B"]),
+        PollSpec(3, "broken", ["A"]),  # fewer than 2 options
+        PollSpec(1, "third", ["A", "B"]),
+    ]
+
+    with aioresponses() as m:
+        m.post(messages(1), callback=created, repeat=True)
+        m.post(messages(2), callback=created, repeat=True)
+
+        async with PollClient("token") as client:
+            results = [r async for r in client.create_polls(specs, concurrency=2)]
+            for r in results:
+                if r.ok:
+                    await r.poll.end()
+
+    assert sorted(r.index for r in results) == [0, 1, 2, 3, 4]
+    by_index = {r.index: r for r in results}
+    assert isinstance(by_index[3].error, PollCreationError)
+    assert by_index[3].poll is None
+    assert all(by_index[i].ok for i in (0, 1, 2, 4))
+    assert by_index[2].poll.prompt == "second"
+
+    # Same channel keeps input order
+    assert [q for channel, q in order if channel == "1"] == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_malformed_spec_only_fails_its_own_item():
+    specs = [
+        {"channel_id": 1, "question": "no options"},
+        {"question": "no channel", "options": ["A", "B"]},
+        {"channel_id": 1, "question": "fine", "options": ["A", "B"]},
+    ]
+
+    with aioresponses() as m:
+        m.post(messages(1), status=201, payload={"id": 100})
+
+        async with PollClient("token") as client:
+            results = [r async for r in client.create_polls(specs)]
+            by_index = {r.index: r for r in results}
+            await by_index[2].poll.end()
+
+    assert isinstance(by_index[0].error, TypeError)
+    assert isinstance(by_index[1].error, TypeError)
+    assert by_index[2].ok
+
+
+@pytest.mark.asyncio
+async def test_channels_never_run_concurrently():
+    running = {}
+    peak = {}
+
+    async def created(url, **kwargs):
+        channel = url.path.split("/")[4]
+        running[channel] = running.get(channel, 0) + 1
+        peak[channel] = max(peak.get(channel, 0), running[channel])
+        await asyncio.sleep(0.005)
+        running[channel] -= 1
+        return CallbackResult(status=201, payload={"id": 1})
+
+    specs = [PollSpec(c, "Q", ["A", "B"]) for c in (1, 2, 3) for _ in range(4)]
+
+    with aioresponses() as m:
+        for channel in (1, 2, 3):
+            m.post(messages(channel), callback=created, repeat=True)
+
+        async with PollClient("token") as client:
+            results = [r async for r in client.create_polls(specs, concurrency=8)]
+            for r in results:
+                await r.poll.end()
+
+    assert len(results) == 12 and all(r.ok for r in results)
+    assert peak == {"1": 1, "2": 1, "3": 1}
+
+
+@pytest.mark.asyncio
+async def test_end_polls_reports_missing_polls():
+    with aioresponses() as m:
+        m.post(messages(1), status=201, payload={"id": 10})
+        m.post(messages(1), status=201, payload={"id": 11})
+        m.post("https://discord.com/api/v10/channels/1/polls/10/expire", status=200)
+        m.post(
+            "https://discord.com/api/v10/channels/1/polls/11/expire",
+            status=404,
+            body="Unknown message",
+        )
+
+        async with PollClient("token") as client:
+            polls = [
+                r.poll
+                async for r in client.create_polls([PollSpec(1, "Q", ["A", "B"])] * 2)
+            ]
+            results = [r async for r in client.end_polls(polls)]
+            await polls[1].end()
+
+    assert [r.ok for r in sorted(results, key=lambda r: r.index)] == [True, False]
+    assert polls[0].ended
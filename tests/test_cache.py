@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.cache import ResultCache
+
+
+@pytest.fixture
+def poll():
+    return Poll(
+        channel_id=12345,
+        message_id=99999,
+        prompt="Favorite color?",
+        options=["Red", "Blue", "Green"],
+        duration=1,
+        on_end=None,
+    )
+
+
+def message_with_counts(*counts):
+    return {
+        "poll": {
+            "results": {
+                "answer_counts": [
+                    {"id": i + 1, "count": count} for i, count in enumerate(counts)
+                ]
+            }
+        }
+    }
+
+
+def test_result_cache_evicts_least_recently_used_poll():
+    cache = ResultCache(ttl=60, maxsize=2)
+    cache.set(1, "counts", [1])
+    cache.set(2, "counts", [2])
+    assert cache.get(1, "counts") == [1]  # 1 is now the most recently used
+
+    cache.set(3, "counts", [3])
+    assert cache.get(2, "counts") is ResultCache.MISSING
+    assert cache.get(1, "counts") == [1]
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_request(poll):
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/messages/{poll.message_id}"
+
+    with aioresponses() as m:
+        # Registered once, a second HTTP request would fail
+        m.get(url, status=200, payload=message_with_counts(1, 2, 3))
+
+        async with PollClient(token="fake_token") as client:
+            results = await asyncio.gather(
+                *(client.get_vote_counts(poll) for _ in range(10))
+            )
+
+    assert results == [[1, 2, 3]] * 10
+
+
+@pytest.mark.asyncio
+async def test_cached_counts_are_invalidated_by_end_poll(poll):
+    base = f"https://discord.com/api/v10/channels/{poll.channel_id}"
+
+    with aioresponses() as m:
+        m.get(
+            f"{base}/messages/{poll.message_id}",
+            status=200,
+            payload=message_with_counts(1, 0, 0),
+        )
+        m.post(f"{base}/polls/{poll.message_id}/expire", status=200, payload={})
+        m.get(
+            f"{base}/messages/{poll.message_id}",
+            status=200,
+            payload=message_with_counts(5, 0, 0),
+        )
+
+        async with PollClient(token="fake_token", cache_ttl=60) as client:
+            assert await client.get_vote_counts(poll) == [1, 0, 0]
+            # Served from the cache, no request
+            assert await client.get_vote_counts(poll) == [1, 0, 0]
+
+            await client.end_poll(poll)
+            assert await client.get_vote_counts(poll) == [5, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_read_in_flight_during_end_poll_is_not_cached(poll):
+    base = f"https://discord.com/api/v10/channels/{poll.channel_id}"
+    url = f"{base}/messages/{poll.message_id}"
+
+    async def slow_counts(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return CallbackResult(payload=message_with_counts(1, 0, 0))
+
+    with aioresponses() as m:
+        m.get(url, callback=slow_counts)
+        m.post(f"{base}/polls/{poll.message_id}/expire", status=200, payload={})
+        m.get(url, payload=message_with_counts(9, 0, 0))
+
+        async with PollClient(token="fake_token", cache_ttl=60) as client:
+            read = asyncio.ensure_future(client.get_vote_counts(poll))
+            await asyncio.sleep(0.01)
+            await client.end_poll(poll)
+            assert await read == [1, 0, 0]
+            assert await client.get_vote_counts(poll) == [9, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_polls_ending_on_their_own_invalidate_the_cache():
+    base = "https://discord.com/api/v10/channels/1/messages"
+
+    with aioresponses() as m:
+        m.post(base, status=200, payload={"id": "2"})
+        m.get(f"{base}/2", payload=message_with_counts(1, 0))
+        m.get(f"{base}/2", payload=message_with_counts(4, 3))
+
+        async with PollClient(token="fake_token", cache_ttl=60) as client:
+            poll = await client.create_poll(1, "Q", ["A", "B"])
+            assert await client.get_vote_counts(poll) == [1, 0]
+            await poll.end()  # e.g. by the expiry scheduler
+            assert await client.get_vote_counts(poll) == [4, 3]
@@ -0,0 +1,59 @@
+import json
+import pytest
+from aioresponses import aioresponses
+from Pollcord import PollClient
+from Pollcord.codec import JSONCodec, UserIdScanner, get_codec
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+def test_codec_round_trip(name):
+    try:
+        codec = get_codec(name)
+    except ValueError:
+        pytest.skip(f"{name} is not installed")
+
+    payload = {"poll": {"question": {"text": "Café?"}, "answers": [1, 2]}}
+    encoded = codec.dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+
+
+def test_user_id_scanner_across_chunk_boundaries():
+    users = [
+        {
+            "id": str(10**17 + i),
+            "username": 'say "id": "1", please',
+            "avatar_decoration_data": {"sku_id": "7", "asset": "a"},
+        }
+        for i in range(50)
+    ]
+    body = json.dumps({"users": users}).encode()
+
+    for size in (1, 7, 64, len(body)):
+        scanner = UserIdScanner()
+        for start in range(0, len(body), size):
+            scanner.feed(body[start : start + size])
+        assert list(scanner.close()) == [10**17 + i for i in range(50)]
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.asyncio
+async def test_client_encodes_payload_with_its_codec():
+    url = "https://discord.com/api/v10/channels/1/messages"
+
+    with aioresponses() as m:
+        m.post(url, status=201, payload={"id": 7})
+
+        async with PollClient("token", codec=JSONCodec()) as client:
+            poll = await client.create_poll(1, "Q", ["A", "B"], duration=2)
+            await poll.end()
+
+        [call] = [call for calls in m.requests.values() for call in calls]
+
+    sent = json.loads(call.kwargs["data"])
+    assert sent["poll"]["duration"] == 2
+    assert sent["poll"]["answers"][1]["poll_media"]["text"] == "B"
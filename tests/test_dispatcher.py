@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+import pytest
+from aioresponses import aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.dispatcher import CallbackDispatcher
+from Pollcord.metrics import InMemoryMetrics
+
+
+def make_poll(message_id=1):
+    return Poll(channel_id=1, message_id=message_id, prompt="Q", options=["A", "B"])
+
+
+@pytest.mark.asyncio
+async def test_sync_callbacks_do_not_block_the_loop():
+    dispatcher = CallbackDispatcher(max_workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    threads = []
+
+    def slow_callback(poll):
+        threads.append(threading.current_thread())
+        time.sleep(0.2)
+
+    task = asyncio.ensure_future(ticker())
+    await dispatcher.run(make_poll(), slow_callback)
+    task.cancel()
+    dispatcher.close(wait=True)
+
+    assert ticks >= 10
+    assert threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_async_callbacks_are_capped_and_measured():
+    metrics = InMemoryMetrics()
+    dispatcher = CallbackDispatcher(max_concurrent=2, metrics=metrics)
+    running = 0
+    peak = 0
+
+    async def callback(poll):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if poll.message_id == 4:
+            raise RuntimeError("boom")
+
+    await asyncio.gather(*(dispatcher.run(make_poll(i), callback) for i in range(5)))
+
+    snapshot = metrics.snapshot()["callbacks"]
+    assert peak == 2
+    assert snapshot["max_queued"] == 3
+    assert snapshot["queued"] == 0
+    assert snapshot["duration"]["count"] == 5
+    assert snapshot["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_polls_use_the_dispatcher():
+    url = "https://discord.com/api/v10/channels/1/messages"
+    threads = []
+
+    with aioresponses() as m:
+        m.post(url, status=201, payload={"id": 2})
+
+        async with PollClient("token") as client:
+            poll = await client.create_poll(
+                1,
+                "Q",
+                ["A", "B"],
+                callback=lambda p: threads.append(threading.current_thread()),
+            )
+            await poll.end()
+
+    assert poll._dispatcher is client.callback_dispatcher
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_closed_dispatcher_drops_callbacks():
+    dispatcher = CallbackDispatcher()
+    called = []
+    await dispatcher.run(make_poll(), called.append)
+    dispatcher.close(wait=True)
+
+    await dispatcher.run(make_poll(2), called.append)
+    assert [poll.message_id for poll in called] == [1]
+    assert dispatcher._executor is None  # no new pool behind close's back
+
+
+@pytest.mark.asyncio
+async def test_client_close_stops_its_scheduler():
+    url = "https://discord.com/api/v10/channels/1/messages"
+    ended = []
+
+    with aioresponses() as m:
+        m.post(url, status=201, payload={"id": 2})
+        async with PollClient("token") as client:
+            client.scheduler.resolution = 0.01
+            poll = await client.create_poll(
+                1, "Q", ["A", "B"], duration=1, callback=ended.append
+            )
+            poll._end_ts = time.time() + 0.05
+            client.scheduler.schedule(poll, 0.05)
+
+    await asyncio.sleep(0.1)
+    assert client.scheduler.closed and len(client.scheduler) == 0
+    assert not poll.ended and ended == []
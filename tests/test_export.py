@@ -0,0 +1,133 @@
+import io
+import json
+import struct
+import threading
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.export import MAGIC, NDJSONWriter, VoterFile
+
+ANSWERS = "https://discord.com/api/v10/channels/1/polls/{}/answers/{}?limit=100"
+
+
+def voters(first, count):
+    return [{"id": str(first + i), "username": f"u{i}"} for i in range(count)]
+
+
+def mock_votes(m):
+    # Poll 2: 150 voters on option 1 (two pages), one on option 2
+    m.get(ANSWERS.format(2, 1), payload={"users": voters(1000, 100)})
+    m.get(ANSWERS.format(2, 1) + "&after=1099", payload={"users": voters(1100, 50)})
+    m.get(ANSWERS.format(2, 2), payload={"users": voters(7, 1)})
+    # Poll 3: no votes
+    m.get(ANSWERS.format(3, 1), payload={"users": []})
+    m.get(ANSWERS.format(3, 2), payload={"users": []})
+
+
+def make_polls():
+    return [
+        Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"]),
+        Poll(channel_id=1, message_id=3, prompt="Q", options=["A", "B"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson():
+    out = io.BytesIO()
+    with aioresponses() as m:
+        mock_votes(m)
+        async with PollClient("token") as client:
+            written = await client.export_voters(make_polls(), out)
+
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert written == len(rows) == 151
+    assert rows[0]["poll_id"] == 2 and rows[0]["user"]["username"] == "u0"
+    assert sorted((r["option"], r["user_id"]) for r in rows)[0] == (0, 1000)
+    assert {(r["option"], r["user_id"]) for r in rows if r["option"] == 1} == {(1, 7)}
+
+
+@pytest.mark.asyncio
+async def test_export_takes_polls_lazily():
+    taken = []
+    seen = []
+
+    def polls():
+        for message_id in range(10, 15):
+            taken.append(message_id)
+            yield Poll(channel_id=1, message_id=message_id, prompt="Q", options=["A"])
+
+    def answers(url, **kwargs):
+        seen.append(len(taken))
+        return CallbackResult(payload={"users": voters(1, 1)})
+
+    with aioresponses() as m:
+        for message_id in range(10, 15):
+            m.get(ANSWERS.format(message_id, 1), callback=answers)
+        async with PollClient("token") as client:
+            written = await client.export_voters(polls(), io.BytesIO(), concurrency=2)
+
+    assert written == 5
+    # Polls are only taken as one of the two workers frees up
+    assert all(count <= index + 2 for index, count in enumerate(seen))
+
+
+@pytest.mark.asyncio
+async def test_export_writes_off_the_event_loop(monkeypatch):
+    threads = set()
+    write = NDJSONWriter.write
+
+    def recording_write(self, poll, option, users):
+        threads.add(threading.current_thread().name)
+        write(self, poll, option, users)
+
+    monkeypatch.setattr(NDJSONWriter, "write", recording_write)
+    out = io.BytesIO()
+    with aioresponses() as m:
+        mock_votes(m)
+        async with PollClient("token") as client:
+            assert await client.export_voters(make_polls(), out) == 151
+
+    assert threads and all(name.startswith("pollcord-export") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_export_columnar_and_read_back(tmp_path):
+    path = tmp_path / "votes.bin"
+    with aioresponses() as m:
+        mock_votes(m)
+        async with PollClient("token") as client:
+            written = await client.export_voters(
+                make_polls(), path, format="columnar", block_size=64
+            )
+
+    assert written == 151
+    with VoterFile(path) as votes:
+        assert len(votes) == 151
+        rows = sorted(votes)
+        assert rows[0] == (2, 0, 1000)
+        assert (2, 1, 7) in rows
+        assert all(poll_id == 2 for poll_id, _, _ in rows)
+        poll_ids, options, user_ids = votes.columns()
+        assert len(poll_ids) == len(options) == len(user_ids) == 151
+        assert (
+            sorted(zip(poll_ids.tolist(), options.tolist(), user_ids.tolist())) == rows
+        )
+
+
+def test_reads_files_written_with_the_other_byte_order(tmp_path):
+    path = tmp_path / "big_endian.bin"
+    with open(path, "wb") as f:
+        f.write(struct.pack("8sc7x", MAGIC, b">"))
+        f.write(struct.pack(">I4x", 1))
+        f.write(struct.pack(">Q", 2) + struct.pack(">Q", 99) + struct.pack(">I", 1))
+        f.write(b"\0" * 4)
+
+    with VoterFile(path) as votes:
+        assert list(votes) == [(2, 1, 99)]
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a voter file")
+    with pytest.raises(ValueError):
+        VoterFile(path)
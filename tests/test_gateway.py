@@ -0,0 +1,221 @@
+import asyncio
+import json
+import unittest.mock
+import pytest
+from aiohttp import web
+from Pollcord import Poll, PollClient, PollcordError
+from Pollcord.gateway import GatewayListener
+
+
+class FakeGateway:
+    """Local stand-in for the Discord gateway and the voters endpoint."""
+
+    def __init__(self, events, voters=None, close_code=None, reconnect=False):
+        self.events = events
+        self.voters = voters or {}
+        self.close_code = close_code
+        self.reconnect = reconnect
+        self.client_close_codes = []
+        self.received = []
+        self.identified = asyncio.Event()
+        self.runner = None
+        self.url = None
+
+    async def websocket(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"op": 10, "d": {"heartbeat_interval": 20}})
+        async for message in ws:
+            payload = json.loads(message.data)
+            self.received.append(payload)
+            if payload["op"] == 1:
+                await ws.send_json({"op": 11})
+            elif payload["op"] == 2:
+                self.identified.set()
+                if self.close_code is not None:
+                    await ws.close(code=self.close_code)
+                    break
+                await ws.send_json(
+                    {"op": 0, "s": 1, "t": "READY", "d": {"session_id": "abc"}}
+                )
+                for seq, (event, data) in enumerate(self.events, start=2):
+                    await ws.send_json({"op": 0, "s": seq, "t": event, "d": data})
+                if self.reconnect:
+                    await ws.send_json({"op": 7})
+            elif payload["op"] == 6:
+                await ws.send_json({"op": 0, "s": 99, "t": "RESUMED", "d": {}})
+        if ws.close_code is not None:
+            self.client_close_codes.append(ws.close_code)
+        return ws
+
+    async def answers(self, request):
+        answer_id = int(request.match_info["answer_id"])
+        users = [{"id": str(i)} for i in self.voters.get(answer_id, [])]
+        return web.json_response({"users": users})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/gateway", self.websocket)
+        app.router.add_get(
+            "/channels/{channel_id}/polls/{message_id}/answers/{answer_id}",
+            self.answers,
+        )
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def vote(event, message_id, answer_id, user_id):
+    return (
+        event,
+        {
+            "user_id": str(user_id),
+            "channel_id": "1",
+            "message_id": str(message_id),
+            "answer_id": answer_id,
+        },
+    )
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_vote_events_update_tracked_polls():
+    server = FakeGateway(
+        [
+            vote("MESSAGE_POLL_VOTE_ADD", 2, 1, 10),
+            vote("MESSAGE_POLL_VOTE_ADD", 2, 2, 11),
+            vote("MESSAGE_POLL_VOTE_ADD", 99, 1, 12),  # not tracked
+            vote("MESSAGE_POLL_VOTE_REMOVE", 2, 1, 10),
+            vote("MESSAGE_POLL_VOTE_ADD", 2, 2, 13),
+        ]
+    )
+    await server.start()
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    added = []
+
+    try:
+        async with PollClient("token", base_url=server.url) as client:
+            listener = GatewayListener(client, url=f"{server.url}/gateway")
+            tracker = listener.track(poll)
+            tracker.on("vote_added", lambda p, index, user: added.append((index, user)))
+
+            async with listener:
+                await listener.wait_until_ready(timeout=2)
+                await wait_for(lambda: tracker.counts == [0, 2])
+                await wait_for(lambda: any(p["op"] == 1 for p in server.received))
+    finally:
+        await server.stop()
+
+    identify = next(p for p in server.received if p["op"] == 2)
+    assert identify["d"]["token"] == "token"
+    assert identify["d"]["intents"] == (1 << 24) | (1 << 25)
+    assert added == [(0, 10), (1, 11), (1, 13)]
+    assert tracker.voters == [set(), {11, 13}]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_uses_rest_for_missed_votes():
+    server = FakeGateway(
+        [vote("MESSAGE_POLL_VOTE_ADD", 2, 1, 10)], voters={1: [10, 20], 2: [30]}
+    )
+    await server.start()
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+
+    try:
+        async with PollClient("token", base_url=server.url) as client:
+            listener = GatewayListener(client, url=f"{server.url}/gateway")
+            tracker = listener.track(poll)
+            added = []
+            tracker.on("vote_added", lambda p, index, user: added.append((index, user)))
+
+            async with listener:
+                await wait_for(lambda: tracker.counts == [1, 0])
+                await listener.reconcile()
+    finally:
+        await server.stop()
+
+    assert tracker.counts == [2, 1]
+    assert sorted(added) == [(0, 10), (0, 20), (1, 30)]
+
+
+@pytest.mark.asyncio
+async def test_fatal_close_code_stops_the_listener():
+    server = FakeGateway([], close_code=4004)  # authentication failed
+    await server.start()
+
+    try:
+        async with PollClient("token", base_url=server.url) as client:
+            listener = GatewayListener(client, url=f"{server.url}/gateway")
+            await listener.start()
+            with pytest.raises(PollcordError, match="4004"):
+                await listener.wait_until_ready(timeout=2)
+            assert listener.error is not None
+            await listener.close()
+    finally:
+        await server.stop()
+
+    assert sum(p["op"] == 2 for p in server.received) == 1  # no reconnect
+
+
+@pytest.mark.asyncio
+async def test_bad_events_and_slow_handlers_dont_stall_the_connection():
+    server = FakeGateway(
+        [
+            vote("MESSAGE_POLL_VOTE_ADD", 2, 9, 10),  # no such answer
+            vote("MESSAGE_POLL_VOTE_ADD", 2, 1, 11),
+            vote("MESSAGE_POLL_VOTE_ADD", 2, 2, 12),
+        ]
+    )
+    await server.start()
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    added = []
+
+    async def slow_handler(poll, index, user):
+        await asyncio.sleep(0.2)  # ten heartbeat intervals
+        added.append((index, user))
+
+    try:
+        async with PollClient("token", base_url=server.url) as client:
+            listener = GatewayListener(client, url=f"{server.url}/gateway")
+            listener.track(poll).on("vote_added", slow_handler)
+
+            async with listener:
+                await wait_for(lambda: len(added) == 2)
+    finally:
+        await server.stop()
+
+    assert added == [(0, 11), (1, 12)]
+    # Heartbeats were acknowledged meanwhile, so the session was never resumed
+    assert not any(p["op"] == 6 for p in server.received)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_keeps_the_session_resumable():
+    server = FakeGateway([], reconnect=True)
+    await server.start()
+
+    try:
+        async with PollClient("token", base_url=server.url) as client:
+            listener = GatewayListener(client, url=f"{server.url}/gateway")
+            with unittest.mock.patch("random.uniform", return_value=0):
+                async with listener:
+                    await wait_for(lambda: any(p["op"] == 6 for p in server.received))
+    finally:
+        await server.stop()
+
+    # 1000/1001 would have invalidated the session on Discord's side
+    assert server.client_close_codes[0] == 4000
+    resume = next(p for p in server.received if p["op"] == 6)
+    assert resume["d"]["session_id"] == "abc"
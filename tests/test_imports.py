@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import pytest
+import Pollcord
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.split()
+
+
+def test_import_does_not_load_aiohttp():
+    assert run(
+        "import sys, Pollcord; from Pollcord import Poll, PollcordError;"
+        "print('aiohttp' in sys.modules, 'importlib.metadata' in sys.modules)"
+    ) == ["False", "False"]
+
+
+def test_lazy_attributes_resolve_to_the_real_objects():
+    from Pollcord.client import PollClient
+    from Pollcord.error import PollNotFoundError
+
+    assert Pollcord.PollClient is PollClient
+    assert Pollcord.PollNotFoundError is PollNotFoundError
+    assert isinstance(Pollcord.__version__, str)
+    assert {"PollClient", "Poll", "__version__"} <= set(dir(Pollcord))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        Pollcord.DoesNotExist
@@ -0,0 +1,70 @@
+import pytest
+from aioresponses import aioresponses
+from Pollcord import PollClient
+from Pollcord.metrics import Histogram, InMemoryMetrics
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(bounds=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.8) == 1.0
+    assert histogram.quantile(0.99) == 3.0
+
+
+@pytest.mark.asyncio
+async def test_client_reports_rate_limits_and_latency():
+    channel_id = 1234
+    url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
+    route = "POST /api/v10/channels/{channel_id}/messages"
+    metrics = InMemoryMetrics()
+
+    with aioresponses() as m:
+        m.post(url, status=429, payload={"retry_after": 0.05, "global": False})
+        m.post(url, status=201, payload={"id": 42})
+
+        async with PollClient(token="fake_token", metrics=metrics) as client:
+            poll = await client.create_poll(channel_id, "Question?", ["A", "B"])
+            snapshot = metrics.snapshot()
+            await poll.end()
+
+    assert snapshot["rate_limited"] == 1
+    assert snapshot["retries"] == 1
+    assert snapshot["sleep_seconds"] >= 0.05
+    assert snapshot["in_flight"] == 0
+    assert snapshot["max_in_flight"] == 1
+    assert snapshot["scheduler_backlog"] == 1
+
+    stats = snapshot["routes"][route]
+    assert stats["statuses"] == {429: 1, 201: 1}
+    assert stats["latency"]["count"] == 2
+
+    assert metrics.snapshot()["scheduler_backlog"] == 0
+
+
+def test_reset_keeps_gauges_and_subclass_state():
+    class Labelled(InMemoryMetrics):
+        def __init__(self, label):
+            super().__init__()
+            self.label = label
+
+    metrics = Labelled("shard-1")
+    metrics.request_started("GET /a")
+    metrics.request_started("GET /a")
+    metrics.request_finished("GET /a", 200, 0.1)
+    metrics.rate_limited("GET /a", 1.0, True)
+    metrics.queued("GET /a", 0.5)
+    metrics.callback_finished(0.2, True)
+
+    metrics.reset()
+
+    snapshot = metrics.snapshot()
+    assert metrics.label == "shard-1"
+    assert metrics.latency == {} and metrics.rate_limits == {}
+    assert metrics.global_rate_limits == 0 and metrics.queue_seconds == {}
+    assert metrics.in_flight == metrics.max_in_flight == 1
+    assert snapshot["callbacks"]["duration"]["count"] == 0
+    assert snapshot["callbacks"]["errors"] == 0
@@ -1,3 +1,4 @@
+from datetime import timedelta, timezone
 import pytest
 from aioresponses import aioresponses
 from Pollcord import PollClient, Poll
@@ -79,3 +80,18 @@ async def test_create_poll_error():
 
             with pytest.raises(Exception):  # ideally PollCreationError
                 await client.create_poll(123, "Bad poll", ["X", "Y"])
+
+
+def test_poll_is_slotted_with_datetime_views():
+    poll = Poll(
+        channel_id=1,
+        message_id=2,
+        prompt="Q",
+        options=["A", "B"],
+        duration=2,
+    )
+
+    assert not hasattr(poll, "__dict__")
+    assert poll.options == ("A", "B")
+    assert poll.start_time.tzinfo == timezone.utc
+    assert poll.end_time - poll.start_time == timedelta(hours=2)
@@ -1,6 +1,8 @@
+import asyncio
 import pytest
+from array import array
 from Pollcord import Poll, PollClient, PollNotFoundError, PollcordError
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 
 
 @pytest.fixture
@@ -18,7 +20,7 @@ def poll():
 
 @pytest.mark.asyncio
 async def test_fetch_option_users_success(poll):
-    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers/1"
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers/1?limit=100"
     mock_users = {"users": [{"id": "1"}, {"id": "2"}]}
 
     with aioresponses() as m:
@@ -32,7 +34,7 @@ async def test_fetch_option_users_success(poll):
 
 @pytest.mark.asyncio
 async def test_fetch_option_users_not_found(poll):
-    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers/1"
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers/1?limit=100"
 
     with aioresponses() as m:
         m.get(url, status=404, body="Not Found")
@@ -53,7 +55,7 @@ async def test_get_vote_users_success(poll):
 
     with aioresponses() as m:
         for i, resp in enumerate(responses):
-            m.get(f"{base}/answers/{i + 1}", status=200, payload=resp)
+            m.get(f"{base}/answers/{i + 1}?limit=100", status=200, payload=resp)
 
         async with PollClient(token="fake_token") as client:
             users_per_option = await client.get_vote_users(poll)
@@ -71,10 +73,10 @@ async def test_get_vote_counts_success(poll):
 
     with aioresponses() as m:
         for i, resp in enumerate(responses):
-            m.get(f"{base}/answers/{i + 1}", status=200, payload=resp)
+            m.get(f"{base}/answers/{i + 1}?limit=100", status=200, payload=resp)
 
         async with PollClient(token="fake_token") as client:
-            counts = await client.get_vote_counts(poll)
+            counts = await client.get_vote_counts(poll, from_results=False)
 
     assert counts == [1, 2, 0]
 
@@ -85,12 +87,173 @@ async def test_get_vote_users_handles_error(poll, caplog):
 
     with aioresponses() as m:
         # First call succeeds, second fails
-        m.get(f"{base}/answers/1", status=200, payload={"users": [{"id": "1"}]})
-        m.get(f"{base}/answers/2", status=500, body="Server error")
-        m.get(f"{base}/answers/3", status=200, payload={"users": []})
+        m.get(
+            f"{base}/answers/1?limit=100", status=200, payload={"users": [{"id": "1"}]}
+        )
+        # Server errors are retried, so keep failing
+        m.get(
+            f"{base}/answers/2?limit=100", status=500, body="Server error", repeat=True
+        )
+        m.get(f"{base}/answers/3?limit=100", status=200, payload={"users": []})
 
         async with PollClient(token="fake_token") as client:
             with pytest.raises(PollcordError):
                 _ = await client.get_vote_users(poll)
 
     assert "Error while fetching poll" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_get_vote_counts_fetches_options_concurrently(poll):
+    base = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}"
+
+    async def slow_response(url, **kwargs):
+        await asyncio.sleep(0.2)
+        return CallbackResult(status=200, payload={"users": [{"id": "1"}]})
+
+    with aioresponses() as m:
+        for i in range(len(poll.options)):
+            m.get(
+                f"{base}/answers/{i + 1}?limit=100", callback=slow_response, repeat=True
+            )
+
+        async with PollClient(token="fake_token") as client:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            counts = await client.get_vote_counts(poll, from_results=False)
+            concurrent = loop.time() - start
+
+            start = loop.time()
+            await client.get_vote_counts(poll, concurrency=1, from_results=False)
+            serial = loop.time() - start
+
+    assert counts == [1, 1, 1]
+    assert concurrent < 0.4
+    assert serial >= 0.6
+
+
+@pytest.mark.asyncio
+async def test_iter_option_users_follows_pages(poll):
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers/1"
+
+    with aioresponses() as m:
+        m.get(
+            f"{url}?limit=2", status=200, payload={"users": [{"id": "1"}, {"id": "2"}]}
+        )
+        m.get(
+            f"{url}?limit=2&after=2",
+            status=200,
+            payload={"users": [{"id": "3"}, {"id": "4"}]},
+        )
+        m.get(f"{url}?limit=2&after=4", status=200, payload={"users": [{"id": "5"}]})
+
+        async with PollClient(token="fake_token") as client:
+            users = [u async for u in client.iter_option_users(poll, 0, page_size=2)]
+
+    assert [u["id"] for u in users] == ["1", "2", "3", "4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_users_is_not_truncated_to_one_page(poll):
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers/1"
+    first_page = [{"id": str(i)} for i in range(1, 101)]
+
+    with aioresponses() as m:
+        m.get(f"{url}?limit=100", status=200, payload={"users": first_page})
+        m.get(
+            f"{url}?limit=100&after=100", status=200, payload={"users": [{"id": "101"}]}
+        )
+
+        async with PollClient(token="fake_token") as client:
+            users = await client.fetch_option_users(poll, 0)
+
+    assert len(users) == 101
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_user_ids_follows_pages(poll):
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers"
+    first_page = [{"id": str(i), "username": f"user {i}"} for i in range(1, 101)]
+
+    with aioresponses() as m:
+        m.get(f"{url}/1?limit=100", status=200, payload={"users": first_page})
+        m.get(
+            f"{url}/1?limit=100&after=100",
+            status=200,
+            payload={"users": [{"id": "101"}]},
+        )
+        m.get(f"{url}/2?limit=100", status=200, payload={"users": []})
+        m.get(f"{url}/3?limit=100", status=404, body="Not Found")
+
+        async with PollClient(token="fake_token") as client:
+            ids = await client.fetch_option_user_ids(poll, 0)
+            assert ids == array("Q", range(1, 102))
+            assert await client.fetch_option_user_ids(poll, 1) == array("Q")
+            with pytest.raises(PollNotFoundError):
+                await client.fetch_option_user_ids(poll, 2)
+
+
+@pytest.mark.asyncio
+async def test_get_vote_user_ids_follows_pages(poll):
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}/answers"
+    first_page = [{"id": str(i), "username": f"user {i}"} for i in range(1, 101)]
+
+    with aioresponses() as m:
+        m.get(f"{url}/1?limit=100", status=200, payload={"users": first_page})
+        m.get(
+            f"{url}/1?limit=100&after=100",
+            status=200,
+            payload={"users": [{"id": "101"}]},
+        )
+        m.get(f"{url}/2?limit=100", status=200, payload={"users": []})
+        m.get(f"{url}/3?limit=100", status=200, payload={"users": [{"id": "7"}]})
+
+        async with PollClient(token="fake_token") as client:
+            ids = await client.get_vote_user_ids(poll)
+
+    assert ids == [array("Q", range(1, 102)), array("Q"), array("Q", [7])]
+
+
+@pytest.mark.asyncio
+async def test_get_vote_counts_reads_message_results(poll):
+    url = f"https://discord.com/api/v10/channels/{poll.channel_id}/messages/{poll.message_id}"
+    message = {
+        "id": str(poll.message_id),
+        "poll": {
+            "results": {
+                "is_finalized": False,
+                # Options without votes are left out
+                "answer_counts": [
+                    {"id": 1, "count": 4, "me_voted": False},
+                    {"id": 3, "count": 2, "me_voted": False},
+                ],
+            }
+        },
+    }
+
+    with aioresponses() as m:
+        m.get(url, status=200, payload=message)
+
+        async with PollClient(token="fake_token") as client:
+            counts = await client.get_vote_counts(poll)
+
+    assert counts == [4, 0, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_vote_counts_falls_back_without_results(poll):
+    base = f"https://discord.com/api/v10/channels/{poll.channel_id}"
+
+    with aioresponses() as m:
+        m.get(f"{base}/messages/{poll.message_id}", status=200, payload={"poll": {}})
+        for i in range(len(poll.options)):
+            m.get(
+                f"{base}/polls/{poll.message_id}/answers/{i + 1}?limit=100",
+                status=200,
+                payload={"users": [{"id": str(n)} for n in range(i)]},
+            )
+
+        async with PollClient(token="fake_token") as client:
+            counts = await client.get_vote_counts(poll)
+
+    assert counts == [0, 1, 2]
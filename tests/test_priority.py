@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+from aioresponses import aioresponses, CallbackResult
+from Pollcord import Poll, PollClient
+from Pollcord.metrics import InMemoryMetrics
+from Pollcord.priority import Priority, RequestScheduler
+
+
+async def queue(scheduler, order, priority, channel):
+    await scheduler.acquire(priority, channel)
+    order.append((priority.name, channel))
+    scheduler.release(priority)
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_by_priority_then_round_robin():
+    scheduler = RequestScheduler(max_in_flight=1)
+    await scheduler.acquire(Priority.CREATE, "0")
+
+    order = []
+    tasks = []
+    for priority, channel in [
+        (Priority.READ, "1"),
+        (Priority.READ, "1"),
+        (Priority.READ, "1"),
+        (Priority.READ, "2"),
+        (Priority.CREATE, "1"),
+        (Priority.CONTROL, "2"),
+    ]:
+        tasks.append(asyncio.ensure_future(queue(scheduler, order, priority, channel)))
+        await asyncio.sleep(0)
+    assert scheduler.waiting == 6
+
+    scheduler.release(Priority.CREATE)
+    await asyncio.gather(*tasks)
+
+    assert order == [
+        ("CONTROL", "2"),
+        ("CREATE", "1"),
+        ("READ", "1"),
+        ("READ", "2"),
+        ("READ", "1"),
+        ("READ", "1"),
+    ]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_reads_leave_reserved_slots_free():
+    scheduler = RequestScheduler(max_in_flight=3, reserved_slots=1)
+    await scheduler.acquire(Priority.READ)
+    await scheduler.acquire(Priority.READ)
+
+    third_read = asyncio.ensure_future(scheduler.acquire(Priority.READ))
+    await asyncio.sleep(0)
+    assert not third_read.done()
+
+    # Urgent requests still get the reserved slot
+    await asyncio.wait_for(scheduler.acquire(Priority.CONTROL), 1)
+    assert scheduler.in_flight == 3
+
+    third_read.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await third_read
+    assert scheduler.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    scheduler = RequestScheduler(max_in_flight=1, reserved_slots=0)
+    await scheduler.acquire(Priority.READ)
+    waiter = asyncio.ensure_future(scheduler.acquire(Priority.READ))
+    await asyncio.sleep(0)
+
+    # Cancelled after release() already picked it
+    scheduler.release(Priority.READ)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert scheduler.in_flight == 0
+    await asyncio.wait_for(scheduler.acquire(Priority.READ), 1)
+
+
+@pytest.mark.asyncio
+async def test_end_poll_overtakes_queued_reads():
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    answers = "https://discord.com/api/v10/channels/1/polls/2/answers/{}?limit=100"
+    expire = "https://discord.com/api/v10/channels/1/polls/2/expire"
+    order = []
+
+    def recorder(name):
+        async def callback(url, **kwargs):
+            order.append(name)
+            await asyncio.sleep(0.01)
+            return CallbackResult(status=200, payload={"users": []})
+
+        return callback
+
+    with aioresponses() as m:
+        m.get(answers.format(1), callback=recorder("read"), repeat=True)
+        m.get(answers.format(2), callback=recorder("read"), repeat=True)
+        m.post(expire, callback=recorder("expire"))
+
+        scheduler = RequestScheduler(max_in_flight=1, reserved_slots=0)
+        async with PollClient(
+            "token", request_scheduler=scheduler, max_concurrency=2
+        ) as client:
+            reads = [
+                asyncio.ensure_future(client.fetch_option_users(poll, i))
+                for i in (0, 1)
+            ]
+            await asyncio.sleep(0.005)  # one read in flight, the other queued
+            assert scheduler.waiting == 1
+            await client.end_poll(poll)
+            await asyncio.gather(*reads)
+
+    assert order == ["read", "expire", "read"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_channel_does_not_hold_slots():
+    hot = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    idle = Poll(channel_id=3, message_id=4, prompt="Q", options=["A"])
+    url = "https://discord.com/api/v10/channels/{}/polls/{}/answers/{}?limit=100"
+    exhausted = {
+        "X-RateLimit-Bucket": "answers",
+        "X-RateLimit-Limit": "1",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset-After": "1",
+    }
+
+    with aioresponses() as m:
+        for answer in (1, 2):
+            m.get(
+                url.format(1, 2, answer),
+                payload={"users": []},
+                headers=exhausted,
+                repeat=True,
+            )
+        m.get(url.format(3, 4, 1), payload={"users": []})
+
+        scheduler = RequestScheduler(max_in_flight=3, reserved_slots=1)
+        async with PollClient("token", request_scheduler=scheduler) as client:
+            await client.fetch_option_users(hot, 0)
+            # Both wait on channel 1's bucket, which would fill every read slot
+            waiting = [
+                asyncio.ensure_future(client.fetch_option_users(hot, answer))
+                for answer in (0, 1)
+            ]
+            await asyncio.sleep(0.01)
+
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.wait_for(client.fetch_option_users(idle, 0), 0.5)
+            assert loop.time() - started < 0.2
+            for task in waiting:
+                task.cancel()
+            await asyncio.gather(*waiting, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_admission_wait_is_reported_separately_from_rate_limit_sleep():
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    answers = "https://discord.com/api/v10/channels/1/polls/2/answers/{}?limit=100"
+
+    async def slow(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return CallbackResult(payload={"users": []})
+
+    metrics = InMemoryMetrics()
+    with aioresponses() as m:
+        m.get(answers.format(1), callback=slow)
+        m.get(answers.format(2), callback=slow)
+
+        scheduler = RequestScheduler(max_in_flight=1, reserved_slots=0)
+        async with PollClient(
+            "token", request_scheduler=scheduler, metrics=metrics
+        ) as client:
+            await client.get_vote_users(poll)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["queue_seconds"] >= 0.03
+    assert snapshot["sleep_seconds"] == 0
@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from aioresponses import aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.ratelimit import RateLimiter
+
+
+def bucket_headers(remaining, reset_after, bucket="abcd", limit=5):
+    return {
+        "X-RateLimit-Bucket": bucket,
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
+
+
+def test_route_key_uses_channel_as_major_parameter():
+    route, major = RateLimiter.route_key(
+        "get", "https://discord.com/api/v10/channels/123/polls/456/answers/2"
+    )
+    assert route == "GET /api/v10/channels/{channel_id}/polls/{id}/answers/{id}"
+    assert major == "123"
+
+    other_route, other_major = RateLimiter.route_key(
+        "GET", "https://discord.com/api/v10/channels/789/polls/111/answers/1?limit=100"
+    )
+    assert other_route == route
+    assert other_major == "789"
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_exhausted_bucket():
+    limiter = RateLimiter()
+    url = "https://discord.com/api/v10/channels/1/messages"
+    limiter.update("POST", url, bucket_headers(remaining=0, reset_after=0.2))
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await limiter.acquire("POST", url)
+    assert loop.time() - start >= 0.19
+
+    # A different channel is a different bucket and isn't held back
+    start = loop.time()
+    await limiter.acquire("POST", "https://discord.com/api/v10/channels/2/messages")
+    assert loop.time() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_client_waits_instead_of_hitting_429():
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"], on_end=None)
+    url = "https://discord.com/api/v10/channels/1/polls/2/answers/1?limit=100"
+
+    with aioresponses() as m:
+        m.get(
+            url,
+            status=200,
+            payload={"users": []},
+            headers=bucket_headers(remaining=0, reset_after=0.2),
+        )
+        m.get(url, status=200, payload={"users": [{"id": "1"}]})
+
+        async with PollClient(token="fake_token") as client:
+            loop = asyncio.get_running_loop()
+            await client.fetch_option_users(poll, 0)
+            start = loop.time()
+            users = await client.fetch_option_users(poll, 0)
+            assert loop.time() - start >= 0.19
+
+    assert users == [{"id": "1"}]
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import pytest
+from aioresponses import aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.refresher import AdaptiveRefresher, _Tracked
+
+MESSAGE_URL = "https://discord.com/api/v10/channels/1/messages/2"
+
+
+def make_poll(message_id=2):
+    return Poll(channel_id=1, message_id=message_id, prompt="Q", options=["A", "B"])
+
+
+def results(*counts):
+    return {
+        "poll": {
+            "results": {
+                "answer_counts": [
+                    {"id": index + 1, "count": count}
+                    for index, count in enumerate(counts)
+                ]
+            }
+        }
+    }
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+        self.counts = {}
+
+    async def get_vote_counts(self, poll):
+        self.calls += 1
+        return list(self.counts.get(poll, [0, 0]))
+
+
+def test_next_interval_follows_velocity_and_time_remaining():
+    refresher = AdaptiveRefresher(
+        FakeClient(), min_interval=1, max_interval=100, target_votes=10
+    )
+    tracked = _Tracked(make_poll())
+
+    assert refresher.next_interval(tracked) == 100  # no votes yet
+    tracked.velocity = 2.0
+    assert refresher.next_interval(tracked) == 5
+    tracked.velocity = 100.0
+    assert refresher.next_interval(tracked) == 1  # clamped to min_interval
+
+    tracked.velocity = 0.0
+    tracked.poll._end_ts = time.time() + 40
+    assert refresher.next_interval(tracked) == pytest.approx(10, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_changed_counts():
+    with aioresponses() as m:
+        m.get(MESSAGE_URL, payload=results(1, 0))
+        m.get(MESSAGE_URL, payload=results(1, 0))
+        m.get(MESSAGE_URL, payload=results(3, 1))
+        async with PollClient("token") as client:
+            refresher = AdaptiveRefresher(client, min_interval=0.01, max_interval=0.01)
+            poll = make_poll()
+            updates, own = [], []
+
+            @refresher.subscribe
+            async def on_update(poll, counts):
+                updates.append(counts)
+
+            refresher.add(poll, callback=lambda poll, counts: own.append(counts))
+            async with refresher:
+                for _ in range(100):
+                    if len(updates) == 2:
+                        break
+                    await asyncio.sleep(0.01)
+
+    # The unchanged second refresh isn't reported
+    assert updates == own == [[1, 0], [3, 1]]
+    assert refresher.counts(poll) == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_busy_polls_are_refreshed_more_often():
+    client = FakeClient()
+    refresher = AdaptiveRefresher(
+        client, rate=1000, burst=1000, min_interval=0.02, max_interval=1, target_votes=1
+    )
+    busy, quiet = make_poll(1), make_poll(2)
+    refreshed = {busy: 0, quiet: 0}
+
+    def on_refresh(poll, counts):
+        refreshed[poll] += 1
+        if poll is busy:
+            client.counts[busy] = [counts[0] + 10, 0]
+
+    client.counts[busy] = [10, 0]
+    refresher.subscribe(on_refresh)
+    refresher.add(busy)
+    refresher.add(quiet)
+    await asyncio.sleep(0.3)
+    await refresher.close()
+
+    assert refreshed[quiet] == 1  # only the first refresh
+    assert refreshed[busy] > 3
+
+
+@pytest.mark.asyncio
+async def test_refreshes_share_the_rate_budget():
+    client = FakeClient()
+    refresher = AdaptiveRefresher(client, rate=20, burst=2, min_interval=0.01)
+    for message_id in range(20):
+        refresher.add(make_poll(message_id))
+    await asyncio.sleep(0.25)
+    await refresher.close()
+
+    # 2 at once, then 20 per second
+    assert 3 <= client.calls <= 9
+
+
+@pytest.mark.asyncio
+async def test_ended_polls_get_a_final_refresh_and_are_removed():
+    client = FakeClient()
+    refresher = AdaptiveRefresher(client)
+    poll = make_poll()
+    refresher.add(poll)
+    await asyncio.sleep(0.01)
+    assert client.calls == 1 and poll in refresher
+
+    client.counts[poll] = [4, 2]
+    await poll.end()
+    await asyncio.sleep(0.01)
+    assert client.calls == 2
+    assert poll not in refresher
+    await refresher.close()
@@ -0,0 +1,61 @@
+import gc
+import pytest
+from aioresponses import aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.registry import PollRegistry
+
+
+def make_poll(message_id, channel_id=1):
+    return Poll(
+        channel_id=channel_id, message_id=message_id, prompt="Q", options=["A", "B"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_ended_polls_are_evicted_into_the_recent_lru():
+    registry = PollRegistry(recent_size=1)
+    first, second, other = make_poll(1), make_poll(2), make_poll(3, channel_id=9)
+    for poll in (first, second, other):
+        registry.add(poll)
+
+    assert registry.get("1") is first
+    assert set(registry.in_channel(1)) == {first, second}
+    assert len(registry) == 3
+
+    await first.end()
+    assert registry.in_channel("1") == [second]
+    assert 1 not in registry
+    assert registry.get(1) is first  # recently ended
+
+    await second.end()
+    assert registry.get(1) is None  # pushed out of the LRU
+    assert registry.get(2) is second
+    assert registry.in_channel(1) == []
+    assert list(registry) == [other]
+
+
+def test_polls_are_weakly_referenced():
+    registry = PollRegistry()
+    registry.add(make_poll(1))
+    gc.collect()
+
+    assert registry.get(1) is None
+    assert len(registry) == 0
+    assert registry.in_channel(1) == []
+
+
+@pytest.mark.asyncio
+async def test_client_indexes_created_polls():
+    url = "https://discord.com/api/v10/channels/1/messages"
+    with aioresponses() as m:
+        m.post(url, status=201, payload={"id": "42"})
+        m.post("https://discord.com/api/v10/channels/1/polls/42/expire", status=200)
+
+        async with PollClient("token", recent_polls=10) as client:
+            poll = await client.create_poll(1, "Q", ["A", "B"])
+            assert client.get_poll(42) is poll
+            assert client.polls_in_channel("1") == [poll]
+
+            await client.end_poll(poll)
+            assert client.polls_in_channel(1) == []
+            assert client.get_poll("42") is poll
@@ -0,0 +1,86 @@
+import pytest
+from aioresponses import aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.results import PollResults, np
+
+backends = [
+    False,
+    pytest.param(
+        True, marks=pytest.mark.skipif(np is None, reason="numpy not installed")
+    ),
+]
+
+
+def make_polls():
+    return [
+        Poll(channel_id=1, message_id=1, prompt="Q", options=["A", "B", "C"]),
+        Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"]),
+        Poll(channel_id=1, message_id=3, prompt="Q", options=["A", "B"]),
+    ]
+
+
+def as_list(value):
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+@pytest.mark.parametrize("use_numpy", backends)
+def test_counts_shares_and_top_k(use_numpy):
+    results = PollResults(
+        make_polls(), [[1, 5, 5], [3, 1], [0, 0]], use_numpy=use_numpy
+    )
+
+    assert [list(row) for row in results.counts] == [[1, 5, 5], [3, 1, 0], [0, 0, 0]]
+    assert as_list(results.totals()) == [11, 4, 0]
+    assert as_list(results.option_totals()) == [4, 6, 5]
+    shares = as_list(results.shares())
+    assert shares[1] == [0.75, 0.25, 0.0]
+    assert shares[2] == [0.0, 0.0, 0.0]
+    assert as_list(results.top_k(2)) == [[1, 2], [0, 1], [0, 1]]
+    assert as_list(results.winners()) == [1, 0, 0]
+
+
+@pytest.mark.parametrize("use_numpy", backends)
+def test_unique_voters_of_multiselect_polls(use_numpy):
+    users = [
+        [[{"id": "10"}, {"id": "11"}], [{"id": "10"}], []],
+        [["12"], ["12", "13"]],
+        [[], []],
+    ]
+    results = PollResults.from_users(make_polls(), users, use_numpy=use_numpy)
+
+    assert as_list(results.totals()) == [3, 3, 0]
+    assert as_list(results.unique_voters()) == [2, 2, 0]
+    assert results.total_unique_voters() == 4
+
+
+def test_unique_voters_need_voters():
+    results = PollResults(make_polls(), [[1], [1], [1]], use_numpy=False)
+    with pytest.raises(ValueError):
+        results.unique_voters()
+
+
+@pytest.mark.asyncio
+async def test_fetch_counts_for_many_polls():
+    polls = make_polls()[1:]
+    base = "https://discord.com/api/v10/channels/1/messages/{}"
+
+    with aioresponses() as m:
+        for poll, counts in zip(polls, ([2, 1], [0, 4])):
+            m.get(
+                base.format(poll.message_id),
+                payload={
+                    "poll": {
+                        "results": {
+                            "answer_counts": [
+                                {"id": i + 1, "count": c} for i, c in enumerate(counts)
+                            ]
+                        }
+                    }
+                },
+            )
+
+        async with PollClient("token") as client:
+            results = await PollResults.fetch(client, polls, use_numpy=False)
+
+    assert [list(row) for row in results.counts] == [[2, 1], [0, 4]]
+    assert results.winners() == [0, 1]
@@ -0,0 +1,96 @@
+import time
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from Pollcord import (
+    CircuitOpenError,
+    Poll,
+    PollClient,
+    PollCreationError,
+    PollcordError,
+)
+from Pollcord.retry import CircuitBreaker, RetryBudget, RetryPolicy
+
+
+@pytest.fixture
+def poll():
+    return Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+
+
+ANSWERS = "https://discord.com/api/v10/channels/1/polls/2/answers/1?limit=100"
+
+
+@pytest.mark.asyncio
+async def test_server_and_network_errors_are_retried(poll):
+    policy = RetryPolicy(base_delay=0)
+
+    with aioresponses() as m:
+        m.get(ANSWERS, status=502, body="Bad gateway")
+        m.get(ANSWERS, exception=aiohttp.ServerDisconnectedError())
+        m.get(ANSWERS, status=200, payload={"users": [{"id": "1"}]})
+
+        async with PollClient("token", retry_policy=policy) as client:
+            users = await client.fetch_option_users(poll, 0)
+
+    assert users == [{"id": "1"}]
+
+
+@pytest.mark.asyncio
+async def test_poll_creation_is_not_retried_on_server_error():
+    url = "https://discord.com/api/v10/channels/1/messages"
+
+    with aioresponses() as m:
+        m.post(url, status=500, body="Internal error")
+        m.post(url, status=201, payload={"id": 3})
+
+        async with PollClient(
+            "token", retry_policy=RetryPolicy(base_delay=0)
+        ) as client:
+            with pytest.raises(PollCreationError):
+                await client.create_poll(1, "Q", ["A", "B"])
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_stops_retries(poll):
+    policy = RetryPolicy(base_delay=0, budget=RetryBudget(capacity=0))
+
+    with aioresponses() as m:
+        m.get(ANSWERS, exception=aiohttp.ServerDisconnectedError())
+        m.get(ANSWERS, status=200, payload={"users": []})
+
+        async with PollClient("token", retry_policy=policy) as client:
+            with pytest.raises(PollcordError):
+                await client.fetch_option_users(poll, 0)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast(poll):
+    policy = RetryPolicy(max_retries=0, failure_threshold=2, recovery_timeout=60)
+
+    with aioresponses() as m:
+        m.get(ANSWERS, status=503, body="Unavailable", repeat=True)
+
+        async with PollClient("token", retry_policy=policy) as client:
+            for _ in range(2):
+                with pytest.raises(PollcordError):
+                    await client.fetch_option_users(poll, 0)
+            with pytest.raises(CircuitOpenError):
+                await client.fetch_option_users(poll, 0)
+
+        assert sum(len(calls) for calls in m.requests.values()) == 2
+
+
+def test_half_open_circuit_allows_a_single_trial():
+    breaker = CircuitBreaker("GET /x", failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    time.sleep(0.06)
+    breaker.before_request()  # the trial
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from Pollcord import Poll
+from Pollcord.scheduler import ExpiryScheduler
+
+
+def make_poll(on_end=None, duration=1):
+    return Poll(
+        channel_id=1,
+        message_id=1,
+        prompt="Test",
+        options=["A", "B"],
+        duration=duration,
+        on_end=on_end,
+    )
+
+
+@pytest.mark.asyncio
+async def test_polls_expiring_in_the_same_tick_end_together():
+    scheduler = ExpiryScheduler(resolution=0.1)
+    ended = []
+    polls = [make_poll(on_end=ended.append) for _ in range(50)]
+    tasks_before = len(asyncio.all_tasks())
+    for poll in polls:
+        scheduler.schedule(poll, 0.05)
+
+    # One driver task, not one per poll
+    assert len(asyncio.all_tasks()) == tasks_before + 1
+    assert len(scheduler) == 50
+
+    await asyncio.sleep(0.3)
+    assert len(ended) == 50
+    assert all(poll.ended for poll in polls)
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_earlier_deadline_wakes_driver():
+    scheduler = ExpiryScheduler(resolution=0.05)
+    late = make_poll()
+    early = make_poll()
+    scheduler.schedule(late, 60)
+    await asyncio.sleep(0)
+    scheduler.schedule(early, 0.05)
+
+    await asyncio.sleep(0.3)
+    assert early.ended
+    assert not late.ended
+    assert late in scheduler
+
+
+@pytest.mark.asyncio
+async def test_ending_poll_cancels_its_expiry():
+    scheduler = ExpiryScheduler(resolution=0.05)
+    calls = []
+    poll = make_poll(on_end=calls.append, duration=0.00003)
+    poll.start(scheduler)
+    assert poll in scheduler
+
+    await poll.end()
+    assert poll not in scheduler
+
+    await asyncio.sleep(0.3)
+    assert calls == [poll]
@@ -0,0 +1,43 @@
+import pytest
+from aioresponses import aioresponses
+from Pollcord import PollClient
+
+
+@pytest.mark.asyncio
+async def test_shared_session_is_reused_and_left_open():
+    session = PollClient.create_session(pool_size=10, keepalive_timeout=5)
+    url = "https://example.test/api/channels/1/messages"
+
+    with aioresponses() as m:
+        m.post(url, status=201, payload={"id": 1})
+        m.post(url, status=201, payload={"id": 2})
+
+        async with PollClient(
+            "token_a", session=session, base_url="https://example.test/api/"
+        ) as a:
+            poll_a = await a.create_poll(1, "Q", ["A", "B"])
+        async with PollClient(
+            "token_b", session=session, base_url="https://example.test/api"
+        ) as b:
+            poll_b = await b.create_poll(1, "Q", ["A", "B"])
+
+        # Each client still authenticates with its own token
+        requests = [call for key, calls in m.requests.items() for call in calls]
+        tokens = [call.kwargs["headers"]["Authorization"] for call in requests]
+
+    assert (poll_a.message_id, poll_b.message_id) == (1, 2)
+    assert tokens == ["Bot token_a", "Bot token_b"]
+    assert not session.closed
+    await session.close()
+    await poll_a.end()
+    await poll_b.end()
+
+
+@pytest.mark.asyncio
+async def test_client_closes_the_session_it_created():
+    async with PollClient("token", pool_size=5, pool_size_per_host=2) as client:
+        session = client.session
+        assert session.connector.limit == 5
+        assert session.connector.limit_per_host == 2
+
+    assert session.closed
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import pytest
+from aiohttp import web
+from Pollcord.bulk import PollSpec
+from Pollcord.sharding import (
+    RateLimitCoordinator,
+    SharedRateLimiter,
+    ShardedRunner,
+    shard_of,
+)
+
+URL = "https://discord.com/api/v10/channels/1/polls/2/answers/1"
+HEADERS = {
+    "X-RateLimit-Bucket": "abc",
+    "X-RateLimit-Limit": "1",
+    "X-RateLimit-Remaining": "0",
+    "X-RateLimit-Reset-After": "0.2",
+}
+
+
+@pytest.mark.asyncio
+async def test_processes_share_buckets_through_the_coordinator():
+    async with RateLimitCoordinator() as coordinator:
+        first = SharedRateLimiter(coordinator.address)
+        second = SharedRateLimiter(coordinator.address)
+        try:
+            await first.acquire("GET", URL)
+            first.update("GET", URL, HEADERS)
+            await asyncio.sleep(0.05)  # let the update reach the coordinator
+
+            # The other "process" has never seen the bucket but still has to wait
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await second.acquire("GET", URL)
+            assert loop.time() - started >= 0.1
+        finally:
+            await first.close()
+            await second.close()
+
+
+@pytest.mark.asyncio
+async def test_global_rate_limit_is_shared():
+    async with RateLimitCoordinator() as coordinator:
+        first = SharedRateLimiter(coordinator.address)
+        second = SharedRateLimiter(coordinator.address)
+        try:
+            await first.acquire("GET", URL)
+            assert first.rate_limited("GET", URL, 0.2, is_global=True)
+            await asyncio.sleep(0.02)
+
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await second.acquire(
+                "POST", "https://discord.com/api/v10/channels/9/messages"
+            )
+            assert loop.time() - started >= 0.1
+        finally:
+            await first.close()
+            await second.close()
+
+
+@pytest.mark.asyncio
+async def test_global_rate_caps_every_process():
+    async with RateLimitCoordinator(global_rate=50) as coordinator:
+        limiters = [SharedRateLimiter(coordinator.address) for _ in range(2)]
+        try:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            # Unseen buckets, so only the global cap applies
+            await asyncio.gather(
+                *(
+                    limiter.acquire(
+                        "POST", f"https://discord.com/api/v10/channels/{i}/messages"
+                    )
+                    for i in range(10)
+                    for limiter in limiters
+                )
+            )
+            assert loop.time() - started >= 0.3  # 20 requests at 50/s
+        finally:
+            for limiter in limiters:
+                await limiter.close()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_limits_without_coordinator(tmp_path):
+    limiter = SharedRateLimiter(str(tmp_path / "missing.sock"))
+    await asyncio.wait_for(limiter.acquire("GET", URL), 1)
+
+
+def test_channels_map_to_stable_shards():
+    assert shard_of(10, 4) == shard_of("10", 4) == 2
+    assert shard_of("not-a-snowflake", 4) == shard_of("not-a-snowflake", 4)
+
+    runner = ShardedRunner("token", create_polls, shards=2)
+    specs = [PollSpec(channel, "Q", ["A", "B"]) for channel in (1, 2, 3, 4, 5)]
+    shards = runner.split(specs)
+    assert [[s.channel_id for s in shard] for shard in shards] == [[2, 4], [1, 3, 5]]
+
+
+async def create_polls(client, shard, specs):
+    polls = [await client.create_poll(**spec._asdict()) for spec in specs]
+    for poll in polls:
+        await poll.end()
+    return os.getpid(), shard, [(poll.channel_id, poll.message_id) for poll in polls]
+
+
+async def fail_first_shard(client, shard, specs):
+    if shard == 0:
+        raise ValueError("shard 0 failed")
+    # Still talks to the coordinator after the other shard failed
+    await asyncio.sleep(1)
+    return await create_polls(client, shard, specs)
+
+
+async def start_server():
+    ids = iter(range(100, 200))
+
+    async def create(request):
+        return web.json_response({"id": next(ids)}, status=201)
+
+    app = web.Application()
+    app.router.add_post("/channels/{channel_id}/messages", create)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_sharded_runner_uses_worker_processes():
+    runner, port = await start_server()
+    try:
+        sharded = ShardedRunner(
+            "token",
+            create_polls,
+            shards=3,
+            client_options={"base_url": f"http://127.0.0.1:{port}"},
+        )
+        specs = [PollSpec(channel, "Q", ["A", "B"]) for channel in (3, 4, 6, 7)]
+        results = await sharded.run(specs)
+    finally:
+        await runner.cleanup()
+
+    assert results[2] is None
+    (pid_0, shard_0, polls_0), (pid_1, shard_1, polls_1) = results[:2]
+    assert (shard_0, shard_1) == (0, 1)
+    assert [channel for channel, _ in polls_0] == [3, 6]
+    assert [channel for channel, _ in polls_1] == [4, 7]
+    assert os.getpid() not in (pid_0, pid_1)
+
+
+@pytest.mark.asyncio
+async def test_failing_shard_does_not_block_the_others():
+    runner, port = await start_server()
+    try:
+        sharded = ShardedRunner(
+            "token",
+            fail_first_shard,
+            shards=2,
+            client_options={"base_url": f"http://127.0.0.1:{port}"},
+        )
+        specs = [PollSpec(channel, "Q", ["A", "B"]) for channel in (2, 3)]
+        with pytest.raises(ValueError, match="shard 0 failed"):
+            await asyncio.wait_for(sharded.run(specs), 30)
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,73 @@
+import asyncio
+import time
+import pytest
+from aioresponses import aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.store import SQLitePollStore
+
+
+def store_poll(store, message_id, end_in, callback_key=None):
+    now = time.time()
+    poll = Poll.restore(
+        channel_id=1,
+        message_id=message_id,
+        prompt="Q",
+        options=["A", "B"],
+        start_ts=now - 60,
+        end_ts=now + end_in,
+        duration=1,
+        on_end=None,
+    )
+    store.add(poll, callback_key)
+    return poll
+
+
+def test_store_round_trip(tmp_path):
+    with SQLitePollStore(str(tmp_path / "polls.db")) as store:
+        poll = store_poll(store, 99, end_in=3600, callback_key="announce")
+        [record] = store.load()
+
+    assert record.message_id == 99
+    assert record.options == ["A", "B"]
+    assert record.end_ts == poll._end_ts
+    assert record.callback_key == "announce"
+
+
+@pytest.mark.asyncio
+async def test_created_polls_are_saved_until_they_end(tmp_path):
+    store = SQLitePollStore(str(tmp_path / "polls.db"))
+    url = "https://discord.com/api/v10/channels/1/messages"
+
+    with aioresponses() as m:
+        m.post(url, status=201, payload={"id": 42})
+
+        async with PollClient(token="fake_token", store=store) as client:
+            poll = await client.create_poll(1, "Q", ["A", "B"], callback_key="done")
+            assert [r.message_id for r in store.load()] == [42]
+
+            await poll.end()
+            assert store.load() == []
+
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_rehydrate_schedules_live_polls_and_ends_expired_ones(tmp_path):
+    store = SQLitePollStore(str(tmp_path / "polls.db"))
+    store_poll(store, 1, end_in=-10, callback_key="done")
+    store_poll(store, 2, end_in=3600, callback_key="done")
+    store_poll(store, 3, end_in=0.2, callback_key="done")
+
+    ended = []
+    client = PollClient(token="fake_token", store=store)
+    polls = await client.rehydrate(callbacks={"done": ended.append})
+
+    assert [p.message_id for p in polls] == [1, 3, 2]
+    assert [p.message_id for p in ended] == [1]
+    assert [r.message_id for r in store.load()] == [3, 2]
+    assert len(client.scheduler) == 2
+
+    await asyncio.sleep(1)
+    assert [p.message_id for p in ended] == [1, 3]
+    assert [r.message_id for r in store.load()] == [2]
+    store.close()
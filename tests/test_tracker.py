@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from Pollcord import Poll, PollClient
+from Pollcord.tracker import VoteTracker
+
+
+def mock_voters(m, poll, voters):
+    base = f"https://discord.com/api/v10/channels/{poll.channel_id}/polls/{poll.message_id}"
+    for index, ids in enumerate(voters):
+        m.get(
+            f"{base}/answers/{index + 1}?limit=100",
+            status=200,
+            payload={"users": [{"id": str(user_id)} for user_id in ids]},
+        )
+
+
+@pytest.mark.asyncio
+async def test_tracker_emits_only_changed_votes():
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    events = []
+
+    with aioresponses() as m:
+        mock_voters(m, poll, [[1, 2], [3]])
+        mock_voters(m, poll, [[1], [3, 4]])
+
+        async with PollClient("token") as client:
+            tracker = VoteTracker(client, poll, emit_initial=False)
+
+            @tracker.on(VoteTracker.VOTE_ADDED)
+            def added(poll, option, user_id):
+                events.append(("added", option, user_id))
+
+            @tracker.on(VoteTracker.VOTE_REMOVED)
+            async def removed(poll, option, user_id):
+                events.append(("removed", option, user_id))
+
+            first = await tracker.refresh()
+            second = await tracker.refresh()
+
+    assert first.added == [(0, 1), (0, 2), (1, 3)] and not first.removed
+    assert second.added == [(1, 4)]
+    assert second.removed == [(0, 2)]
+    assert events == [("added", 1, 4), ("removed", 0, 2)]
+    assert tracker.counts == [1, 2]
+
+
+def test_unknown_event():
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    tracker = VoteTracker(PollClient("token"), poll)
+    with pytest.raises(ValueError):
+        tracker.on("vote_changed", print)
+
+
+@pytest.mark.asyncio
+async def test_votes_during_a_refresh_are_kept():
+    poll = Poll(channel_id=1, message_id=2, prompt="Q", options=["A", "B"])
+    base = "https://discord.com/api/v10/channels/1/polls/2/answers"
+    events = []
+
+    async def slow_snapshot(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return CallbackResult(payload={"users": [{"id": "10"}]})
+
+    with aioresponses() as m:
+        m.get(f"{base}/1?limit=100", callback=slow_snapshot)
+        m.get(f"{base}/2?limit=100", payload={"users": []})
+
+        async with PollClient("token") as client:
+            tracker = VoteTracker(client, poll, emit_initial=False)
+            tracker.on(
+                VoteTracker.VOTE_ADDED, lambda p, i, u: events.append(("added", i, u))
+            )
+            tracker.on(
+                VoteTracker.VOTE_REMOVED,
+                lambda p, i, u: events.append(("removed", i, u)),
+            )
+
+            refresh = asyncio.ensure_future(tracker.refresh())
+            await asyncio.sleep(0.01)
+            await tracker.add_vote(0, 11)  # e.g. a gateway event
+            await refresh
+
+    assert tracker.voters == [{10, 11}, set()]
+    assert events == [("added", 0, 11)]